@@ -64,6 +64,8 @@ def list_strategies() -> List[Dict[str, Any]]:
     Returns a list of strategies found in the strategies/ folder,
     including basic info about each strategy.
     """
+    from utils.config import load_strategy_yaml
+    
     strategies_dir = _get_project_root() / "strategies"
     strategies = []
     
@@ -72,8 +74,7 @@ def list_strategies() -> List[Dict[str, Any]]:
     
     for file in strategies_dir.glob("*.yaml"):
         try:
-            with open(file, 'r') as f:
-                strategy_def = yaml.safe_load(f) or {}
+            strategy_def = load_strategy_yaml(file)
             
             strategies.append({
                 "name": strategy_def.get("name", file.stem),
@@ -135,10 +136,11 @@ def save_strategy(strategy_name: str, yaml_content: str) -> Dict[str, Any]:
         Result indicating success or validation errors
     """
     from strategy.factory import validate_strategy_config
+    from utils.config import parse_yaml
     
     # Parse YAML first
     try:
-        strategy_def = yaml.safe_load(yaml_content)
+        strategy_def = parse_yaml(yaml_content)
     except yaml.YAMLError as e:
         return {"success": False, "error": f"Invalid YAML: {e}"}
     
@@ -181,10 +183,11 @@ def validate_strategy(yaml_content: str) -> Dict[str, Any]:
         Validation result with any errors found
     """
     from strategy.factory import validate_strategy_config
+    from utils.config import parse_yaml
     
     # Parse YAML first
     try:
-        strategy_def = yaml.safe_load(yaml_content)
+        strategy_def = parse_yaml(yaml_content)
     except yaml.YAMLError as e:
         return {"is_valid": False, "errors": [f"Invalid YAML: {e}"]}
     
@@ -616,6 +619,8 @@ def list_runtime_configs(strategy_name: Optional[str] = None) -> List[Dict[str,
     Returns:
         List of runtime configurations, optionally filtered by strategy
     """
+    from utils.config import parse_yaml
+    
     conf_dir = _get_project_root() / "conf"
     configs = []
     
@@ -624,8 +629,8 @@ def list_runtime_configs(strategy_name: Optional[str] = None) -> List[Dict[str,
     
     for file in conf_dir.glob("*.yaml"):
         try:
-            with open(file, 'r') as f:
-                config = yaml.safe_load(f) or {}
+            with open(file, 'rb') as f:
+                config = parse_yaml(f) or {}
             
             config_strategy = config.get("strategy", "")
             
@@ -659,6 +664,8 @@ def get_runtime_config(config_name: str) -> Dict[str, Any]:
     Returns:
         The configuration content
     """
+    from utils.config import parse_yaml
+    
     conf_dir = _get_project_root() / "conf"
     
     for ext in ['.yaml', '.yml']:
@@ -667,7 +674,7 @@ def get_runtime_config(config_name: str) -> Dict[str, Any]:
             with open(config_file, 'r') as f:
                 yaml_content = f.read()
             
-            config = yaml.safe_load(yaml_content)
+            config = parse_yaml(yaml_content)
             return {
                 "name": config_name,
                 "yaml_content": yaml_content,
@@ -83,19 +83,27 @@ class BaseStrategy(bt.Strategy):
     def next(self) -> None:
         """Strategy execution logic called for each bar."""
         try:
-            for trigger_name, trigger in self.trigger_system.triggers.items():
-                if not trigger.enabled:
-                    continue
-                
-                # Skip if trigger is already active
-                if trigger.name in self.active_triggers:
+            # Evaluate the conditions of enabled, inactive triggers at once on a
+            # single context; failed conditions are reported from the batch
+            errors: Dict[str, Exception] = {}
+            try:
+                results = self.trigger_system.evaluate_all(
+                    self._build_context(), exclude=self.active_triggers, errors=errors
+                )
+            except Exception as e:
+                self.logger.error(f"Error evaluating conditions: {e}")
+                results = {}
+            
+            for trigger_name, met in results.items():
+                if not met:
                     continue
-                
                 try:
-                    if self.test_condition(trigger.condition):
-                        self.execute_trigger_actions(trigger)
+                    self.execute_trigger_actions(self.trigger_system.triggers[trigger_name])
                 except Exception as e:
                     self.logger.error(f"Error processing trigger '{trigger_name}': {e}")
+            
+            for trigger_name, error in errors.items():
+                self.logger.error(f"Error evaluating condition of trigger '{trigger_name}': {error}")
         except Exception as e:
             self.logger.error(f"Error in strategy next(): {e}")
     
@@ -262,7 +270,7 @@ class BaseStrategy(bt.Strategy):
         data = data or self.datas[0]
         
         try:
-            params = self._validate_action_parameters(action.parameters)
+            params = self._validate_action_parameters(action.get_parameters())
             ticker_data = self._get_ticker_data(params.get('ticker', 'default'))
             position = self.broker.getposition(ticker_data)
             
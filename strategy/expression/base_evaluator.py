@@ -1,17 +1,27 @@
 """Base evaluator class with caching and common logic."""
 
 import logging
-from typing import Any, Dict, Generic, Optional, TypeVar
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
 
+import numpy as np
+
+from .codegen import compile_function, compile_functions
 from .expression_tokenizer import ExpressionTokenizer, EvaluationError, ParseError
+from .vectorized import SeriesFunction, compile_series
 
 
 T = TypeVar('T')
 
 
-class BaseEvaluator(Generic[T]):
+class BaseEvaluator(ABC, Generic[T]):
     """Base evaluator class with common caching and parsing logic."""
     
+    # Name reported for generated code in tracebacks
+    _code_filename = '<expression>'
+    # Element type of arrays returned by evaluate_series
+    _series_dtype: type = float
+    
     def __init__(self, cache_size: int = 1000):
         """
         Initialize the base evaluator.
@@ -20,6 +30,8 @@ class BaseEvaluator(Generic[T]):
             cache_size: Maximum number of cached expressions
         """
         self._expression_cache: Dict[str, T] = {}
+        self._compiled_cache: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._series_cache: Dict[str, SeriesFunction] = {}
         self._cache_size = cache_size
         self._tokenizer = ExpressionTokenizer()
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
@@ -37,6 +49,98 @@ class BaseEvaluator(Generic[T]):
         """Get AST from cache if it exists."""
         return self._expression_cache.get(expression_str)
     
+    @abstractmethod
+    def parse_expression(self, expression_str: str) -> T:
+        """Parse an expression string into an AST."""
+    
+    def _compile(self, ast: T) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Compile an AST into a native Python function of the context.
+        
+        Falls back to the AST's own evaluate method when the lowered source
+        cannot be compiled, e.g. for nesting deeper than the Python parser accepts.
+        """
+        try:
+            return compile_function(ast, self._code_filename)
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            self._logger.debug("Falling back to AST evaluation: %s", e)
+            return ast.evaluate
+    
+    def _get_compiled(self, expression_str: str) -> Callable[[Dict[str, Any]], Any]:
+        """Get the compiled evaluator for an expression, compiling on miss."""
+        compiled = self._compiled_cache.get(expression_str)
+        if compiled is None:
+            compiled = self._compile(self.parse_expression(expression_str))
+            if len(self._compiled_cache) >= self._cache_size:
+                del self._compiled_cache[next(iter(self._compiled_cache))]
+            self._compiled_cache[expression_str] = compiled
+        return compiled
+    
+    def compile_many(
+        self, expression_strs: Sequence[str], isolate_errors: bool = False
+    ) -> Callable[[Dict[str, Any]], List[Any]]:
+        """
+        Compile several expressions into one function returning all their values.
+        
+        Intended for a fixed set of expressions evaluated together against the
+        same context, such as a strategy's trigger conditions on every bar.
+        The result is not cached; keep it for as long as the set is unchanged.
+        
+        Args:
+            expression_strs: The expression strings to compile
+            isolate_errors: If True, an expression that fails to evaluate yields
+                its exception in place of a value instead of aborting the call
+            
+        Returns:
+            Function taking a context dict and returning the values in order
+            
+        Raises:
+            ParseError: If parsing any expression fails
+        """
+        asts = [self.parse_expression(expression_str) for expression_str in expression_strs]
+        try:
+            return compile_functions(asts, self._code_filename, isolate_errors)
+        except (SyntaxError, RecursionError, MemoryError) as e:
+            self._logger.debug("Compiling expressions separately: %s", e)
+            compiled = [self._get_compiled(expression_str) for expression_str in expression_strs]
+            if isolate_errors:
+                return lambda context: [_call_isolated(fn, context) for fn in compiled]
+            return lambda context: [fn(context) for fn in compiled]
+    
+    def evaluate_series(self, expression_str: str, context: Dict[str, Any]) -> np.ndarray:
+        """
+        Evaluate an expression for many bars at once.
+        
+        Context values are arrays (or scalars broadcast against them) and the
+        whole expression runs as NumPy operations in a single call.
+        
+        Args:
+            expression_str: The expression string to evaluate
+            context: Variable context mapping names to arrays
+            
+        Returns:
+            Array of results, one per bar
+            
+        Raises:
+            ParseError: If parsing fails
+            EvaluationError: If evaluation fails
+        """
+        self._validate_context(context)
+        
+        series_fn = self._series_cache.get(expression_str)
+        if series_fn is None:
+            series_fn = compile_series(self.parse_expression(expression_str))
+            if len(self._series_cache) >= self._cache_size:
+                del self._series_cache[next(iter(self._series_cache))]
+            self._series_cache[expression_str] = series_fn
+        
+        try:
+            return np.asarray(series_fn(context), dtype=self._series_dtype)
+        except EvaluationError:
+            raise
+        except Exception as e:
+            raise EvaluationError(f"Series evaluation failed: {e}") from e
+    
     def _validate_expression_string(self, expression_str: str) -> None:
         """Validate the expression string."""
         if not isinstance(expression_str, str) or not expression_str.strip():
@@ -50,4 +154,14 @@ class BaseEvaluator(Generic[T]):
     def clear_cache(self) -> None:
         """Clear the expression cache."""
         self._expression_cache.clear()
+        self._compiled_cache.clear()
+        self._series_cache.clear()
         self._logger.debug("Expression cache cleared")
+
+
+def _call_isolated(fn: Callable[[Dict[str, Any]], Any], context: Dict[str, Any]) -> Any:
+    """Call a compiled expression, returning any exception it raises instead."""
+    try:
+        return fn(context)
+    except Exception as e:
+        return e
@@ -1,6 +1,6 @@
 """Base parser with common parsing logic for expressions."""
 
-from typing import List, Optional
+from typing import List, Tuple
 
 from .expression_tokenizer import (
     ExpressionNode,
@@ -12,71 +12,83 @@ from .expression_tokenizer import (
 )
 
 
+_ADDITIVE_OPERATORS = {'+': MathOperator.ADD, '-': MathOperator.SUBTRACT}
+_MULTIPLICATIVE_OPERATORS = {'*': MathOperator.MULTIPLY, '/': MathOperator.DIVIDE}
+_VARIABLE_TOKEN_TYPES = frozenset(('IDENTIFIER', 'BRACKET_VAR', 'DOT_VAR'))
+
+
 class BaseParser:
-    """Base parser class with common parsing logic."""
+    """
+    Base parser class with common parsing logic.
+    
+    The ``_parse_*`` methods take the current token position and return
+    ``(node, new_position)``, keeping the token walk in local variables
+    instead of per-token method calls.
+    """
     
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.position = 0
     
-    def _parse_additive_expression(self) -> ExpressionNode:
+    def _parse_additive_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse addition and subtraction (lower precedence)."""
-        left = self._parse_multiplicative_expression()
+        tokens = self.tokens
+        n = len(tokens)
+        left, pos = self._parse_multiplicative_expression(pos)
         
-        while self._current_token() and self._current_token().value in ['+', '-']:
-            op_token = self._consume_token()
-            right = self._parse_multiplicative_expression()
-            
-            operator = MathOperator.ADD if op_token.value == '+' else MathOperator.SUBTRACT
+        while pos < n:
+            operator = _ADDITIVE_OPERATORS.get(tokens[pos].value)
+            if operator is None:
+                break
+            right, pos = self._parse_multiplicative_expression(pos + 1)
             left = MathNode(left, operator, right)
         
-        return left
+        return left, pos
     
-    def _parse_multiplicative_expression(self) -> ExpressionNode:
+    def _parse_multiplicative_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse multiplication and division (higher precedence)."""
-        left = self._parse_primary_expression()
+        tokens = self.tokens
+        n = len(tokens)
+        left, pos = self._parse_primary_expression(pos)
         
-        while self._current_token() and self._current_token().value in ['*', '/']:
-            op_token = self._consume_token()
-            right = self._parse_primary_expression()
-            
-            operator = MathOperator.MULTIPLY if op_token.value == '*' else MathOperator.DIVIDE
+        while pos < n:
+            operator = _MULTIPLICATIVE_OPERATORS.get(tokens[pos].value)
+            if operator is None:
+                break
+            right, pos = self._parse_primary_expression(pos + 1)
             left = MathNode(left, operator, right)
         
-        return left
+        return left, pos
     
-    def _parse_primary_expression(self) -> ExpressionNode:
+    def _parse_primary_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse primary expressions (variables, numbers, parenthesized expressions)."""
-        current = self._current_token()
+        tokens = self.tokens
+        current = tokens[pos] if pos < len(tokens) else None
         
-        if current and current.type == 'LPAREN':
-            self._consume_token()  # consume '('
-            result = self._parse_additive_expression()
-            if not self._current_token() or self._current_token().type != 'RPAREN':
-                raise ValueError("Missing closing parenthesis")
-            self._consume_token()  # consume ')'
-            return result
-        
-        if current and current.type == 'NUMBER':
-            token = self._consume_token()
-            return NumberNode(float(token.value))
-        
-        if current and current.type in ['IDENTIFIER', 'BRACKET_VAR', 'DOT_VAR']:
-            token = self._consume_token()
-            return VariableNode(token.value)
+        if current is not None:
+            token_type = current.type
+            
+            if token_type == 'LPAREN':
+                result, pos = self._parse_additive_expression(pos + 1)
+                return result, self._expect_rparen(pos)
+            
+            if token_type == 'NUMBER':
+                return NumberNode.of(float(current.value)), pos + 1
+            
+            if token_type in _VARIABLE_TOKEN_TYPES:
+                return VariableNode(current.value), pos + 1
         
         raise ValueError(f"Unexpected token: {current.value if current else 'EOF'}")
     
-    def _current_token(self) -> Optional[Token]:
-        """Get the current token without consuming it."""
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
-        return None
+    def _expect_rparen(self, pos: int) -> int:
+        """Check for a closing parenthesis at pos and return the position after it."""
+        tokens = self.tokens
+        if pos >= len(tokens) or tokens[pos].type != 'RPAREN':
+            raise ValueError("Missing closing parenthesis")
+        return pos + 1
     
-    def _consume_token(self) -> Optional[Token]:
-        """Consume and return the current token."""
-        if self.position < len(self.tokens):
-            token = self.tokens[self.position]
-            self.position += 1
-            return token
-        return None
+    def _check_end(self, pos: int) -> None:
+        """Record the final position and reject trailing tokens."""
+        self.position = pos
+        if pos < len(self.tokens):
+            raise ValueError(f"Unexpected token: {self.tokens[pos].value}")
@@ -0,0 +1,132 @@
+"""Compilation of expression ASTs to native Python functions."""
+
+from collections import Counter
+from typing import Any, Callable, Dict, List, Sequence
+
+from .expression_tokenizer import HOISTED_VARIABLES, ExpressionNode, VariableNode
+
+
+def compile_function(
+    ast: ExpressionNode,
+    filename: str = '<expression>'
+) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile an expression AST into a Python function of the context.
+    
+    The AST is lowered to Python source via ``compile_py`` and compiled once,
+    so evaluation runs on CPython's own bytecode, including native
+    short-circuiting for ``and``/``or``. The generated code runs without
+    builtins; only the helpers bound during lowering are visible to it.
+    Variables referenced more than once are looked up and converted to
+    float once per call (see _hoist_variables).
+    
+    Args:
+        ast: Root node of a parsed expression
+        filename: Name reported for the generated code in tracebacks
+        
+    Returns:
+        Function taking a context dict and returning the expression value
+        
+    Raises:
+        SyntaxError: If the lowered source cannot be compiled (e.g. nesting
+            deeper than the Python parser allows)
+    """
+    namespace = _new_namespace()
+    prelude = _hoist_variables([ast], namespace)
+    source = ast.compile_py(namespace)
+    if not prelude:
+        return eval(compile(f"lambda ctx: {source}", filename, 'eval'), namespace)
+    
+    lines = ["def _evaluate(ctx):", *prelude, f"    return {source}"]
+    exec(compile("\n".join(lines), filename, 'exec'), namespace)
+    return namespace['_evaluate']
+
+
+def compile_functions(
+    asts: Sequence[ExpressionNode],
+    filename: str = '<expression>',
+    isolate_errors: bool = False
+) -> Callable[[Dict[str, Any]], List[Any]]:
+    """
+    Compile several expression ASTs into one function returning all values.
+    
+    The expressions become elements of a single list display, so a call
+    evaluates all of them against the same context with one function call,
+    and a variable shared by several expressions is converted once per call.
+    With isolate_errors, each expression runs in its own try block instead
+    and an expression that raises yields the exception in place of its value.
+    
+    Args:
+        asts: Root nodes of parsed expressions
+        filename: Name reported for the generated code in tracebacks
+        isolate_errors: Return exceptions as values rather than raising them
+        
+    Returns:
+        Function taking a context dict and returning the values in order
+        
+    Raises:
+        SyntaxError: If the lowered source cannot be compiled
+    """
+    namespace = _new_namespace()
+    prelude = _hoist_variables(asts, namespace)
+    sources = [ast.compile_py(namespace) for ast in asts]
+    if not isolate_errors and not prelude:
+        code = compile(f"lambda ctx: [{', '.join(sources)}]", filename, 'eval')
+        return eval(code, namespace)
+    
+    lines = ["def _evaluate_all(ctx):", *prelude]
+    if not isolate_errors:
+        lines.append(f"    return [{', '.join(sources)}]")
+    else:
+        for i, source in enumerate(sources):
+            lines += [
+                "    try:",
+                f"        _v{i} = {source}",
+                "    except Exception as e:",
+                f"        _v{i} = e",
+            ]
+        lines.append(f"    return [{', '.join(f'_v{i}' for i in range(len(sources)))}]")
+    exec(compile("\n".join(lines), filename, 'exec'), namespace)
+    return namespace['_evaluate_all']
+
+
+def _hoist_variables(asts: Sequence[ExpressionNode], namespace: Dict[str, Any]) -> List[str]:
+    """
+    Give each variable referenced more than once a local converted at the start of a call.
+    
+    The conversion never raises: a value that is missing or not numeric leaves
+    the local None, and each use then falls back to the variable's evaluate(),
+    so errors and short-circuiting behave as without hoisting.
+    
+    Args:
+        asts: Root nodes of the expressions compiled together
+        namespace: Globals of the generated code; the hoisted names are recorded in it
+        
+    Returns:
+        Source lines assigning the locals, indented for a function body
+    """
+    nodes: List[VariableNode] = []
+    for ast in asts:
+        ast.collect_vars(nodes)
+    counts = Counter(node.name for node in nodes)
+    
+    hoisted = {}
+    lines = []
+    for node in nodes:
+        if counts[node.name] < 2 or node.name in hoisted:
+            continue
+        local = f"_h{len(hoisted)}"
+        lines += [
+            "    try:",
+            f"        {local} = {node.compile_py(namespace)}",
+            "    except Exception:",
+            f"        {local} = None",
+        ]
+        hoisted[node.name] = local
+    namespace[HOISTED_VARIABLES] = hoisted
+    return lines
+
+
+def _new_namespace() -> Dict[str, Any]:
+    """Return fresh globals for generated code, without builtins."""
+    return {'__builtins__': {}, 'float': float, 'bool': bool, 'Exception': Exception}
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 class ConditionEvaluator(BaseEvaluator[ExpressionNode]):
     """Main class for parsing and evaluating conditions with caching."""
     
+    _code_filename = '<condition>'
+    _series_dtype = bool
+    
     def parse_expression(self, condition_str: str) -> ExpressionNode:
         """
         Parse a condition string into an AST, with caching.
@@ -43,6 +46,21 @@ class ConditionEvaluator(BaseEvaluator[ExpressionNode]):
         except Exception as e:
             raise ParseError(f"Failed to parse condition '{condition_str}': {e}") from e
     
+    def compile(self, condition_str: str) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Parse and compile a condition once for repeated evaluation.
+        
+        Args:
+            condition_str: The condition string to compile
+            
+        Returns:
+            Function taking a context dict and returning the condition value
+            
+        Raises:
+            ParseError: If parsing fails
+        """
+        return self._get_compiled(condition_str)
+    
     def evaluate(
         self,
         condition: Union[Callable[[Dict[str, Any]], bool], str],
@@ -70,8 +88,7 @@ class ConditionEvaluator(BaseEvaluator[ExpressionNode]):
                 raise EvaluationError(f"Error executing condition function: {e}") from e
         
         try:
-            ast = self.parse_expression(condition)
-            result = ast.evaluate(context)
+            result = self._get_compiled(condition)(context)
             return bool(result)
         except Exception as e:
             self._logger.error(f"Failed to evaluate condition '{condition}': {e}")
@@ -1,6 +1,7 @@
 """Parser for boolean condition expressions."""
 
 import logging
+from typing import Tuple
 
 from .base_parser import BaseParser
 from .expression_tokenizer import (
@@ -15,92 +16,82 @@ from .expression_tokenizer import (
 logger = logging.getLogger(__name__)
 
 
+_COMPARISON_OPERATORS = {
+    '>': Operator.GREATER_THAN,
+    '<': Operator.LESS_THAN,
+    '>=': Operator.GREATER_EQUAL,
+    '<=': Operator.LESS_EQUAL,
+    '==': Operator.EQUAL,
+    '!=': Operator.NOT_EQUAL,
+}
+
+
 class ConditionParser(BaseParser):
     """Parses tokenized conditions into an AST."""
     
     def parse(self) -> ExpressionNode:
         """Parse the tokens into an AST."""
-        result = self._parse_or_expression()
-        if self.position < len(self.tokens):
-            raise ValueError(f"Unexpected token: {self.tokens[self.position].value}")
+        result, pos = self._parse_or_expression(self.position)
+        self._check_end(pos)
         return result
     
-    def _parse_or_expression(self) -> ExpressionNode:
+    def _parse_or_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse OR expressions (lowest precedence)."""
-        left = self._parse_and_expression()
+        tokens = self.tokens
+        n = len(tokens)
+        left, pos = self._parse_and_expression(pos)
         
-        while self._current_token() and self._current_token().value == 'or':
-            self._consume_token()  # consume 'or'
-            right = self._parse_and_expression()
+        while pos < n and tokens[pos].value == 'or':
+            right, pos = self._parse_and_expression(pos + 1)
             left = LogicalNode(left, LogicalOperator.OR, right)
         
-        return left
+        return left, pos
     
-    def _parse_and_expression(self) -> ExpressionNode:
+    def _parse_and_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse AND expressions (higher precedence than OR)."""
-        left = self._parse_comparison_expression()
+        tokens = self.tokens
+        n = len(tokens)
+        left, pos = self._parse_comparison_expression(pos)
         
-        while self._current_token() and self._current_token().value == 'and':
-            self._consume_token()  # consume 'and'
-            right = self._parse_comparison_expression()
+        while pos < n and tokens[pos].value == 'and':
+            right, pos = self._parse_comparison_expression(pos + 1)
             left = LogicalNode(left, LogicalOperator.AND, right)
         
-        return left
+        return left, pos
     
-    def _parse_comparison_expression(self) -> ExpressionNode:
+    def _parse_comparison_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse comparison expressions."""
-        left = self._parse_additive_expression()
+        tokens = self.tokens
+        left, pos = self._parse_additive_expression(pos)
         
-        current = self._current_token()
-        if current and current.type == 'COMPARISON_OP':
-            op_token = self._consume_token()
-            right = self._parse_additive_expression()
-            
-            # Map operator string to enum
-            operator_map = {
-                '>': Operator.GREATER_THAN,
-                '<': Operator.LESS_THAN,
-                '>=': Operator.GREATER_EQUAL,
-                '<=': Operator.LESS_EQUAL,
-                '==': Operator.EQUAL,
-                '!=': Operator.NOT_EQUAL,
-            }
-            
-            operator = operator_map[op_token.value]
-            return ComparisonNode(left, operator, right)
+        if pos < len(tokens) and tokens[pos].type == 'COMPARISON_OP':
+            operator = _COMPARISON_OPERATORS[tokens[pos].value]
+            right, pos = self._parse_additive_expression(pos + 1)
+            return ComparisonNode(left, operator, right), pos
         
         # If no comparison operator found, check if it's a boolean expression
         if isinstance(left, (LogicalNode, ComparisonNode)):
-            return left
+            return left, pos
         
         # Mathematical expression without comparison is an error
         raise ValueError("Mathematical expression must be part of a comparison")
     
-    def _parse_primary_expression(self) -> ExpressionNode:
+    def _parse_primary_expression(self, pos: int) -> Tuple[ExpressionNode, int]:
         """Parse primary expressions with parentheses support."""
-        current = self._current_token()
+        tokens = self.tokens
         
-        if current and current.type == 'LPAREN':
-            self._consume_token()  # consume '('
-            
-            # Save position for potential backtracking
-            saved_position = self.position
+        if pos < len(tokens) and tokens[pos].type == 'LPAREN':
+            # Position after '(' is kept for potential backtracking
+            inner_pos = pos + 1
             
             try:
                 # Try parsing as mathematical expression first
-                result = self._parse_additive_expression()
-                if not self._current_token() or self._current_token().type != 'RPAREN':
-                    raise ValueError("Missing closing parenthesis")
-                self._consume_token()  # consume ')'
-                return result
+                result, pos = self._parse_additive_expression(inner_pos)
+                return result, self._expect_rparen(pos)
             except Exception:
                 # Backtrack and try boolean expression
-                self.position = saved_position
-                result = self._parse_or_expression()
-                if not self._current_token() or self._current_token().type != 'RPAREN':
-                    raise ValueError("Missing closing parenthesis")
-                self._consume_token()  # consume ')'
-                return result
+                result, pos = self._parse_or_expression(inner_pos)
+                return result, self._expect_rparen(pos)
         
         # Use parent's implementation for numbers and variables
-        return super()._parse_primary_expression()
+        return super()._parse_primary_expression(pos)
@@ -70,8 +70,7 @@ class ExpressionEvaluator(BaseEvaluator[ExpressionNode]):
                 raise EvaluationError(f"Error executing expression function: {e}") from e
         
         try:
-            ast = self.parse_expression(expression)
-            result = ast.evaluate(context)
+            result = self._get_compiled(expression)(context)
             return float(result)
         except Exception as e:
             self._logger.error(f"Failed to evaluate expression '{expression}': {e}")
@@ -9,7 +9,6 @@ class ExpressionParser(BaseParser):
     
     def parse(self) -> ExpressionNode:
         """Parse the tokens into a mathematical expression AST."""
-        result = self._parse_additive_expression()
-        if self.position < len(self.tokens):
-            raise ValueError(f"Unexpected token: {self.tokens[self.position].value}")
+        result, pos = self._parse_additive_expression(self.position)
+        self._check_end(pos)
         return result
@@ -1,6 +1,8 @@
 """Expression parsing, tokenization and AST nodes."""
 
 import logging
+import math
+import operator
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -59,9 +61,34 @@ class MathOperator(Enum):
     DIVIDE = "/"
 
 
+def _divide(left_value: float, right_value: float) -> float:
+    """Divide, raising EvaluationError instead of ZeroDivisionError."""
+    if right_value == 0:
+        raise EvaluationError("Division by zero")
+    return left_value / right_value
+
+
+# Operator enum -> binary function, resolved once per node instead of per evaluation
+COMPARISON_FUNCTIONS = {
+    Operator.GREATER_THAN: operator.gt,
+    Operator.LESS_THAN: operator.lt,
+    Operator.GREATER_EQUAL: operator.ge,
+    Operator.LESS_EQUAL: operator.le,
+    Operator.EQUAL: operator.eq,
+    Operator.NOT_EQUAL: operator.ne,
+}
+
+MATH_FUNCTIONS = {
+    MathOperator.ADD: operator.add,
+    MathOperator.SUBTRACT: operator.sub,
+    MathOperator.MULTIPLY: operator.mul,
+    MathOperator.DIVIDE: _divide,
+}
+
+
 # ===== Token =====
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Represents a token in an expression string."""
     type: str           # Token type (e.g., 'NUMBER', 'IDENTIFIER')
@@ -89,6 +116,44 @@ class ExpressionNode(ABC):
             EvaluationError: If evaluation fails
         """
         pass
+    
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """
+        Lower this node to a Python expression over the context ``ctx``.
+        
+        The default binds the node's own evaluate method into the namespace,
+        so node types without a specialised lowering keep their semantics.
+        
+        Args:
+            namespace: Globals of the generated code; helpers are added to it
+            
+        Returns:
+            Python source for an expression
+        """
+        return f"{_bind(namespace, self.evaluate)}(ctx)"
+    
+    def collect_vars(self, out: List['VariableNode']) -> None:
+        """
+        Append the variable nodes referenced by this node to a list, in evaluation order.
+        
+        Args:
+            out: List collecting variable nodes
+        """
+        for child in (getattr(self, 'left', None), getattr(self, 'right', None)):
+            if child is not None:
+                child.collect_vars(out)
+
+
+# Key in a codegen namespace mapping variable names to the generated locals that
+# hold their values, converted once per call (None if the conversion failed)
+HOISTED_VARIABLES = '__hoisted__'
+
+
+def _bind(namespace: Dict[str, Any], value: Any) -> str:
+    """Store a value in a codegen namespace and return its generated name."""
+    name = f"_n{len(namespace)}"
+    namespace[name] = value
+    return name
 
 
 class ComparisonNode(ExpressionNode):
@@ -98,31 +163,30 @@ class ComparisonNode(ExpressionNode):
         self.left = left
         self.operator = operator
         self.right = right
+        self._fn = COMPARISON_FUNCTIONS.get(operator)
+        # Bound child evaluators, saving two attribute lookups per evaluation
+        self._eval_left = left.evaluate
+        self._eval_right = right.evaluate
     
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate the comparison."""
-        try:
-            left_value = self.left.evaluate(context)
-            right_value = self.right.evaluate(context)
-            
-            if self.operator == Operator.GREATER_THAN:
-                return left_value > right_value
-            elif self.operator == Operator.LESS_THAN:
-                return left_value < right_value
-            elif self.operator == Operator.GREATER_EQUAL:
-                return left_value >= right_value
-            elif self.operator == Operator.LESS_EQUAL:
-                return left_value <= right_value
-            elif self.operator == Operator.EQUAL:
-                return left_value == right_value
-            elif self.operator == Operator.NOT_EQUAL:
-                return left_value != right_value
-            
+        fn = self._fn
+        if fn is None:
             raise EvaluationError(f"Unknown operator: {self.operator}")
+        try:
+            return fn(self._eval_left(context), self._eval_right(context))
         except EvaluationError:
             raise
         except Exception as e:
             raise EvaluationError(f"Comparison evaluation failed: {e}") from e
+    
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """Lower to a native Python comparison."""
+        if self._fn is None:
+            return super().compile_py(namespace)
+        left = self.left.compile_py(namespace)
+        right = self.right.compile_py(namespace)
+        return f"({left} {self.operator.value} {right})"
 
 
 class LogicalNode(ExpressionNode):
@@ -132,20 +196,39 @@ class LogicalNode(ExpressionNode):
         self.left = left
         self.operator = operator
         self.right = right
+        self._eval_left = left.evaluate
+        self._eval_right = right.evaluate
     
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """Evaluate the logical operation."""
         try:
-            if self.operator == LogicalOperator.AND:
-                return bool(self.left.evaluate(context)) and bool(self.right.evaluate(context))
-            elif self.operator == LogicalOperator.OR:
-                return bool(self.left.evaluate(context)) or bool(self.right.evaluate(context))
+            operator = self.operator
+            if operator is LogicalOperator.AND:
+                return bool(self._eval_left(context)) and bool(self._eval_right(context))
+            elif operator is LogicalOperator.OR:
+                return bool(self._eval_left(context)) or bool(self._eval_right(context))
             
             raise EvaluationError(f"Unknown logical operator: {self.operator}")
         except EvaluationError:
             raise
         except Exception as e:
             raise EvaluationError(f"Logical evaluation failed: {e}") from e
+    
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """Lower to Python's short-circuiting ``and``/``or``."""
+        if self.operator not in (LogicalOperator.AND, LogicalOperator.OR):
+            return super().compile_py(namespace)
+        left = self._compile_operand(self.left, namespace)
+        right = self._compile_operand(self.right, namespace)
+        return f"({left} {self.operator.value} {right})"
+    
+    @staticmethod
+    def _compile_operand(node: ExpressionNode, namespace: Dict[str, Any]) -> str:
+        """Compile an operand, wrapping it in bool() unless it is already boolean."""
+        source = node.compile_py(namespace)
+        if isinstance(node, (ComparisonNode, LogicalNode)):
+            return source
+        return f"bool({source})"
 
 
 class VariableNode(ExpressionNode):
@@ -176,6 +259,23 @@ class VariableNode(ExpressionNode):
         
         raise EvaluationError(f"Variable '{self.name}' not found in context")
     
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """
+        Lower to an inline context lookup, falling back to evaluate() for paths.
+        
+        A hoisted variable reads its generated local instead, and only falls back
+        to evaluate() (which reports the error) when the conversion failed.
+        """
+        local = namespace.get(HOISTED_VARIABLES, {}).get(self.name)
+        if local is not None:
+            return f"({local} if {local} is not None else {_bind(namespace, self.evaluate)}(ctx))"
+        name = repr(self.name)
+        return f"(float(ctx[{name}]) if {name} in ctx else {_bind(namespace, self.evaluate)}(ctx))"
+    
+    def collect_vars(self, out: List['VariableNode']) -> None:
+        """Append this node to the list."""
+        out.append(self)
+    
     def _build_parts(self, name: str) -> List[Union[str, List]]:
         """
         Split variable name into parts for evaluation.
@@ -273,12 +373,42 @@ class VariableNode(ExpressionNode):
 class NumberNode(ExpressionNode):
     """Node for numeric literals."""
     
+    # Shared instances for literals, seeded with common small values
+    _POOL: Dict[float, 'NumberNode'] = {}
+    _POOL_LIMIT = 1024
+    
     def __init__(self, value: float):
         self.value = value
     
+    @classmethod
+    def of(cls, value: float) -> 'NumberNode':
+        """
+        Return a shared node for a literal value, creating it on first use.
+        
+        Nodes are treated as immutable once parsed, so identical literals
+        across expressions can share one instance.
+        """
+        node = cls._POOL.get(value)
+        if node is None:
+            node = cls(value)
+            if len(cls._POOL) < cls._POOL_LIMIT:
+                cls._POOL[value] = node
+        return node
+    
     def evaluate(self, context: Dict[str, Any]) -> float:
         """Return the numeric value."""
         return self.value
+    
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """Lower to a literal (or a bound constant if it has no literal form)."""
+        if isinstance(self.value, float) and math.isfinite(self.value):
+            return repr(self.value)
+        return _bind(namespace, self.value)
+
+
+for _value in range(-1, 101):
+    NumberNode.of(float(_value))
+del _value
 
 
 class MathNode(ExpressionNode):
@@ -288,29 +418,32 @@ class MathNode(ExpressionNode):
         self.left = left
         self.operator = operator
         self.right = right
+        self._fn = MATH_FUNCTIONS.get(operator)
+        # Bound child evaluators, saving two attribute lookups per evaluation
+        self._eval_left = left.evaluate
+        self._eval_right = right.evaluate
     
     def evaluate(self, context: Dict[str, Any]) -> float:
         """Evaluate the mathematical operation."""
-        try:
-            left_value = self.left.evaluate(context)
-            right_value = self.right.evaluate(context)
-            
-            if self.operator == MathOperator.ADD:
-                return left_value + right_value
-            elif self.operator == MathOperator.SUBTRACT:
-                return left_value - right_value
-            elif self.operator == MathOperator.MULTIPLY:
-                return left_value * right_value
-            elif self.operator == MathOperator.DIVIDE:
-                if right_value == 0:
-                    raise EvaluationError("Division by zero")
-                return left_value / right_value
-            
+        fn = self._fn
+        if fn is None:
             raise EvaluationError(f"Unknown math operator: {self.operator}")
+        try:
+            return fn(self._eval_left(context), self._eval_right(context))
         except EvaluationError:
             raise
         except Exception as e:
             raise EvaluationError(f"Mathematical evaluation failed: {e}") from e
+    
+    def compile_py(self, namespace: Dict[str, Any]) -> str:
+        """Lower to native arithmetic; division keeps its zero check."""
+        if self._fn is None:
+            return super().compile_py(namespace)
+        left = self.left.compile_py(namespace)
+        right = self.right.compile_py(namespace)
+        if self.operator is MathOperator.DIVIDE:
+            return f"{_bind(namespace, _divide)}({left}, {right})"
+        return f"({left} {self.operator.value} {right})"
 
 
 # ===== Tokenizer =====
@@ -322,15 +455,21 @@ class ExpressionTokenizer:
         ('LPAREN', r'\('),
         ('RPAREN', r'\)'),
         ('COMPARISON_OP', r'>=|<=|==|!=|>|<'),
-        ('LOGICAL_OP', r'\b(and|or)\b'),
+        ('LOGICAL_OP', r'\b(?:and|or)\b'),
         ('MATH_OP', r'[+\-*/]'),
         ('NUMBER', r'\d+\.?\d*'),
         ('BRACKET_VAR', r'[a-zA-Z_][a-zA-Z0-9_]*\[[a-zA-Z_][a-zA-Z0-9_]*\]'),
-        ('DOT_VAR', r'[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*|\[\d+\])+'),
+        ('DOT_VAR', r'[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*|\[\d+\])+'),
         ('IDENTIFIER', r'[a-zA-Z_][a-zA-Z0-9_]*'),
         ('WHITESPACE', r'\s+'),
     ]
     
+    # All patterns as one alternation; the first alternative that matches wins,
+    # which preserves the priority order of TOKEN_PATTERNS.
+    _MASTER_PATTERN = re.compile(
+        '|'.join(f'(?P<{token_type}>{pattern})' for token_type, pattern in TOKEN_PATTERNS)
+    )
+    
     def tokenize(self, expression: str) -> List[Token]:
         """
         Tokenize an expression string.
@@ -348,26 +487,21 @@ class ExpressionTokenizer:
             raise TokenizeError("Expression must be a string")
         
         tokens = []
+        append = tokens.append
+        match = self._MASTER_PATTERN.match
         position = 0
+        length = len(expression)
         
-        while position < len(expression):
-            match_found = False
-            
-            for token_type, pattern in self.TOKEN_PATTERNS:
-                regex = re.compile(pattern)
-                match = regex.match(expression, position)
-                
-                if match:
-                    value = match.group(0)
-                    if token_type != 'WHITESPACE':
-                        tokens.append(Token(token_type, value, position))
-                    position = match.end()
-                    match_found = True
-                    break
-            
-            if not match_found:
+        while position < length:
+            m = match(expression, position)
+            if m is None:
                 raise TokenizeError(
                     f"Invalid character at position {position}: '{expression[position]}'"
                 )
+            
+            token_type = m.lastgroup
+            if token_type != 'WHITESPACE':
+                append(Token(token_type, m.group(), position))
+            position = m.end()
         
         return tokens
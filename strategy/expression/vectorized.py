@@ -0,0 +1,91 @@
+"""Vectorized evaluation of expression ASTs over NumPy arrays."""
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+from .expression_tokenizer import (
+    ComparisonNode,
+    EvaluationError,
+    ExpressionNode,
+    LogicalNode,
+    LogicalOperator,
+    MathNode,
+    MathOperator,
+    NumberNode,
+    VariableNode,
+)
+
+
+SeriesFunction = Callable[[Dict[str, Any]], np.ndarray]
+
+_LOGICAL_FUNCTIONS = {
+    LogicalOperator.AND: np.logical_and,
+    LogicalOperator.OR: np.logical_or,
+}
+
+
+def _divide(left_value: np.ndarray, right_value: np.ndarray) -> np.ndarray:
+    """Element-wise divide, raising EvaluationError if any divisor is zero."""
+    if np.any(right_value == 0):
+        raise EvaluationError("Division by zero")
+    return np.divide(left_value, right_value)
+
+
+def _load(name: str) -> SeriesFunction:
+    """Return a function reading a variable from the context as a float array."""
+    def load(context: Dict[str, Any]) -> np.ndarray:
+        try:
+            value = context[name]
+        except KeyError:
+            raise EvaluationError(f"Variable '{name}' not found in context") from None
+        try:
+            return np.asarray(value, dtype=float)
+        except (ValueError, TypeError) as e:
+            raise EvaluationError(
+                f"Cannot convert variable '{name}' to a float array: {e}"
+            ) from e
+    return load
+
+
+def _binary(fn: Callable[[Any, Any], Any], left: SeriesFunction, right: SeriesFunction):
+    """Return a function applying a binary operation to two child results."""
+    return lambda context: fn(left(context), right(context))
+
+
+def compile_series(ast: ExpressionNode) -> SeriesFunction:
+    """
+    Compile an expression AST into a function over a context of arrays.
+
+    Context values are converted to float arrays and every operator maps to a
+    NumPy operation, so one call evaluates the expression for all bars.
+    ``and``/``or`` become element-wise ``logical_and``/``logical_or`` and
+    therefore do not short-circuit. Variables are looked up by their full
+    name; dot paths into a strategy object are not supported.
+
+    Args:
+        ast: Root node of a parsed expression
+
+    Returns:
+        Function taking a dict of arrays (or scalars) and returning an ndarray
+
+    Raises:
+        EvaluationError: If the AST contains nodes that cannot be vectorized
+    """
+    if isinstance(ast, NumberNode):
+        value = np.float64(ast.value)
+        return lambda context: value
+    if isinstance(ast, VariableNode):
+        return _load(ast.name)
+    if isinstance(ast, MathNode) and ast._fn is not None:
+        fn = _divide if ast.operator is MathOperator.DIVIDE else ast._fn
+        return _binary(fn, compile_series(ast.left), compile_series(ast.right))
+    if isinstance(ast, ComparisonNode) and ast._fn is not None:
+        return _binary(ast._fn, compile_series(ast.left), compile_series(ast.right))
+    if isinstance(ast, LogicalNode) and ast.operator in _LOGICAL_FUNCTIONS:
+        return _binary(
+            _LOGICAL_FUNCTIONS[ast.operator],
+            compile_series(ast.left),
+            compile_series(ast.right),
+        )
+    raise EvaluationError(f"Cannot vectorize expression node: {type(ast).__name__}")
@@ -1,13 +1,20 @@
 """Strategy factory for creating strategies dynamically from YAML definitions."""
 
+import copy
+import functools
+import hashlib
+import json
 import logging
-from typing import Any, Callable, Dict, List, Type
+import sys
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple, Type
 
 import backtrader as bt
 
 import indicator
 from .base import BaseStrategy
-from .trigger_system import Trigger, TriggerAction, TriggerSystem, TriggerValidationError
+from .trigger_system import (
+    Trigger, TriggerAction, TriggerSystem, TriggerValidationError
+)
 
 
 logger = logging.getLogger(__name__)
@@ -25,8 +32,89 @@ class StrategyCreationError(Exception):
     pass
 
 
+# ===== Helpers =====
+
+def _intern(value: Any) -> Any:
+    """Intern config strings used as dict keys and in comparisons; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 # ===== Indicator Factory =====
 
+class _ParamRef(NamedTuple):
+    """Reference to a strategy parameter, resolved from strategy.p at creation time."""
+    name: str
+    default: Any
+
+
+def _resolve_indicator_params(
+    indicator_config: Dict[str, Any],
+    config_parameters: Dict[str, Any]
+) -> Tuple[Tuple[str, Any], ...]:
+    """Extract indicator parameters, replacing strategy parameter names with references."""
+    # Parameter names are stored as references for later resolution from strategy.p
+    return tuple(
+        (key, _ParamRef(value, config_parameters[value])
+         if isinstance(value, str) and value in config_parameters else value)
+        for key, value in indicator_config.items()
+        if key != 'type'
+    )
+
+
+# Indicator classes resolved by type name
+_INDICATOR_CLASS_CACHE: Dict[str, type] = {}
+
+
+def _resolve_indicator_class(indicator_type: str) -> type:
+    """Return the indicator class for a type name from bt.indicators or custom indicators."""
+    indicator_class = _INDICATOR_CLASS_CACHE.get(indicator_type)
+    if indicator_class is None:
+        indicator_class = (
+            getattr(bt.indicators, indicator_type, None)
+            or getattr(indicator, indicator_type, None)
+        )
+        if indicator_class is None:
+            raise IndicatorCreationError(f"Unsupported indicator type: {indicator_type}")
+        _INDICATOR_CLASS_CACHE[indicator_type] = indicator_class
+    return indicator_class
+
+
+def _build_indicator_factory(
+    indicator_type: str,
+    params: Tuple[Tuple[str, Any], ...]
+) -> Callable[['BaseStrategy'], Any]:
+    """Build the factory function creating an indicator instance for a strategy."""
+    indicator_class = _resolve_indicator_class(indicator_type)
+    
+    # Split once so each call only resolves the parameter references
+    static_params = {key: value for key, value in params if not isinstance(value, _ParamRef)}
+    param_refs = tuple((key, value) for key, value in params if isinstance(value, _ParamRef))
+    
+    # Return factory function that accepts strategy instance
+    def create_indicator_instance(strategy_instance: 'BaseStrategy') -> Any:
+        try:
+            if not param_refs:
+                return indicator_class(strategy_instance.data, **static_params)
+            
+            # Resolve parameter references from strategy instance
+            strategy_params = strategy_instance.p
+            resolved_params = dict(static_params)
+            for key, ref in param_refs:
+                resolved_params[key] = getattr(strategy_params, ref.name, ref.default)
+            
+            return indicator_class(strategy_instance.data, **resolved_params)
+        except Exception as e:
+            raise IndicatorCreationError(
+                f"Failed to create {indicator_type} indicator: {e}"
+            ) from e
+    
+    return create_indicator_instance
+
+
+# Identical resolved indicator configs share one factory function
+_build_indicator_factory_cached = functools.lru_cache(maxsize=512)(_build_indicator_factory)
+
+
 def create_indicator(
     indicator_config: Dict[str, Any],
     config_parameters: Dict[str, Any]
@@ -34,6 +122,9 @@ def create_indicator(
     """
     Create an indicator factory function from configuration.
     
+    Factories are memoized on the indicator type and resolved parameters;
+    configs with unhashable values (e.g. lists) are built uncached.
+    
     Args:
         indicator_config: Indicator configuration including type and parameters
         config_parameters: Strategy parameters for variable substitution
@@ -47,49 +138,18 @@ def create_indicator(
     if not isinstance(indicator_config, dict):
         raise IndicatorCreationError("Indicator config must be a dictionary")
     
-    indicator_type = indicator_config.get('type', '')
+    indicator_type = _intern(indicator_config.get('type', ''))
     if not indicator_type:
         raise IndicatorCreationError("Indicator type is required")
     
     try:
-        # Try to get indicator class from bt.indicators or custom indicators
-        if hasattr(bt.indicators, indicator_type):
-            indicator_class = getattr(bt.indicators, indicator_type)
-        elif hasattr(indicator, indicator_type):
-            indicator_class = getattr(indicator, indicator_type)
-        else:
-            raise IndicatorCreationError(f"Unsupported indicator type: {indicator_type}")
-        
-        # Extract parameters (exclude 'type' key)
-        params = {k: v for k, v in indicator_config.items() if k != 'type'}
-        
-        # Replace parameter references with actual values
-        for key in list(params.keys()):
-            value = params[key]
-            if isinstance(value, str) and value in config_parameters:
-                # Store parameter name for later resolution from strategy.p
-                params[key] = ('param_ref', value)
-        
-        # Return factory function that accepts strategy instance
-        def create_indicator_instance(strategy_instance: 'BaseStrategy') -> Any:
-            try:
-                # Resolve parameter references from strategy instance
-                resolved_params = {}
-                for key, value in params.items():
-                    if isinstance(value, tuple) and len(value) == 2 and value[0] == 'param_ref':
-                        # Get parameter from strategy instance
-                        param_name = value[1]
-                        resolved_params[key] = getattr(strategy_instance.p, param_name, config_parameters.get(param_name))
-                    else:
-                        resolved_params[key] = value
-                
-                return indicator_class(strategy_instance.data, **resolved_params)
-            except Exception as e:
-                raise IndicatorCreationError(
-                    f"Failed to create {indicator_type} indicator: {e}"
-                ) from e
+        params = _resolve_indicator_params(indicator_config, config_parameters)
         
-        return create_indicator_instance
+        try:
+            hash(params)
+        except TypeError:
+            return _build_indicator_factory(indicator_type, params)
+        return _build_indicator_factory_cached(indicator_type, params)
         
     except IndicatorCreationError:
         raise
@@ -101,6 +161,30 @@ def create_indicator(
 
 # ===== Trigger System Factory =====
 
+def _iter_action_configs(
+    actions_config: List[Any],
+    trigger_name: str
+) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield (name, type, config) for each valid action config, skipping empty entries."""
+    for j, action_config in enumerate(actions_config):
+        if not action_config or action_config == 'None':
+            continue
+        
+        if not isinstance(action_config, dict):
+            raise TriggerValidationError(
+                f"Action {j} in trigger '{trigger_name}' must be a dictionary"
+            )
+        
+        action_type = _intern(action_config.get('type', 'TradeAction'))
+        if action_type != 'TradeAction':
+            raise TriggerValidationError(
+                f"Unsupported action type '{action_type}' in trigger "
+                f"'{trigger_name}'. Only 'TradeAction' is supported."
+            )
+        
+        yield _intern(action_config.get('name', f'unnamed_action_{j}')), action_type, action_config
+
+
 def setup_trigger_system(
     trigger_system: TriggerSystem,
     triggers_config: List[Dict[str, Any]]
@@ -131,6 +215,7 @@ def setup_trigger_system(
             if 'name' not in trigger_config or not trigger_config['name']:
                 trigger_config['name'] = f'UnnamedTrigger_{unnamed_trigger_index}'
                 unnamed_trigger_index += 1
+            trigger_name = _intern(trigger_config['name'])
             
             # Validate condition
             condition = trigger_config.get('condition', '').strip()
@@ -140,41 +225,23 @@ def setup_trigger_system(
                 )
             
             # Create actions
-            actions = []
             actions_config = trigger_config.get('actions', [])
             if not isinstance(actions_config, list):
                 raise TriggerValidationError(
                     f"Actions for trigger '{trigger_config['name']}' must be a list"
                 )
             
-            for j, action_config in enumerate(actions_config):
-                if not action_config or action_config == 'None':
-                    continue
-                
-                if not isinstance(action_config, dict):
-                    raise TriggerValidationError(
-                        f"Action {j} in trigger '{trigger_config['name']}' must be a dictionary"
-                    )
-                
-                action_name = action_config.get('name', f'unnamed_action_{j}')
-                action_type = action_config.get('type', 'TradeAction')
-                
-                if action_type != 'TradeAction':
-                    raise TriggerValidationError(
-                        f"Unsupported action type '{action_type}' in trigger "
-                        f"'{trigger_config['name']}'. Only 'TradeAction' is supported."
-                    )
-                
-                # Create action
-                action = TriggerAction(
+            # Parameters are derived from the raw config when the action first fires
+            actions = [
+                TriggerAction(
                     name=action_name,
                     type=action_type,
-                    parameters={
-                        k: v for k, v in action_config.items()
-                        if k not in ('name', 'type')
-                    }
+                    parameters=None,
+                    config=action_config
                 )
-                actions.append(action)
+                for action_name, action_type, action_config
+                in _iter_action_configs(actions_config, trigger_config['name'])
+            ]
             
             # Validate at least one action exists
             if not actions:
@@ -184,13 +251,12 @@ def setup_trigger_system(
             
             # Create and add trigger
             trigger = Trigger(
-                name=trigger_config['name'],
+                name=trigger_name,
                 condition=condition,
                 actions=actions
             )
             
             trigger_system.add_trigger(trigger)
-            logger.debug(f"Added trigger: {trigger.name}")
             
         except TriggerValidationError:
             raise
@@ -202,6 +268,52 @@ def setup_trigger_system(
 
 # ===== Strategy Factory =====
 
+# Methods shared by every strategy class built by create_strategy; per-strategy
+# configuration is read from class attributes.
+
+def _strategy_init(self) -> None:
+    BaseStrategy.__init__(self)
+    if self.logger.isEnabledFor(logging.DEBUG):
+        self.logger.debug(f"Initialized strategy: {self.strategy_name}")
+
+
+def _strategy_setup_indicators(self) -> None:
+    """Set up indicators based on configuration."""
+    debug = self.logger.isEnabledFor(logging.DEBUG)
+    for ind_name, indicator_fn in self._indicator_funs.items():
+        try:
+            # Pass self to indicator factory so it can access self.p parameters
+            self.indicators[ind_name] = indicator_fn(self)
+            if debug:
+                self.logger.debug(f"Created indicator: {ind_name}")
+        except Exception as e:
+            self.logger.error(f"Failed to create indicator '{ind_name}': {e}")
+
+
+def _strategy_setup_trigger_system(self) -> None:
+    """Set up trigger system based on configuration."""
+    try:
+        setup_trigger_system(self.trigger_system, self._triggers_config)
+    except TriggerValidationError as e:
+        raise StrategyCreationError(
+            f"Failed to create trigger system: {e}"
+        ) from e
+
+
+# Strategy classes keyed by a hash of the strategy name and canonical definition;
+# oldest entries are evicted first so edited definitions do not pile up classes
+_STRATEGY_CACHE: Dict[str, Type[BaseStrategy]] = {}
+_STRATEGY_CACHE_SIZE = 64
+
+
+def _strategy_cache_key(strategy_name: str, strategy_def: Dict[str, Any]) -> str:
+    """Return a stable key for a strategy name and definition."""
+    canonical = json.dumps(strategy_def, sort_keys=True, default=str)
+    return hashlib.blake2b(
+        canonical.encode() + strategy_name.encode(), digest_size=16
+    ).hexdigest()
+
+
 def create_strategy(
     strategy_name: str,
     strategy_def: Dict[str, Any]
@@ -209,6 +321,11 @@ def create_strategy(
     """
     Create a strategy class dynamically from YAML definition.
     
+    Classes are cached on the strategy name and definition content, so loading
+    the same YAML again returns the existing class. Definitions that cannot be
+    serialized (e.g. with mixed-type dict keys) are built without caching. Use
+    ``create_strategy.cache_clear()`` to drop cached classes.
+    
     Args:
         strategy_name: Name of the strategy (used for class name)
         strategy_def: Strategy definition dictionary
@@ -226,6 +343,35 @@ def create_strategy(
         raise StrategyCreationError("Strategy name must be a non-empty string")
     
     try:
+        key = _strategy_cache_key(strategy_name, strategy_def)
+    except (TypeError, ValueError) as e:
+        logger.debug("Not caching strategy class %s: %s", strategy_name, e)
+        return _build_strategy(strategy_name, strategy_def)
+    
+    strategy_class = _STRATEGY_CACHE.get(key)
+    if strategy_class is None:
+        strategy_class = _build_strategy(strategy_name, strategy_def)
+        if len(_STRATEGY_CACHE) >= _STRATEGY_CACHE_SIZE:
+            del _STRATEGY_CACHE[next(iter(_STRATEGY_CACHE))]
+        _STRATEGY_CACHE[key] = strategy_class
+    else:
+        logger.debug("Using cached strategy class: %s", strategy_name)
+    return strategy_class
+
+
+create_strategy.cache_clear = _STRATEGY_CACHE.clear
+
+
+def _build_strategy(
+    strategy_name: str,
+    strategy_def: Dict[str, Any]
+) -> Type[BaseStrategy]:
+    """Build a new strategy class from a validated name and definition."""
+    try:
+        # The class keeps parts of the definition and may be cached, so it gets
+        # its own copy rather than sharing dicts the caller can still change
+        strategy_def = copy.deepcopy(strategy_def)
+        
         # Create indicator factories
         indicators_config = strategy_def.get('indicators', {})
         if not isinstance(indicators_config, dict):
@@ -240,7 +386,7 @@ def create_strategy(
                     f"Indicator name must be a non-empty string, got: {name}"
                 )
             try:
-                indicator_funs[name] = create_indicator(ind_config, parameters)
+                indicator_funs[sys.intern(name)] = create_indicator(ind_config, parameters)
             except IndicatorCreationError as e:
                 raise StrategyCreationError(
                     f"Failed to create indicator '{name}': {e}"
@@ -262,45 +408,25 @@ def create_strategy(
                 default_value = param_value
             strategy_params.append((param_name, default_value))
         
-        # Create the strategy class
-        class CustomStrategy(BaseStrategy):
-            """Dynamically created strategy class."""
-            
-            # Define params - extend the base strategy params with strategy-specific ones
+        # Extend the base strategy params with strategy-specific ones
+        namespace = {
+            '__doc__': "Dynamically created strategy class.",
+            '__module__': __name__,
+            '__qualname__': strategy_name,
+            '__init__': _strategy_init,
+            'setup_indicators': _strategy_setup_indicators,
+            'setup_trigger_system': _strategy_setup_trigger_system,
+            'strategy_name': strategy_name,
+            '_indicator_funs': indicator_funs,
+            '_triggers_config': triggers_config,
+        }
+        if strategy_params:
             # Note: BaseStrategy.params is already a tuple, we just add to it
-            if strategy_params:
-                # Get parent params as tuple
-                parent_params = BaseStrategy.params if isinstance(BaseStrategy.params, tuple) else ()
-                params = parent_params + tuple(strategy_params)
-            
-            def __init__(self):
-                super().__init__()
-                self.strategy_name = strategy_name
-                self.logger.debug(f"Initialized strategy: {strategy_name}")
-            
-            def setup_indicators(self) -> None:
-                """Set up indicators based on configuration."""
-                for ind_name, indicator_fn in indicator_funs.items():
-                    try:
-                        # Pass self to indicator factory so it can access self.p parameters
-                        self.indicators[ind_name] = indicator_fn(self)
-                        self.logger.debug(f"Created indicator: {ind_name}")
-                    except Exception as e:
-                        self.logger.error(f"Failed to create indicator '{ind_name}': {e}")
-            
-            def setup_trigger_system(self) -> None:
-                """Set up trigger system based on configuration."""
-                try:
-                    setup_trigger_system(self.trigger_system, triggers_config)
-                except TriggerValidationError as e:
-                    raise StrategyCreationError(
-                        f"Failed to create trigger system: {e}"
-                    ) from e
+            parent_params = BaseStrategy.params if isinstance(BaseStrategy.params, tuple) else ()
+            namespace['params'] = parent_params + tuple(strategy_params)
         
-        # Set class name and module for better debugging and pickling
-        CustomStrategy.__name__ = strategy_name
-        CustomStrategy.__qualname__ = strategy_name
-        CustomStrategy.__module__ = __name__
+        # Build through BaseStrategy's metaclass so backtrader processes params
+        CustomStrategy = type(BaseStrategy)(strategy_name, (BaseStrategy,), namespace)
         
         logger.info(f"Created strategy class: {strategy_name}")
         return CustomStrategy
@@ -315,59 +441,84 @@ def create_strategy(
 
 # ===== Validation =====
 
+# Sentinel for optional config sections, avoiding a default allocation per lookup
+_MISSING = object()
+
+
 def validate_strategy_config(config: Dict[str, Any]) -> List[str]:
     """
     Validate a strategy configuration and return issues found.
     
+    Always validates, regardless of SKIP_VALIDATION, so tools that check
+    or save definitions never report invalid YAML as valid.
+    
     Args:
         config: Strategy configuration to validate
         
     Returns:
         List of validation error messages (empty if valid)
     """
-    issues = []
-    
     if not isinstance(config, dict):
         return ["Configuration must be a dictionary"]
     
+    return _collect_config_issues(config)
+
+
+def _collect_config_issues(config: Dict[str, Any]) -> List[str]:
+    """Walk a strategy configuration dictionary once and collect validation issues."""
+    issues = []
+    add_issue = issues.append
+    
     # Validate name
-    name = config.get('name', '')
+    name = config.get('name')
     if not isinstance(name, str) or not name.strip():
-        issues.append("Strategy name must be a non-empty string")
+        add_issue("Strategy name must be a non-empty string")
     
-    # Validate indicators
-    indicators = config.get('indicators', {})
-    if not isinstance(indicators, dict):
-        issues.append("Indicators must be a dictionary")
-    else:
-        for ind_name, ind_config in indicators.items():
-            if not isinstance(ind_name, str) or not ind_name.strip():
-                issues.append(f"Indicator name '{ind_name}' must be a non-empty string")
-            if not isinstance(ind_config, dict):
-                issues.append(f"Indicator config for '{ind_name}' must be a dictionary")
-            elif 'type' not in ind_config:
-                issues.append(f"Indicator '{ind_name}' is missing required 'type' field")
+    # Validate indicators (a missing section is valid and skipped)
+    indicators = config.get('indicators', _MISSING)
+    match indicators:
+        case dict():
+            for ind_name, ind_config in indicators.items():
+                if not isinstance(ind_name, str) or not ind_name.strip():
+                    add_issue(f"Indicator name '{ind_name}' must be a non-empty string")
+                match ind_config:
+                    case {'type': _}:
+                        pass
+                    case dict():
+                        add_issue(f"Indicator '{ind_name}' is missing required 'type' field")
+                    case _:
+                        add_issue(f"Indicator config for '{ind_name}' must be a dictionary")
+        case _ if indicators is not _MISSING:
+            add_issue("Indicators must be a dictionary")
     
     # Validate triggers
-    triggers = config.get('triggers', [])
-    if not isinstance(triggers, list):
-        issues.append("Triggers must be a list")
-    else:
-        for i, trigger_config in enumerate(triggers):
-            if not isinstance(trigger_config, dict):
-                issues.append(f"Trigger at index {i} must be a dictionary")
-                continue
-            
-            # Check condition
-            condition = trigger_config.get('condition', '')
-            if not isinstance(condition, str) or not condition.strip():
-                issues.append(f"Trigger at index {i} must have a non-empty condition")
-            
-            # Check actions
-            actions = trigger_config.get('actions', [])
-            if not isinstance(actions, list):
-                issues.append(f"Actions for trigger at index {i} must be a list")
-            elif not any(action for action in actions if action and action != 'None'):
-                issues.append(f"Trigger at index {i} must have at least one valid action")
+    triggers = config.get('triggers', _MISSING)
+    match triggers:
+        case list():
+            for i, trigger_config in enumerate(triggers):
+                if not isinstance(trigger_config, dict):
+                    add_issue(f"Trigger at index {i} must be a dictionary")
+                    continue
+                
+                # Check condition
+                match trigger_config.get('condition'):
+                    case str() as condition if condition.strip():
+                        pass
+                    case _:
+                        add_issue(f"Trigger at index {i} must have a non-empty condition")
+                
+                # Check actions (a missing list counts as no valid action)
+                actions = trigger_config.get('actions', _MISSING)
+                match actions:
+                    case list() if any(action and action != 'None' for action in actions):
+                        pass
+                    case list():
+                        add_issue(f"Trigger at index {i} must have at least one valid action")
+                    case _ if actions is _MISSING:
+                        add_issue(f"Trigger at index {i} must have at least one valid action")
+                    case _:
+                        add_issue(f"Actions for trigger at index {i} must be a list")
+        case _ if triggers is not _MISSING:
+            add_issue("Triggers must be a list")
     
     return issues
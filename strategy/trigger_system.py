@@ -1,14 +1,20 @@
 """Trigger system for defining strategy conditions and actions."""
 
+import functools
 import logging
+import os
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Collection, Dict, List, NamedTuple, Optional, Tuple
 
-from .expression import ConditionEvaluator, ParseError
+from .expression import ConditionEvaluator, EvaluationError, ParseError
 
 
 logger = logging.getLogger(__name__)
 
+# Skip up-front condition checks when building triggers for production runs
+# (set DEEPQUANT_SKIP_VALIDATION=1); validate_strategy_config is unaffected
+SKIP_VALIDATION = os.environ.get("DEEPQUANT_SKIP_VALIDATION") == "1"
+
 
 # ===== Exceptions =====
 
@@ -24,44 +30,106 @@ class TriggerValidationError(TriggerSystemError):
 
 # ===== Dataclasses =====
 
-@dataclass
+# Action config keys that are not action parameters
+RESERVED_ACTION_KEYS = frozenset(('name', 'type'))
+
+
+@dataclass(slots=True)
 class TriggerAction:
     """Represents an action to be executed when a trigger condition is met."""
     name: str
     type: str  # Must be "TradeAction" for now
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameters: Optional[Dict[str, Any]] = field(default_factory=dict)
+    # Raw action config; when parameters is None they are derived from it on first use
+    config: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validate action parameters after initialization."""
+        """
+        Validate action parameters after initialization.
+        
+        Checks on values that come from strategy YAML always run; the check on
+        parameters passed in code is an internal invariant, skipped under python -O.
+        """
         if not self.name or not isinstance(self.name, str):
             raise TriggerValidationError("Action name must be a non-empty string")
-        if not isinstance(self.parameters, dict):
+        if self.parameters is None:
+            if not isinstance(self.config, dict):
+                raise TriggerValidationError("Action config must be a dictionary")
+        elif __debug__ and not isinstance(self.parameters, dict):
             raise TriggerValidationError("Action parameters must be a dictionary")
+    
+    def get_parameters(self) -> Dict[str, Any]:
+        """Return the action parameters, materializing them from the config once."""
+        parameters = self.parameters
+        if parameters is None:
+            parameters = self.parameters = {
+                k: v for k, v in self.config.items() if k not in RESERVED_ACTION_KEYS
+            }
+        return parameters
 
 
-@dataclass
+@dataclass(slots=True)
 class Trigger:
     """Represents a trigger with condition and associated actions."""
     name: str
     condition: Callable[[Dict[str, Any]], bool] | str
     actions: List[TriggerAction]
     enabled: bool = True
+    # Compiled condition, set by TriggerSystem.add_trigger for string conditions
+    compiled: Optional[Callable[[Dict[str, Any]], Any]] = field(
+        default=None, repr=False, compare=False
+    )
     
     def __post_init__(self):
-        """Validate trigger parameters after initialization."""
+        """
+        Validate trigger parameters after initialization.
+        
+        Checks on values that come from strategy YAML always run; the action
+        type check is an internal invariant, skipped under python -O.
+        """
         if not self.name or not isinstance(self.name, str):
             raise TriggerValidationError("Trigger name must be a non-empty string")
-        if not self.condition or (not isinstance(self.condition, str) and not callable(self.condition)):
-            raise TriggerValidationError("Trigger condition must be a non-empty string or callable")
+        if not self.condition or (
+            not isinstance(self.condition, str) and not callable(self.condition)
+        ):
+            raise TriggerValidationError(
+                "Trigger condition must be a non-empty string or callable"
+            )
         if not isinstance(self.actions, list) or not self.actions:
             raise TriggerValidationError("Trigger must have at least one action")
-        for action in self.actions:
-            if not isinstance(action, TriggerAction):
-                raise TriggerValidationError("All actions must be TriggerAction instances")
+        if __debug__:
+            for action in self.actions:
+                if not isinstance(action, TriggerAction):
+                    raise TriggerValidationError("All actions must be TriggerAction instances")
 
 
 # ===== Trigger System =====
 
+# Evaluator used only to check condition syntax; its parse cache is shared by all systems
+_SYNTAX_EVALUATOR = ConditionEvaluator()
+
+
+@functools.lru_cache(maxsize=1024)
+def _condition_syntax_error(condition: str) -> Optional[str]:
+    """Parse a condition once per distinct string, returning the error message if any."""
+    try:
+        _SYNTAX_EVALUATOR.parse_expression(condition)
+    except ParseError as e:
+        return str(e)
+    return None
+
+
+class _Batch(NamedTuple):
+    """Trigger conditions compiled together for TriggerSystem.evaluate_all."""
+    names: Tuple[str, ...]
+    evaluate: Callable[[Dict[str, Any]], List[Any]]
+    parse_errors: Dict[str, ParseError]
+
+
+# Compiled batches kept per trigger system, one per selection of triggers seen
+_BATCH_CACHE_SIZE = 16
+
+
 class TriggerSystem:
     """System for managing triggers with condition parsing and validation."""
     
@@ -75,11 +143,20 @@ class TriggerSystem:
         self.triggers: Dict[str, Trigger] = {}
         self.condition_evaluator = ConditionEvaluator()
         self._max_triggers = max_triggers
+        # Per selection of triggers (one flag per trigger): their names, one compiled
+        # function evaluating their conditions and the parse errors of conditions
+        # left out; built by evaluate_all and reset whenever triggers are added or removed
+        self._batches: Dict[Tuple[bool, ...], _Batch] = {}
     
     def add_trigger(self, trigger: Trigger) -> None:
         """
         Add a trigger to the system.
         
+        String conditions are parsed and compiled here, so syntax errors
+        surface when the strategy is built. With SKIP_VALIDATION set the
+        check is skipped and the condition is compiled on first evaluation
+        instead, trading early error reporting for faster startup.
+        
         Args:
             trigger: The trigger to add
             
@@ -90,23 +167,144 @@ class TriggerSystem:
         if not isinstance(trigger, Trigger):
             raise TriggerValidationError("Must provide a Trigger instance")
         
-        if len(self.triggers) >= self._max_triggers:
+        triggers = self.triggers
+        count = len(triggers)
+        if count >= self._max_triggers and trigger.name not in triggers:
             raise TriggerSystemError(f"Maximum number of triggers ({self._max_triggers}) exceeded")
         
-        if trigger.name in self.triggers:
+        # Insert and detect duplicates with a single lookup: the size only grows for new names
+        triggers.setdefault(trigger.name, trigger)
+        if len(triggers) == count:
             raise TriggerValidationError(f"Trigger with name '{trigger.name}' already exists")
         
-        # Validate condition syntax
-        if isinstance(trigger.condition, str):
+        # Validate condition syntax and keep the compiled form for evaluation
+        if isinstance(trigger.condition, str) and not SKIP_VALIDATION:
             try:
-                self.condition_evaluator.parse_expression(trigger.condition)
+                trigger.compiled = self.condition_evaluator.compile(trigger.condition)
             except ParseError as e:
+                del triggers[trigger.name]
                 raise TriggerValidationError(
                     f"Invalid condition syntax in trigger '{trigger.name}': {e}"
                 ) from e
         
-        self.triggers[trigger.name] = trigger
-        logger.debug(f"Added trigger: {trigger.name}")
+        self._batches.clear()
+        logger.debug("Added trigger: %s", trigger.name)
+    
+    def evaluate_trigger(self, trigger: Trigger, context: Dict[str, Any]) -> bool:
+        """
+        Evaluate a trigger's condition, using its compiled form when available.
+        
+        Args:
+            trigger: The trigger to evaluate
+            context: Variable context for evaluation
+            
+        Returns:
+            True if the condition is met
+            
+        Raises:
+            EvaluationError: If evaluation fails
+        """
+        compiled = trigger.compiled
+        if compiled is None or not isinstance(context, dict):
+            return bool(self.condition_evaluator.evaluate(trigger.condition, context))
+        
+        # Call the compiled condition directly, skipping the evaluator's dispatch
+        try:
+            return bool(compiled(context))
+        except EvaluationError:
+            raise
+        except Exception as e:
+            raise EvaluationError(
+                f"Trigger '{trigger.name}' evaluation failed: {e}"
+            ) from e
+    
+    def evaluate_all(
+        self,
+        context: Dict[str, Any],
+        exclude: Collection[str] = (),
+        errors: Optional[Dict[str, Exception]] = None
+    ) -> Dict[str, bool]:
+        """
+        Evaluate the conditions of all enabled triggers against one context.
+        
+        String conditions are compiled together into a single function on
+        first use, so each call evaluates every trigger with one function
+        call. A condition that fails to parse or evaluate does not stop the
+        others; its trigger is left out of the result and, if ``errors`` is
+        given, its exception is stored there.
+        
+        Args:
+            context: Variable context for evaluation
+            exclude: Names of triggers not to evaluate
+            errors: Optional mapping to receive the exception of each failed trigger
+            
+        Returns:
+            Mapping of evaluated trigger name to whether its condition is met
+        """
+        # Triggers can be enabled, disabled or excluded between bars; each selection
+        # gets its own compiled function, kept for when the selection comes back
+        selected = tuple(
+            trigger.enabled and name not in exclude for name, trigger in self.triggers.items()
+        )
+        batch = self._batches.get(selected)
+        if batch is None:
+            if len(self._batches) >= _BATCH_CACHE_SIZE:
+                del self._batches[next(iter(self._batches))]
+            batch = self._batches[selected] = self._compile_batch(selected)
+        
+        results = {}
+        for name, value in zip(batch.names, batch.evaluate(context)):
+            if not isinstance(value, Exception):
+                results[name] = bool(value)
+            elif errors is not None:
+                errors[name] = value
+        if errors is not None:
+            errors.update(batch.parse_errors)
+        return results
+    
+    def _compile_batch(self, selected: Tuple[bool, ...]) -> _Batch:
+        """
+        Compile the selected triggers' conditions into one function returning their values.
+        
+        A failing condition yields its exception in place of a value. Conditions
+        that do not parse are left out of the function and their errors kept.
+        """
+        conditions = {}
+        parse_errors = {}
+        for (name, trigger), is_selected in zip(self.triggers.items(), selected):
+            if not is_selected:
+                continue
+            condition = trigger.condition
+            if isinstance(condition, str):
+                try:
+                    self.condition_evaluator.parse_expression(condition)
+                except ParseError as e:
+                    parse_errors[name] = e.with_traceback(None)
+                    continue
+            conditions[name] = condition
+        
+        names = tuple(conditions)
+        if all(isinstance(condition, str) for condition in conditions.values()):
+            evaluate = self.condition_evaluator.compile_many(
+                list(conditions.values()), isolate_errors=True
+            )
+            return _Batch(names, evaluate, parse_errors)
+        
+        # Mixed with callable conditions: call each condition separately
+        evaluators = [
+            c if callable(c) else self.condition_evaluator.compile(c) for c in conditions.values()
+        ]
+        
+        def evaluate_each(context: Dict[str, Any]) -> List[Any]:
+            values = []
+            for evaluate in evaluators:
+                try:
+                    values.append(evaluate(context))
+                except Exception as e:
+                    values.append(e)
+            return values
+        
+        return _Batch(names, evaluate_each, parse_errors)
     
     def remove_trigger(self, trigger_name: str) -> bool:
         """
@@ -128,6 +326,7 @@ class TriggerSystem:
             raise TriggerValidationError(f"Trigger '{trigger_name}' not found")
         
         del self.triggers[trigger_name]
+        self._batches.clear()
         logger.info(f"Removed trigger: {trigger_name}")
         return True
     
@@ -150,9 +349,10 @@ class TriggerSystem:
         Returns:
             True if successful, False if trigger not found
         """
-        if trigger_name in self.triggers:
-            self.triggers[trigger_name].enabled = True
-            logger.debug(f"Enabled trigger: {trigger_name}")
+        trigger = self.triggers.get(trigger_name)
+        if trigger is not None:
+            trigger.enabled = True
+            logger.debug("Enabled trigger: %s", trigger_name)
             return True
         return False
     
@@ -166,9 +366,10 @@ class TriggerSystem:
         Returns:
             True if successful, False if trigger not found
         """
-        if trigger_name in self.triggers:
-            self.triggers[trigger_name].enabled = False
-            logger.debug(f"Disabled trigger: {trigger_name}")
+        trigger = self.triggers.get(trigger_name)
+        if trigger is not None:
+            trigger.enabled = False
+            logger.debug("Disabled trigger: %s", trigger_name)
             return True
         return False
     
@@ -194,7 +395,9 @@ class TriggerSystem:
         Raises:
             TriggerValidationError: If condition is invalid
         """
-        try:
-            self.condition_evaluator.parse_expression(condition)
-        except ParseError as e:
-            raise TriggerValidationError(f"Invalid condition syntax: {e}") from e
+        if isinstance(condition, str):
+            error = _condition_syntax_error(condition)
+        else:
+            error = _condition_syntax_error.__wrapped__(condition)  # Unhashable; not cached
+        if error is not None:
+            raise TriggerValidationError(f"Invalid condition syntax: {error}") from ParseError(error)
@@ -2,8 +2,7 @@
 
 import json
 import os
-import tempfile
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 import pytest
@@ -11,17 +10,19 @@ import pytest
 from utils.cache_index import (
     CacheEntry,
     CacheIndex,
+    IntervalTree,
     calculate_checksum,
+    scan_file,
     validate_cache_entry,
+    CHECKSUM_ALGORITHM,
     DEFAULT_MAX_SIZE_MB,
 )
 
 
 @pytest.fixture
-def temp_datas_folder():
-    """Create a temporary data folder for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+def temp_datas_folder(tmp_path_factory):
+    """Create a temporary data folder for testing under the session's base temp dir."""
+    return str(tmp_path_factory.mktemp("cache"))
 
 
 @pytest.fixture
@@ -71,6 +72,26 @@ class TestCacheEntry:
         assert entry.start_date == sample_entry.start_date
         assert entry.checksum == sample_entry.checksum
 
+    def test_date_ordinals_not_serialized(self, sample_entry):
+        """Test that precomputed date ordinals stay out of the serialized form."""
+        assert sample_entry._start_ord == date(2024, 1, 1).toordinal()
+        assert sample_entry._end_ord == date(2024, 3, 1).toordinal()
+        assert "_start_ord" not in sample_entry.to_dict()
+        assert CacheEntry.from_dict(sample_entry.to_dict()) == sample_entry
+
+    def test_entry_uses_slots(self, sample_entry):
+        """Test that entries carry no per-instance __dict__."""
+        assert not hasattr(sample_entry, "__dict__")
+        assert list(sample_entry.to_dict()) == [
+            "ticker", "start_date", "end_date", "file_path", "download_time",
+            "last_accessed", "file_size_bytes", "row_count", "checksum", "source",
+        ]
+
+    def test_ticker_interned(self, sample_entry):
+        """Test that entries for the same ticker share one ticker string."""
+        data = json.loads(json.dumps(sample_entry.to_dict()))
+        assert CacheEntry.from_dict(data).ticker is sample_entry.ticker
+
 
 class TestCacheIndex:
     """Tests for CacheIndex class."""
@@ -160,6 +181,17 @@ class TestCacheIndex:
         msft_entries = index.get_entries_for_ticker("MSFT")
         assert len(msft_entries) == 1
 
+        # Re-adding a file under another ticker moves it between tickers
+        moved = CacheEntry.from_dict(aapl_entries[0].to_dict())
+        moved.ticker = "MSFT"
+        index.add_entry(moved)
+        assert index.get_entries_for_ticker("AAPL") == [aapl_entries[1]]
+        assert index.get_entries_for_ticker("MSFT") == [msft_entries[0], moved]
+
+        index.remove_entry(Path(aapl_entries[1].file_path).name)
+        assert index.get_entries_for_ticker("AAPL") == []
+        assert index.get_stats()["tickers"] == ["MSFT"]
+
     def test_find_overlapping_entries(self, temp_datas_folder):
         """Test finding entries that overlap with a date range."""
         index = CacheIndex(temp_datas_folder)
@@ -249,6 +281,93 @@ class TestCacheIndex:
 
         assert index.get_total_size_bytes() == 6000
 
+        # The running total follows replaced and removed entries and a reload
+        replaced = CacheEntry.from_dict(dict(entry.to_dict(), file_size_bytes=500))
+        index.add_entry(replaced)
+        assert index.get_total_size_bytes() == 3500
+        index.remove_entry(os.path.basename(entry.file_path))
+        assert index.get_total_size_bytes() == 3000
+        assert CacheIndex(temp_datas_folder).get_total_size_bytes() == 3000
+        assert index.get_entry_count() == 2
+
+    def test_update_last_accessed_deferred(self, temp_datas_folder, sample_entry):
+        """Test that an unsaved access time is written by the next flush()."""
+        index = CacheIndex(temp_datas_folder)
+        sample_entry.file_path = f"{temp_datas_folder}/AAPL-2024-01-01-to-2024-03-01.csv"
+        index.add_entry(sample_entry)
+        filename = "AAPL-2024-01-01-to-2024-03-01.csv"
+
+        index.update_last_accessed(filename, save=False)
+        accessed = index.get_entry(filename).last_accessed
+        assert CacheIndex(temp_datas_folder).get_entry(filename).last_accessed != accessed
+
+        index.flush()
+        assert CacheIndex(temp_datas_folder).get_entry(filename).last_accessed == accessed
+
+    def test_batch_defers_writes(self, temp_datas_folder, sample_entry):
+        """Test that changes inside batch() are written once on exit."""
+        index = CacheIndex(temp_datas_folder)
+        sample_entry.file_path = f"{temp_datas_folder}/AAPL-2024-01-01-to-2024-03-01.csv"
+
+        with index.batch():
+            with index.batch():
+                index.add_entry(sample_entry)
+            assert not index.index_path.exists()
+            index.update_last_accessed("AAPL-2024-01-01-to-2024-03-01.csv")
+            assert not index.index_path.exists()
+
+        reloaded = CacheIndex(temp_datas_folder)
+        assert reloaded.get_entry("AAPL-2024-01-01-to-2024-03-01.csv") is not None
+
+        # Changes are still written when the block raises
+        with pytest.raises(RuntimeError):
+            with index.batch():
+                index.remove_entry("AAPL-2024-01-01-to-2024-03-01.csv")
+                raise RuntimeError("boom")
+        assert CacheIndex(temp_datas_folder).list_entries() == []
+
+        # The index itself is a batch context manager, and flush() writes early
+        with index:
+            index.add_entry(sample_entry)
+            index.flush()
+            assert CacheIndex(temp_datas_folder).list_entries() == [sample_entry]
+            index.remove_entry("AAPL-2024-01-01-to-2024-03-01.csv")
+        assert CacheIndex(temp_datas_folder).list_entries() == []
+
+    def test_entries_built_lazily(self, temp_datas_folder):
+        """Test that a loaded index builds entries only as they are needed."""
+        index = CacheIndex(temp_datas_folder)
+        with index.batch():
+            for ticker in ("AAPL", "MSFT"):
+                index.add_entry(
+                    CacheEntry(
+                        ticker=ticker,
+                        start_date="2024-01-01",
+                        end_date="2024-03-01",
+                        file_path=f"{temp_datas_folder}/{ticker}-2024-01-01-to-2024-03-01.csv",
+                        download_time="2024-03-02T10:00:00",
+                        last_accessed="2024-03-02T10:00:00",
+                        file_size_bytes=1000,
+                        row_count=40,
+                        checksum="abc",
+                    )
+                )
+
+        reloaded = CacheIndex(temp_datas_folder)
+        entry = reloaded.get_entry("AAPL-2024-01-01-to-2024-03-01.csv")
+        assert entry.ticker == "AAPL"
+        assert list(reloaded._entry_map) == ["AAPL-2024-01-01-to-2024-03-01.csv"]
+
+        # Writing keeps unbuilt entries as loaded
+        reloaded.update_last_accessed("AAPL-2024-01-01-to-2024-03-01.csv")
+        assert reloaded._raw_entries is not None
+        assert len(CacheIndex(temp_datas_folder).list_entries()) == 2
+
+        # Building the rest keeps the entry already handed out
+        assert reloaded.get_entries_for_ticker("AAPL") == [entry]
+        assert reloaded.get_entries_for_ticker("AAPL")[0] is entry
+        assert [e.ticker for e in reloaded.list_entries()] == ["AAPL", "MSFT"]
+
     def test_enforce_storage_limit(self, temp_datas_folder):
         """Test LRU eviction when storage limit exceeded."""
         # Set a small limit (5 KB)
@@ -286,24 +405,87 @@ class TestCacheIndex:
         assert len(evicted) >= 1
         assert index.get_total_size_bytes() <= 5 * 1024  # 5 KB
 
+    def test_enforce_storage_limit_reserve(self, temp_datas_folder):
+        """Test that reserved space for an incoming file forces extra evictions."""
+        index = CacheIndex(temp_datas_folder, max_size_mb=0.005)
+        for day in ("01", "02"):
+            filepath = Path(temp_datas_folder) / f"AAPL-2024-01-{day}-to-2024-01-{day}.csv"
+            filepath.write_bytes(b"x" * 2000)
+            index.add_entry(
+                CacheEntry(
+                    ticker="AAPL",
+                    start_date=f"2024-01-{day}",
+                    end_date=f"2024-01-{day}",
+                    file_path=str(filepath),
+                    download_time=f"2024-01-{day}T00:00:00",
+                    last_accessed=f"2024-01-{day}T00:00:00",
+                    file_size_bytes=2000,
+                    row_count=10,
+                    checksum="test",
+                )
+            )
+
+        # A reserve larger than the whole limit cannot be met; it must not empty the cache
+        assert index.enforce_storage_limit(reserve_bytes=10_000) == []
+
+        # 4000 bytes fit under the ~5 KB limit, but not with 2000 more on the way
+        assert index.enforce_storage_limit() == []
+        evicted = index.enforce_storage_limit(reserve_bytes=2000)
+        assert [Path(p).name for p in evicted] == ["AAPL-2024-01-01-to-2024-01-01.csv"]
+
+    def test_enforce_storage_limit_respects_later_access(self, temp_datas_folder):
+        """Test that entries accessed after the first eviction are evicted last."""
+        index = CacheIndex(temp_datas_folder, max_size_mb=0.005)
+
+        def add(day):
+            filepath = Path(temp_datas_folder) / f"AAPL-2024-01-{day}-to-2024-01-{day}.csv"
+            filepath.write_bytes(b"x" * 2000)
+            index.add_entry(
+                CacheEntry(
+                    ticker="AAPL",
+                    start_date=f"2024-01-{day}",
+                    end_date=f"2024-01-{day}",
+                    file_path=str(filepath),
+                    download_time=f"2024-01-{day}T00:00:00",
+                    last_accessed=f"2024-01-{day}T00:00:00",
+                    file_size_bytes=2000,
+                    row_count=1,
+                    checksum="test",
+                )
+            )
+            return filepath.name
+
+        first, second, third = add("01"), add("02"), add("03")
+        evicted = index.enforce_storage_limit()
+        assert [Path(p).name for p in evicted] == [first]
+
+        # Touch the now-oldest entry, then exceed the limit again
+        index.update_last_accessed(second)
+        add("04")
+        evicted = index.enforce_storage_limit()
+        assert [Path(p).name for p in evicted] == [third]
+        assert index.get_entry(second) is not None
+
     def test_enforce_storage_limit_unlimited(self, temp_datas_folder):
         """Test that unlimited storage (max_size_mb=0) doesn't evict."""
         index = CacheIndex(temp_datas_folder, max_size_mb=0)
         now = datetime.now().isoformat()
 
-        for i in range(10):
-            entry = CacheEntry(
-                ticker="AAPL",
-                start_date=f"2024-{i+1:02d}-01",
-                end_date=f"2024-{i+1:02d}-28",
-                file_path=f"{temp_datas_folder}/AAPL-2024-{i+1:02d}-01-to-2024-{i+1:02d}-28.csv",
-                download_time=now,
-                last_accessed=now,
-                file_size_bytes=1000000,  # 1 MB each
-                row_count=10,
-                checksum="test",
-            )
-            index.add_entry(entry)
+        with index.batch():
+            for i in range(10):
+                start, end = f"2024-{i+1:02d}-01", f"2024-{i+1:02d}-28"
+                entry = CacheEntry(
+                    ticker="AAPL",
+                    start_date=start,
+                    end_date=end,
+                    file_path=f"{temp_datas_folder}/AAPL-{start}-to-{end}.csv",
+                    download_time=now,
+                    last_accessed=now,
+                    file_size_bytes=1000000,  # 1 MB each
+                    row_count=10,
+                    checksum="test",
+                )
+                index.add_entry(entry)
 
         evicted = index.enforce_storage_limit()
         assert len(evicted) == 0
@@ -422,17 +604,76 @@ class TestCacheIndex:
         assert index.list_entries()[0].ticker == "MSFT"
 
 
+class TestIntervalTree:
+    """Test cases for the interval tree backing range queries."""
+
+    def test_queries_match_linear_scan(self):
+        """Test overlap and envelope queries against a brute-force scan."""
+        import random
+
+        rng = random.Random(42)
+        intervals = []
+        for i in range(200):
+            start = rng.randint(0, 1000)
+            intervals.append((start, start + rng.randint(0, 100), i))
+        tree = IntervalTree(intervals)
+
+        for _ in range(200):
+            start = rng.randint(-50, 1100)
+            end = start + rng.randint(0, 150)
+            assert tree.overlapping(start, end) == [
+                v for s, e, v in intervals if s <= end and e >= start
+            ]
+            enveloping = [v for s, e, v in intervals if s <= start and e >= end]
+            assert tree.enveloping(start, end) == enveloping
+            assert tree.first_enveloping(start, end) == (enveloping[0] if enveloping else None)
+
+    def test_empty_tree(self):
+        """Test queries on an empty tree."""
+        tree = IntervalTree([])
+        assert len(tree) == 0
+        assert tree.overlapping(0, 10) == []
+        assert tree.enveloping(0, 10) == []
+        assert tree.first_enveloping(0, 10) is None
+
+    def test_covering_entry_follows_index_updates(self, temp_datas_folder):
+        """Test that range queries see entries added and removed after a query."""
+        index = CacheIndex(temp_datas_folder)
+        now = datetime.now().isoformat()
+        assert index.find_covering_entry("AAPL", "2024-02-01", "2024-02-28") is None
+
+        entry = CacheEntry(
+            ticker="AAPL",
+            start_date="2024-01-01",
+            end_date="2024-03-31",
+            file_path=f"{temp_datas_folder}/AAPL-2024-01-01-to-2024-03-31.csv",
+            download_time=now,
+            last_accessed=now,
+            file_size_bytes=1000,
+            row_count=10,
+            checksum="test",
+        )
+        index.add_entry(entry)
+        assert index.find_covering_entry("AAPL", "2024-02-01", "2024-02-28") is entry
+
+        index.remove_entry(Path(entry.file_path).name)
+        assert index.find_overlapping_entries("AAPL", "2024-02-01", "2024-02-28") == []
+
+
 class TestChecksum:
     """Tests for checksum calculation and validation."""
 
     def test_calculate_checksum(self, temp_datas_folder, sample_csv_content):
-        """Test MD5 checksum calculation."""
+        """Test checksum calculation with the default and MD5 algorithms."""
         filepath = Path(temp_datas_folder) / "test.csv"
         filepath.write_text(sample_csv_content)
 
+        md5_checksum = calculate_checksum(str(filepath), "md5")
+        assert len(md5_checksum) == 32  # MD5 hex digest length, without a prefix
+        assert md5_checksum.isalnum()
+
         checksum = calculate_checksum(str(filepath))
-        assert len(checksum) == 32  # MD5 hex digest length
-        assert checksum.isalnum()
+        assert checksum.startswith(f"{CHECKSUM_ALGORITHM}:")
 
         # Same content should produce same checksum
         filepath2 = Path(temp_datas_folder) / "test2.csv"
@@ -440,6 +681,18 @@ class TestChecksum:
         checksum2 = calculate_checksum(str(filepath2))
         assert checksum == checksum2
 
+    def test_scan_file(self, temp_datas_folder, sample_csv_content):
+        """Test that scan_file matches calculate_checksum, line count and size."""
+        filepath = Path(temp_datas_folder) / "scan.csv"
+        for content in (sample_csv_content, sample_csv_content.rstrip("\n"), ""):
+            filepath.write_text(content)
+            for algorithm in (CHECKSUM_ALGORITHM, "md5"):
+                assert scan_file(str(filepath), algorithm) == (
+                    calculate_checksum(str(filepath), algorithm),
+                    len(content.splitlines()),
+                    filepath.stat().st_size,
+                )
+
     def test_validate_cache_entry_valid(self, temp_datas_folder, sample_csv_content):
         """Test validation passes for valid entry."""
         filepath = Path(temp_datas_folder) / "AAPL-2024-01-01-to-2024-03-01.csv"
@@ -460,6 +713,67 @@ class TestChecksum:
 
         assert validate_cache_entry(entry) is True
 
+    def test_checksum_algorithm_prefix(self, temp_datas_folder, sample_csv_content):
+        """Test non-MD5 checksums carry their algorithm and validate with it."""
+        filepath = Path(temp_datas_folder) / "AAPL-2024-01-01-to-2024-03-01.csv"
+        filepath.write_text(sample_csv_content)
+
+        checksum = calculate_checksum(str(filepath), "blake2b")
+        assert checksum.startswith("blake2b:")
+
+        entry = CacheEntry(
+            ticker="AAPL",
+            start_date="2024-01-01",
+            end_date="2024-03-01",
+            file_path=str(filepath),
+            download_time=datetime.now().isoformat(),
+            last_accessed=datetime.now().isoformat(),
+            file_size_bytes=len(sample_csv_content),
+            row_count=3,
+            checksum=checksum,
+        )
+        assert validate_cache_entry(entry) is True
+
+        # Bare digests from older indexes are MD5
+        entry.checksum = calculate_checksum(str(filepath), "md5")
+        assert validate_cache_entry(entry) is True
+
+        entry.checksum = "nosuchhash:abc"
+        assert validate_cache_entry(entry) is False
+
+    def test_validate_all(self, temp_datas_folder, sample_csv_content):
+        """Test concurrent validation removes only invalid entries."""
+        index = CacheIndex(temp_datas_folder)
+        now = datetime.now().isoformat()
+
+        for i, ticker in enumerate(["AAPL", "MSFT", "GOOG", "AMZN"]):
+            filepath = Path(temp_datas_folder) / f"{ticker}-2024-01-01-to-2024-03-01.csv"
+            filepath.write_text(sample_csv_content)
+            index.add_entry(
+                CacheEntry(
+                    ticker=ticker,
+                    start_date="2024-01-01",
+                    end_date="2024-03-01",
+                    file_path=str(filepath),
+                    download_time=now,
+                    last_accessed=now,
+                    file_size_bytes=len(sample_csv_content),
+                    row_count=3,
+                    checksum="bad" if i == 1 else calculate_checksum(str(filepath)),
+                )
+            )
+        (Path(temp_datas_folder) / "GOOG-2024-01-01-to-2024-03-01.csv").unlink()
+
+        removed = index.validate_all(max_workers=4)
+        assert sorted(removed) == [
+            "GOOG-2024-01-01-to-2024-03-01.csv",
+            "MSFT-2024-01-01-to-2024-03-01.csv",
+        ]
+        assert sorted(e.ticker for e in CacheIndex(temp_datas_folder).list_entries()) == [
+            "AAPL",
+            "AMZN",
+        ]
+
     def test_validate_cache_entry_missing_file(self, temp_datas_folder):
         """Test validation fails for missing file."""
         entry = CacheEntry(
@@ -496,6 +810,32 @@ class TestChecksum:
         assert validate_cache_entry(entry) is False
 
 
+    def test_validate_cache_entry_size_fast_path(self, temp_datas_folder, sample_csv_content):
+        """Test that non-strict validation checks size only and size mismatches fail."""
+        filepath = Path(temp_datas_folder) / "AAPL-2024-01-01-to-2024-03-01.csv"
+        filepath.write_text(sample_csv_content)
+
+        entry = CacheEntry(
+            ticker="AAPL",
+            start_date="2024-01-01",
+            end_date="2024-03-01",
+            file_path=str(filepath),
+            download_time=datetime.now().isoformat(),
+            last_accessed=datetime.now().isoformat(),
+            file_size_bytes=len(sample_csv_content),
+            row_count=3,
+            checksum="wrongchecksum123",
+        )
+
+        assert validate_cache_entry(entry, strict=False) is True
+        assert validate_cache_entry(entry) is False
+
+        entry.file_size_bytes += 1
+        entry.checksum = calculate_checksum(str(filepath))
+        assert validate_cache_entry(entry, strict=False) is False
+        assert validate_cache_entry(entry) is False
+
+
 class TestPersistence:
     """Tests for cache index persistence."""
 
@@ -532,3 +872,18 @@ class TestPersistence:
         # Should not raise, just start fresh
         index = CacheIndex(temp_datas_folder)
         assert len(index.list_entries()) == 0
+
+    def test_index_persists_without_orjson(self, temp_datas_folder, sample_entry, monkeypatch):
+        """Test that the stdlib json fallback reads and writes the same format."""
+        import utils.cache_index as cache_index
+
+        index = CacheIndex(temp_datas_folder)
+        index.add_entry(sample_entry)
+
+        monkeypatch.setattr(cache_index, "orjson", None)
+        fallback = CacheIndex(temp_datas_folder)
+        assert fallback.get_entry(Path(sample_entry.file_path).name) == sample_entry
+        fallback.add_entry(sample_entry)
+
+        monkeypatch.undo()
+        assert len(CacheIndex(temp_datas_folder).list_entries()) == 1
@@ -1,7 +1,10 @@
 """Tests for condition evaluator."""
 
 import unittest
-from strategy.expression import ConditionEvaluator, EvaluationError
+
+import numpy as np
+
+from strategy.expression import ConditionEvaluator, EvaluationError, ParseError
 
 
 class TestConditionEvaluator(unittest.TestCase):
@@ -85,6 +88,82 @@ class TestConditionEvaluator(unittest.TestCase):
             self.evaluator.evaluate("(high + low) / 2 > 100", self.context)
         )
     
+    def test_short_circuit(self):
+        """Test that the right operand is skipped once the result is known."""
+        self.assertTrue(self.evaluator.evaluate("price > 100 or nonexistent > 5", self.context))
+        self.assertFalse(self.evaluator.evaluate("price < 100 and nonexistent > 5", self.context))
+    
+    def test_repeated_variables_converted_once(self):
+        """Test that a variable used several times is converted once per evaluation."""
+        class Counted:
+            conversions = 0
+        
+            def __float__(self):
+                Counted.conversions += 1
+                return 101.0
+        
+        context = dict(self.context, close=Counted())
+        self.assertTrue(self.evaluator.evaluate("close > 100 and close < 200", context))
+        self.assertEqual(Counted.conversions, 1)
+        
+        evaluate_all = self.evaluator.compile_many(["close > 100", "close < 100"], isolate_errors=True)
+        self.assertEqual(evaluate_all(context), [True, False])
+        self.assertEqual(Counted.conversions, 2)
+        
+        # Missing repeated variables still short-circuit, and raise once reached
+        self.assertTrue(self.evaluator.evaluate("price > 100 or missing > 5 or missing < 1", context))
+        self.assertFalse(self.evaluator.evaluate("price < 100 and missing > 5 and missing < 1", context))
+        with self.assertRaises(EvaluationError):
+            self.evaluator.evaluate("price > 100 and missing > 5 and missing < 9", context)
+    
+    def test_strategy_path_variable(self):
+        """Test dot-notation variables resolved through the strategy object."""
+        from types import SimpleNamespace
+        context = dict(self.context, strategy=SimpleNamespace(position=SimpleNamespace(size=3)))
+        self.assertTrue(self.evaluator.evaluate("position.size > 2", context))
+    
+    def test_deeply_nested_condition(self):
+        """Test conditions nested beyond the Python parser's limit still evaluate."""
+        condition = "price" + " + 1" * 250 + " > 300"
+        self.assertTrue(self.evaluator.evaluate(condition, self.context))
+    
+    def test_evaluate_series(self):
+        """Test evaluating a condition over arrays matches per-bar evaluation."""
+        closes = [95.0, 100.0, 105.0, 110.0]
+        smas = [99.0, 101.0, 100.0, 112.0]
+        condition = "close > indicators.sma or close / 2 >= 55"
+        
+        result = self.evaluator.evaluate_series(
+            condition, {'close': np.array(closes), 'indicators.sma': np.array(smas)}
+        )
+        expected = [
+            self.evaluator.evaluate(condition, {'close': c, 'indicators.sma': s})
+            for c, s in zip(closes, smas)
+        ]
+        self.assertEqual(result.dtype, bool)
+        self.assertEqual(result.tolist(), expected)
+        
+        with self.assertRaises(EvaluationError):
+            self.evaluator.evaluate_series("close / volume > 1", {
+                'close': np.array(closes), 'volume': np.array([1.0, 0.0, 1.0, 1.0])
+            })
+        with self.assertRaises(EvaluationError):
+            self.evaluator.evaluate_series("missing > 1", {'close': np.array(closes)})
+    
+    def test_compile_many(self):
+        """Test compiling several conditions into one function."""
+        conditions = ["close > 100", "close > open and volume > 10", "open / 2 >= 50"]
+        evaluate_all = self.evaluator.compile_many(conditions)
+        
+        context = {'close': 101.0, 'open': 100.0, 'volume': 5.0}
+        self.assertEqual(
+            [bool(value) for value in evaluate_all(context)],
+            [self.evaluator.evaluate(condition, context) for condition in conditions]
+        )
+        
+        with self.assertRaises(ParseError):
+            self.evaluator.compile_many(["close > 100", "close >"])
+    
     def test_missing_variable(self):
         """Test handling of missing variables."""
         with self.assertRaises(EvaluationError):
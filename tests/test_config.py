@@ -6,7 +6,10 @@ import os
 from pathlib import Path
 import yaml
 
-from utils.config import load_strategy_def, save_strategy_def, load_runtime_config
+from utils.config import (
+    load_strategy_def, save_strategy_def, load_runtime_config, load_strategy_from_file,
+    load_strategy_yaml
+)
 
 
 class TestConfigUtils(unittest.TestCase):
@@ -52,6 +55,39 @@ class TestConfigUtils(unittest.TestCase):
         self.assertIn('sma', loaded['indicators'])
         self.assertEqual(loaded['parameters']['sma_period'], 20)
     
+    def test_load_strategy_yaml(self):
+        """Test reading a strategy YAML file with the configured loader."""
+        strategy_file = self.strategies_dir / 'Loaded.yaml'
+        strategy_file.write_text("name: Loaded\nparameters:\n  period: 5\n")
+        self.assertEqual(
+            load_strategy_yaml(strategy_file),
+            {'name': 'Loaded', 'parameters': {'period': 5}}
+        )
+        
+        empty_file = self.strategies_dir / 'Empty.yaml'
+        empty_file.write_text("")
+        self.assertEqual(load_strategy_yaml(empty_file), {})
+    
+    def test_load_strategy_from_file_cache(self):
+        """Test that unchanged strategy files are served from the in-process cache."""
+        strategy_file = self.strategies_dir / 'Cached.yaml'
+        strategy_file.write_text("name: Cached\nindicators: {}\ntriggers: []\n")
+        
+        loaded = load_strategy_from_file(strategy_file)
+        self.assertEqual(loaded['name'], 'Cached')
+        
+        # Each load returns a fresh copy, so callers may modify it
+        loaded['name'] = 'Modified'
+        self.assertEqual(load_strategy_from_file(strategy_file)['name'], 'Cached')
+        
+        # A changed file is parsed again
+        strategy_file.write_text("name: Renamed\nindicators: {}\ntriggers: []\n")
+        self.assertEqual(load_strategy_from_file(strategy_file)['name'], 'Renamed')
+        
+        # Invalid definitions are returned as parsed
+        strategy_file.write_text("indicators: []\n")
+        self.assertEqual(load_strategy_from_file(strategy_file), {'indicators': []})
+    
     def test_load_runtime_config(self):
         """Test loading runtime configuration."""
         config = {
@@ -76,6 +112,19 @@ class TestConfigUtils(unittest.TestCase):
         self.assertIn('strategy_parameters', loaded)
         self.assertTrue(loaded['analysis'])
     
+    def test_load_runtime_config_cached(self):
+        """Test that repeated loads return independent copies and see edits."""
+        config_file = Path(self.test_dir) / 'cached_config.yaml'
+        config_file.write_text("strategy: First\ntickers: [AAPL]\n")
+        
+        loaded = load_runtime_config(str(config_file))
+        loaded['tickers'].append('MSFT')
+        self.assertEqual(load_runtime_config(str(config_file))['tickers'], ['AAPL'])
+        
+        config_file.write_text("strategy: Second\ntickers: [AAPL]\n")
+        os.utime(config_file, ns=(0, 0))
+        self.assertEqual(load_runtime_config(str(config_file))['strategy'], 'Second')
+    
     def test_load_nonexistent_config(self):
         """Test loading a config file that doesn't exist."""
         with self.assertRaises(FileNotFoundError):
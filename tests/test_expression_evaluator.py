@@ -1,6 +1,9 @@
 """Tests for expression evaluator."""
 
 import unittest
+
+import numpy as np
+
 from strategy.expression import ExpressionEvaluator, EvaluationError
 
 
@@ -65,6 +68,40 @@ class TestExpressionEvaluator(unittest.TestCase):
         result = self.evaluator.evaluate("(2 + 3) * 4", self.context)
         self.assertEqual(result, 20.0)  # (2 + 3) * 4 = 20
     
+    def test_only_referenced_variables_converted(self):
+        """Test that unrelated non-numeric context entries are ignored."""
+        context = dict(self.context, label='not a number')
+        self.assertEqual(self.evaluator.evaluate("high - low", context), 8.0)
+    
+    def test_engines_agree(self):
+        """Test that AST, compiled and series evaluation give the same results."""
+        series_context = {name: np.array([value]) for name, value in self.context.items()}
+        for expression in ("(close + open) / 2", "high - low * 2", "close * 1.02", "close * (2 + 3)"):
+            ast = self.evaluator.parse_expression(expression)
+            expected = ast.evaluate(self.context)
+            self.assertEqual(self.evaluator.evaluate(expression, self.context), expected)
+            self.assertEqual(self.evaluator.evaluate_series(expression, series_context)[0], expected)
+    
+    def test_number_literals_shared(self):
+        """Test that identical literals share one pooled node."""
+        first = self.evaluator.parse_expression("close * 2")
+        second = self.evaluator.parse_expression("open + 2")
+        self.assertIs(first.right, second.right)
+    
+    def test_deeply_nested_expression(self):
+        """Test expressions nested beyond the Python parser's limit still evaluate."""
+        expression = "close" + " + 1" * 250
+        result = self.evaluator.evaluate(expression, self.context)
+        self.assertEqual(result, self.context['close'] + 250)
+    
+    def test_evaluate_series(self):
+        """Test evaluating an expression over arrays with scalar broadcasting."""
+        result = self.evaluator.evaluate_series(
+            "close * 1.02 - high / 2", {'close': np.array([100.0, 200.0]), 'high': 10.0}
+        )
+        self.assertEqual(result.dtype, float)
+        np.testing.assert_allclose(result, [97.0, 199.0])
+    
     def test_missing_variable(self):
         """Test handling of missing variables."""
         with self.assertRaises(EvaluationError):
@@ -75,6 +112,11 @@ class TestExpressionEvaluator(unittest.TestCase):
         with self.assertRaises(EvaluationError):
             self.evaluator.evaluate("close +", self.context)
     
+    def test_invalid_character(self):
+        """Test handling of characters outside the token grammar."""
+        with self.assertRaises(EvaluationError):
+            self.evaluator.evaluate("close $ 2", self.context)
+    
     def test_division_by_zero(self):
         """Test handling of division by zero."""
         with self.assertRaises(EvaluationError):
@@ -52,6 +52,19 @@ class TestParameterUtils(unittest.TestCase):
         
         self.assertEqual(result['indicators']['sma']['period'], 20)
     
+    def test_map_cli_parameters_shared_prefix(self):
+        """Test mapping several parameters under the same parent, via mappings."""
+        config = {
+            'parameters': {'fast': 'indicators.sma.period'},
+            'indicators': {'sma': {'period': 10, 'type': 'simple'}}
+        }
+        
+        dynamic_params = {'fast': '5', 'indicators.sma.type': 'ema', 'risk.stop': '0.5'}
+        result = map_cli_parameters_to_config(config, dynamic_params)
+        
+        self.assertEqual(result['indicators']['sma'], {'period': 5, 'type': 'ema'})
+        self.assertEqual(result['risk'], {'stop': 0.5})
+    
     def test_map_cli_parameters_type_inference(self):
         """Test type inference when mapping parameters."""
         config = {}
@@ -131,6 +144,25 @@ class TestParameterUtils(unittest.TestCase):
         
         result = merge_configs(base, override)
         self.assertEqual(result['level1']['level2']['level3']['key'], 'new')
+    
+    def test_configs_are_copied(self):
+        """Test that results share no mutable state with their inputs."""
+        base = {'nested': {'items': [1, 2]}, 'kept': {'a': 1}}
+        override = {'nested': {'extra': [3]}, 'added': {'b': [4]}}
+        
+        result = merge_configs(base, override)
+        self.assertEqual(list(result), ['nested', 'kept', 'added'])
+        result['nested']['items'].append(99)
+        result['nested']['extra'].append(99)
+        result['kept']['a'] = 2
+        result['added']['b'].append(99)
+        self.assertEqual(base, {'nested': {'items': [1, 2]}, 'kept': {'a': 1}})
+        self.assertEqual(override, {'nested': {'extra': [3]}, 'added': {'b': [4]}})
+        
+        config = {'indicators': {'sma': {'period': 5}}}
+        updated = map_cli_parameters_to_config(config, {'indicators.sma.period': '10'})
+        self.assertEqual(updated['indicators']['sma']['period'], 10)
+        self.assertEqual(config['indicators']['sma']['period'], 5)
 
 
 if __name__ == '__main__':
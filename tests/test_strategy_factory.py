@@ -1,13 +1,26 @@
 """Tests for strategy factory."""
 
 import unittest
+from unittest import mock
 import backtrader as bt
-from strategy.factory import create_indicator, create_strategy, StrategyCreationError
+from strategy.factory import (
+    create_indicator, create_strategy, setup_trigger_system, validate_strategy_config,
+    StrategyCreationError
+)
+from strategy.trigger_system import TriggerSystem
 
 
 class TestStrategyFactory(unittest.TestCase):
     """Test cases for strategy factory functions."""
     
+    def setUp(self):
+        """Start each test with an empty strategy class cache."""
+        create_strategy.cache_clear()
+    
+    def tearDown(self):
+        """Drop strategy classes cached by the test."""
+        create_strategy.cache_clear()
+    
     def test_create_sma_indicator(self):
         """Test creating an SMA indicator."""
         config = {
@@ -33,6 +46,19 @@ class TestStrategyFactory(unittest.TestCase):
         indicator_fn = create_indicator(config, parameters)
         self.assertIsNotNone(indicator_fn)
     
+    def test_create_indicator_reuses_factory(self):
+        """Test that identical indicator configs share one factory."""
+        config = {'type': 'SMA', 'period': 'sma_period'}
+        parameters = {'sma_period': 15}
+        
+        first = create_indicator(config, parameters)
+        second = create_indicator(dict(config), dict(parameters))
+        self.assertIs(first, second)
+        
+        # Unhashable parameter values still produce a factory
+        optimized = create_indicator(config, {'sma_period': [10, 20]})
+        self.assertTrue(callable(optimized))
+    
     def test_create_indicator_missing_type(self):
         """Test creating indicator without type."""
         config = {
@@ -86,6 +112,55 @@ class TestStrategyFactory(unittest.TestCase):
         self.assertIsNotNone(strategy_class)
         self.assertEqual(strategy_class.__name__, 'TestStrategy')
     
+    def test_create_strategy_cached(self):
+        """Test that an unchanged definition returns the cached class."""
+        strategy_def = {
+            'indicators': {'sma': {'type': 'SMA', 'period': 'sma_period'}},
+            'triggers': [],
+            'parameters': {'sma_period': 10}
+        }
+        
+        first = create_strategy('CachedStrategy', strategy_def)
+        self.assertIs(create_strategy('CachedStrategy', dict(strategy_def)), first)
+        
+        changed = dict(strategy_def, parameters={'sma_period': 20})
+        self.assertIsNot(create_strategy('CachedStrategy', changed), first)
+        self.assertIsNot(create_strategy('OtherStrategy', strategy_def), first)
+        
+        create_strategy.cache_clear()
+        self.assertIsNot(create_strategy('CachedStrategy', strategy_def), first)
+    
+    def test_create_strategy_cache_bounded(self):
+        """Test that the class cache evicts old definitions and skips unkeyable ones."""
+        with mock.patch('strategy.factory._STRATEGY_CACHE_SIZE', 2):
+            first = create_strategy('First', {'triggers': []})
+            create_strategy('Second', {'triggers': []})
+            create_strategy('Third', {'triggers': []})
+            self.assertIsNot(create_strategy('First', {'triggers': []}), first)
+        
+        # Mixed-type keys cannot be sorted into a cache key; the class is still built
+        strategy_def = {'triggers': [], 'metadata': {1: 'one', 'two': 2}}
+        strategy_class = create_strategy('Unkeyed', strategy_def)
+        self.assertEqual(strategy_class.__name__, 'Unkeyed')
+    
+    def test_create_strategy_copies_definition(self):
+        """Test that a cached class does not share the caller's definition."""
+        trigger = {
+            'condition': 'close > 100',
+            'actions': [{'name': 'buy', 'type': 'TradeAction', 'signal': 'Long'}]
+        }
+        strategy_def = {'triggers': [trigger]}
+        
+        strategy_class = create_strategy('CopiedStrategy', strategy_def)
+        trigger['condition'] = 'close < 100'
+        
+        self.assertEqual(strategy_class._triggers_config[0]['condition'], 'close > 100')
+        
+        # Naming unnamed triggers at setup changes the class's copy only
+        setup_trigger_system(TriggerSystem(), strategy_class._triggers_config)
+        self.assertEqual(strategy_class._triggers_config[0]['name'], 'UnnamedTrigger_0')
+        self.assertNotIn('name', trigger)
+    
     def test_create_strategy_invalid_config(self):
         """Test creating strategy with invalid config."""
         with self.assertRaises(StrategyCreationError):
@@ -117,6 +192,22 @@ class TestStrategyFactory(unittest.TestCase):
         
         with self.assertRaises(StrategyCreationError):
             create_strategy('TestStrategy', strategy_def)
+    
+    def test_validate_strategy_config(self):
+        """Test validation issues are reported for each invalid section."""
+        config = {
+            'name': 'TestStrategy',
+            'indicators': {'sma': {'period': 20}},
+            'triggers': [{'condition': '', 'actions': []}]
+        }
+        
+        self.assertEqual(len(validate_strategy_config(config)), 3)
+        self.assertEqual(validate_strategy_config({'name': 'Valid'}), [])
+        self.assertEqual(validate_strategy_config(None), ["Configuration must be a dictionary"])
+        
+        # The production skip flag only applies when triggers are built for a run
+        with mock.patch('strategy.trigger_system.SKIP_VALIDATION', True):
+            self.assertEqual(len(validate_strategy_config(config)), 3)
 
 
 if __name__ == '__main__':
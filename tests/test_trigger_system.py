@@ -1,6 +1,8 @@
 """Tests for trigger system."""
 
 import unittest
+from unittest import mock
+from strategy.expression import EvaluationError
 from strategy.trigger_system import TriggerSystem, Trigger, TriggerAction, TriggerValidationError
 
 
@@ -19,6 +21,137 @@ class TestTriggerSystem(unittest.TestCase):
         self.trigger_system.add_trigger(trigger)
         self.assertIn("test_trigger", self.trigger_system.triggers.keys())
     
+    def test_add_trigger_compiles_condition(self):
+        """Test that adding a trigger keeps its compiled condition."""
+        action = TriggerAction(name="buy", type="TradeAction", parameters={})
+        trigger = Trigger(name="test_trigger", condition="close > 100", actions=[action])
+        
+        self.trigger_system.add_trigger(trigger)
+        self.assertTrue(callable(trigger.compiled))
+        self.assertTrue(self.trigger_system.evaluate_trigger(trigger, {'close': 101.0}))
+        self.assertFalse(self.trigger_system.evaluate_trigger(trigger, {'close': 99.0}))
+        with self.assertRaises(EvaluationError):
+            self.trigger_system.evaluate_trigger(trigger, {'close': 'n/a'})
+    
+    def test_evaluate_all(self):
+        """Test evaluating all trigger conditions at once."""
+        action = TriggerAction(name="buy", type="TradeAction")
+        self.trigger_system.add_trigger(Trigger("above", "close > 100", [action]))
+        self.trigger_system.add_trigger(Trigger("below", "close < 100 or volume > 5", [action]))
+        
+        context = {'close': 101.0, 'volume': 1.0}
+        self.assertEqual(
+            self.trigger_system.evaluate_all(context), {'above': True, 'below': False}
+        )
+        
+        # Adding and removing triggers recompiles the combined function
+        self.trigger_system.add_trigger(Trigger("custom", lambda ctx: True, [action]))
+        self.trigger_system.remove_trigger("above")
+        self.assertEqual(
+            self.trigger_system.evaluate_all(context), {'below': False, 'custom': True}
+        )
+        
+        # A failing condition is left out without stopping the others
+        self.trigger_system.add_trigger(Trigger("broken", "close / volume > 1", [action]))
+        self.assertEqual(
+            self.trigger_system.evaluate_all({'close': 101.0, 'volume': 0.0}),
+            {'below': False, 'custom': True}
+        )
+        
+        # Disabled triggers are not evaluated
+        self.trigger_system.disable_trigger("custom")
+        self.assertEqual(
+            self.trigger_system.evaluate_all(context), {'below': False, 'broken': True}
+        )
+    
+    def test_evaluate_all_isolates_errors(self):
+        """Test that one bad condition does not stop the batch of string conditions."""
+        action = TriggerAction(name="buy", type="TradeAction")
+        self.trigger_system.add_trigger(Trigger("ratio", "close / volume > 1", [action]))
+        self.trigger_system.add_trigger(Trigger("above", "close > 100", [action]))
+        
+        self.assertEqual(
+            self.trigger_system.evaluate_all({'close': 101.0, 'volume': 0.0}), {'above': True}
+        )
+        with self.assertRaises(EvaluationError):
+            self.trigger_system.evaluate_trigger(
+                self.trigger_system.get_trigger("ratio"), {'close': 101.0, 'volume': 0.0}
+            )
+        
+        # Conditions that do not parse are left out too
+        with mock.patch('strategy.trigger_system.SKIP_VALIDATION', True):
+            self.trigger_system.add_trigger(Trigger("invalid", "close >>> 1", [action]))
+        self.assertEqual(
+            self.trigger_system.evaluate_all({'close': 101.0, 'volume': 1.0}),
+            {'ratio': True, 'above': True}
+        )
+    
+    def test_evaluate_all_exclude_and_errors(self):
+        """Test excluding triggers and collecting the errors of failed conditions."""
+        action = TriggerAction(name="buy", type="TradeAction")
+        calls = []
+        
+        def failing(context):
+            calls.append(context)
+            raise ValueError("bad data")
+        
+        self.trigger_system.add_trigger(Trigger("above", "close > 100", [action]))
+        self.trigger_system.add_trigger(Trigger("failing", failing, [action]))
+        with mock.patch('strategy.trigger_system.SKIP_VALIDATION', True):
+            self.trigger_system.add_trigger(Trigger("invalid", "close >>> 1", [action]))
+        
+        errors = {}
+        context = {'close': 101.0}
+        self.assertEqual(self.trigger_system.evaluate_all(context, errors=errors), {'above': True})
+        self.assertEqual(set(errors), {'failing', 'invalid'})
+        self.assertIsInstance(errors['failing'], ValueError)
+        self.assertEqual(len(calls), 1)
+        
+        # Excluded triggers are neither evaluated nor reported
+        errors = {}
+        self.assertEqual(
+            self.trigger_system.evaluate_all(context, exclude={'above', 'failing'}, errors=errors),
+            {}
+        )
+        self.assertEqual(set(errors), {'invalid'})
+        self.assertEqual(len(calls), 1)
+    
+    def test_skip_validation_defers_compile(self):
+        """Test that SKIP_VALIDATION defers condition compilation to evaluation."""
+        action = TriggerAction(name="buy", type="TradeAction")
+        trigger = Trigger(name="test_trigger", condition="close >>> 100", actions=[action])
+        
+        with mock.patch('strategy.trigger_system.SKIP_VALIDATION', True):
+            self.trigger_system.add_trigger(trigger)
+        self.assertIsNone(trigger.compiled)
+        with self.assertRaises(EvaluationError):
+            self.trigger_system.evaluate_trigger(trigger, {'close': 101.0})
+    
+    def test_action_parameters_from_config(self):
+        """Test that action parameters are materialized from the raw config once."""
+        config = {'name': 'buy', 'type': 'TradeAction', 'signal': 'Long'}
+        action = TriggerAction(name="buy", type="TradeAction", parameters=None, config=config)
+        
+        self.assertIsNone(action.parameters)
+        parameters = action.get_parameters()
+        self.assertEqual(parameters, {'signal': 'Long'})
+        self.assertIs(action.get_parameters(), parameters)
+    
+    def test_action_requires_parameters_or_config(self):
+        """Test that an action needs either parameters or a config."""
+        with self.assertRaises(TriggerValidationError):
+            TriggerAction(name="buy", type="TradeAction", parameters=None)
+    
+    def test_trigger_dataclasses_use_slots(self):
+        """Test that triggers and actions carry no per-instance __dict__."""
+        action = TriggerAction(name="buy", type="TradeAction")
+        trigger = Trigger(name="test_trigger", condition="close > 100", actions=[action])
+        
+        self.assertFalse(hasattr(action, '__dict__'))
+        self.assertFalse(hasattr(trigger, '__dict__'))
+        with self.assertRaises(AttributeError):
+            trigger.unknown = True
+    
     def test_add_duplicate_trigger(self):
         """Test adding duplicate trigger names."""
         action = TriggerAction(name="buy", type="TradeAction", parameters={})
@@ -29,6 +162,18 @@ class TestTriggerSystem(unittest.TestCase):
         
         with self.assertRaises(TriggerValidationError):
             self.trigger_system.add_trigger(trigger2)
+        with self.assertRaises(TriggerValidationError):
+            self.trigger_system.add_trigger(trigger1)
+        self.assertIs(self.trigger_system.triggers["test_trigger"], trigger1)
+    
+    def test_add_invalid_trigger_not_kept(self):
+        """Test that a trigger with invalid syntax is not left in the system."""
+        action = TriggerAction(name="buy", type="TradeAction", parameters={})
+        trigger = Trigger(name="bad_trigger", condition="close >", actions=[action])
+        
+        with self.assertRaises(TriggerValidationError):
+            self.trigger_system.add_trigger(trigger)
+        self.assertNotIn("bad_trigger", self.trigger_system.triggers)
     
     def test_remove_trigger(self):
         """Test removing a trigger."""
@@ -89,6 +234,17 @@ class TestTriggerSystem(unittest.TestCase):
         with self.assertRaises(TriggerValidationError):
             self.trigger_system.validate_condition("close >")
     
+    def test_validate_condition_raises_fresh_errors(self):
+        """Test that a cached syntax error is raised as a new exception each time."""
+        causes = []
+        for _ in range(2):
+            with self.assertRaises(TriggerValidationError) as cm:
+                self.trigger_system.validate_condition("close >")
+            causes.append(cm.exception.__cause__)
+        
+        self.assertIsNot(causes[0], causes[1])
+        self.assertEqual(str(causes[0]), str(causes[1]))
+    
     def test_trigger_with_multiple_actions(self):
         """Test triggers with multiple actions."""
         action1 = TriggerAction(name="buy", type="TradeAction", parameters={})
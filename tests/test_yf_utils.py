@@ -0,0 +1,431 @@
+"""Tests for Yahoo Finance fetching and caching, with downloads mocked."""
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from utils import yf_utils
+from utils.cache_index import CacheEntry, CacheIndex, calculate_checksum
+
+
+def make_history(start="2024-01-02", periods=3):
+    """Build a frame shaped like Ticker.history output."""
+    index = pd.date_range(start, periods=periods, freq="D", tz="America/New_York", name="Date")
+    return pd.DataFrame(
+        {
+            "Open": [100.0 + i for i in range(periods)],
+            "High": [101.0 + i for i in range(periods)],
+            "Low": [99.0 + i for i in range(periods)],
+            "Close": [100.5 + i for i in range(periods)],
+            "Adj Close": [100.5 + i for i in range(periods)],
+            "Volume": [1000.0 * (i + 1) for i in range(periods)],
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def datas_folder(tmp_path):
+    """A data folder with no cache index loaded for it yet."""
+    yf_utils.get_cache_index.cache_clear()
+    yf_utils.clear_negative_cache()
+    yield str(tmp_path / "datas")
+    yf_utils.get_cache_index.cache_clear()
+    yf_utils.clear_negative_cache()
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """
+    Replace the Yahoo Finance download, recording the tickers requested.
+
+    FAIL raises like a failed request; tickers starting with EMPTY get no data.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def fake_download(ticker, start, end):
+        with lock:
+            calls.append(ticker)
+        if ticker == "FAIL":
+            raise ValueError(f"Failed to fetch data for {ticker} from Yahoo Finance")
+        if ticker.startswith("EMPTY"):
+            return pd.DataFrame()
+        return make_history()
+
+    monkeypatch.setattr(yf_utils, "_download_history", fake_download)
+    return calls
+
+
+class TestFetchAndSaveData:
+    """Tests for fetch_and_save_data."""
+
+    def test_writes_backtrader_csv(self, datas_folder, downloads):
+        """Test that downloaded data is written as a Backtrader CSV and indexed."""
+        path = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+
+        lines = Path(path).read_text().splitlines()
+        assert lines[0] == "Date,Open,High,Low,Close,Adj Close,Volume"
+        assert lines[1] == "2024-01-02,100.0,101.0,99.0,100.5,100.5,1000"
+        assert len(lines) == 4
+
+        entry = yf_utils.get_cache_index(datas_folder).get_entry(Path(path).name)
+        assert entry.row_count == 3
+
+    def test_cached_data_reused(self, datas_folder, downloads):
+        """Test that a second request is served from the cache."""
+        first = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        second = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+
+        assert first == second
+        assert downloads == ["AAPL"]
+
+        yf_utils.fetch_and_save_data(
+            "AAPL", "2024-01-01", "2024-01-05", datas_folder, force_download=True
+        )
+        assert downloads == ["AAPL", "AAPL"]
+
+    def test_cached_file_validated_without_lock(self, datas_folder, downloads, monkeypatch):
+        """Test that cached files are checked outside the lock and bad ones re-fetched."""
+        path = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        lock = RecordingLock()
+        monkeypatch.setattr(yf_utils, "_cache_index_lock", lock)
+        validate_cache_entry = yf_utils.validate_cache_entry
+        depths = []
+
+        def recording(entry, *args, **kwargs):
+            depths.append(lock.depth)
+            return validate_cache_entry(entry, *args, **kwargs)
+
+        monkeypatch.setattr(yf_utils, "validate_cache_entry", recording)
+        assert yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder) == path
+        assert downloads == ["AAPL"]
+
+        # Same size, different content: the checksum no longer matches
+        content = Path(path).read_text()
+        Path(path).write_text(content.replace("100.5", "100.6"))
+        yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        assert downloads == ["AAPL", "AAPL"]
+        assert depths == [0, 0]
+
+    def test_evicted_files_deleted_without_lock(self, datas_folder, downloads, monkeypatch):
+        """Test that files evicted to make room are deleted after the lock is released."""
+        path = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        lock = RecordingLock()
+        monkeypatch.setattr(yf_utils, "_cache_index_lock", lock)
+        monkeypatch.setattr(CacheIndex, "get_total_size_bytes", lambda self: 2 * 1024 * 1024)
+        unlink = os.unlink
+        depths = []
+
+        def recording(file_path):
+            depths.append(lock.depth)
+            unlink(file_path)
+
+        monkeypatch.setattr(os, "unlink", recording)
+        yf_utils.fetch_and_save_data(
+            "MSFT", "2024-01-01", "2024-01-05", datas_folder, max_cache_size_mb=1
+        )
+
+        assert depths == [0]
+        assert not Path(path).exists()
+        assert sorted(p.name for p in Path(datas_folder).glob("*.csv*")) == [
+            "MSFT-2024-01-01-to-2024-01-05.csv"
+        ]
+
+
+class TestEmptyResponses:
+    """Tests for remembering downloads that returned no data."""
+
+    def fetch(self, ticker, datas_folder, **kwargs):
+        """Fetch a ticker, expecting the fetch to fail."""
+        with pytest.raises(ValueError):
+            yf_utils.fetch_and_save_data(ticker, "2024-01-01", "2024-01-05", datas_folder, **kwargs)
+
+    def test_empty_response_remembered(self, datas_folder, downloads):
+        """Test that a ticker without data is not requested again right away."""
+        self.fetch("EMPTY", datas_folder)
+        self.fetch("EMPTY", datas_folder)
+        assert downloads == ["EMPTY"]
+
+    def test_force_download_bypasses(self, datas_folder, downloads):
+        """Test that force_download requests a remembered empty ticker again."""
+        self.fetch("EMPTY", datas_folder)
+        self.fetch("EMPTY", datas_folder, force_download=True)
+        assert downloads == ["EMPTY", "EMPTY"]
+
+    def test_expired_responses_dropped(self, datas_folder, downloads, monkeypatch):
+        """Test that expired empty responses are requested again and pruned."""
+        monkeypatch.setattr(yf_utils, "EMPTY_RESPONSE_TTL", 0.0)
+        self.fetch("EMPTY", datas_folder)
+        self.fetch("EMPTY", datas_folder)
+        assert downloads == ["EMPTY", "EMPTY"]
+
+        self.fetch("EMPTY2", datas_folder)
+        assert list(yf_utils._empty_responses) == [("EMPTY2", "2024-01-01", "2024-01-05")]
+
+    def test_request_errors_not_remembered(self, datas_folder, downloads):
+        """Test that a failed request is retried on the next fetch."""
+        self.fetch("FAIL", datas_folder)
+        self.fetch("FAIL", datas_folder)
+        assert downloads == ["FAIL", "FAIL"]
+        assert not yf_utils._empty_responses
+
+    def test_download_history_separates_errors(self, monkeypatch):
+        """Test that only a confirmed missing ticker comes back as an empty frame."""
+        import yfinance
+
+        requests = []
+
+        class FakeTicker:
+            def __init__(self, ticker):
+                self.ticker = ticker
+
+            def history(self, **kwargs):
+                requests.append(kwargs)
+                if self.ticker == "GONE":
+                    raise yfinance.exceptions.YFTickerMissingError(self.ticker, "possibly delisted")
+                raise RuntimeError("rate limited")
+
+        monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+
+        assert yf_utils._download_history("GONE", "2024-01-01", "2024-01-05").empty
+        with pytest.raises(ValueError):
+            yf_utils._download_history("AAPL", "2024-01-01", "2024-01-05")
+        assert all(kwargs["raise_errors"] for kwargs in requests)
+
+
+class TestFetchMultipleTickers:
+    """Tests for concurrent fetching with fetch_multiple_tickers."""
+
+    def test_results_follow_input_order(self, datas_folder, downloads):
+        """Test that results keep the input order and duplicates are fetched once."""
+        tickers = ["MSFT", "AAPL", "GOOG", "AAPL", "AMZN"]
+        result = yf_utils.fetch_multiple_tickers(
+            tickers, "2024-01-01", "2024-01-05", datas_folder, threads=4
+        )
+
+        assert list(result) == ["MSFT", "AAPL", "GOOG", "AMZN"]
+        assert sorted(downloads) == ["AAPL", "AMZN", "GOOG", "MSFT"]
+        for ticker, path in result.items():
+            assert Path(path).name == f"{ticker}-2024-01-01-to-2024-01-05.csv"
+
+    def test_failed_ticker_skipped(self, datas_folder, downloads):
+        """Test that a failing ticker is left out without affecting the others."""
+        result = yf_utils.fetch_multiple_tickers(
+            ["AAPL", "FAIL", "MSFT"], "2024-01-01", "2024-01-05", datas_folder
+        )
+        assert list(result) == ["AAPL", "MSFT"]
+
+    def test_concurrent_fetches_all_indexed(self, datas_folder, downloads):
+        """Test that every concurrently fetched file ends up in the saved index."""
+        tickers = [f"T{i}" for i in range(16)]
+        yf_utils.fetch_multiple_tickers(tickers, "2024-01-01", "2024-01-05", datas_folder)
+
+        reloaded = CacheIndex(datas_folder)
+        assert sorted(entry.ticker for entry in reloaded.list_entries()) == sorted(tickers)
+
+    def test_empty_ticker_list(self, datas_folder, downloads):
+        """Test that no tickers gives an empty result without downloading."""
+        assert yf_utils.fetch_multiple_tickers([], "2024-01-01", "2024-01-05", datas_folder) == {}
+        assert downloads == []
+
+
+class RecordingLock:
+    """Reentrant lock that tracks how deeply it is currently held."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.depth = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.depth -= 1
+        self._lock.release()
+
+
+class TestCacheIndexLifecycle:
+    """Tests for loaded cache indexes and their deferred writes."""
+
+    def _cache_hit(self, datas_folder):
+        """Fetch a file twice, leaving the second access time unwritten."""
+        path = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        cache_index = yf_utils.get_cache_index(datas_folder)
+        filename = Path(path).name
+        accessed = cache_index.get_entry(filename).last_accessed
+        assert CacheIndex(datas_folder).get_entry(filename).last_accessed != accessed
+        return cache_index, filename, accessed
+
+    def test_evicted_index_flushed(self, datas_folder, downloads, tmp_path, monkeypatch):
+        """Test that an index dropped to make room writes its deferred changes."""
+        monkeypatch.setattr(yf_utils, "MAX_CACHE_INDEXES", 1)
+        cache_index, filename, accessed = self._cache_hit(datas_folder)
+
+        yf_utils.get_cache_index(str(tmp_path / "other"))
+
+        assert cache_index not in yf_utils._flush_timers
+        assert CacheIndex(datas_folder).get_entry(filename).last_accessed == accessed
+        assert yf_utils.get_cache_index(datas_folder) is not cache_index
+
+    def test_flush_all_cache_indexes(self, datas_folder, downloads):
+        """Test that the exit hook writes deferred changes of loaded indexes."""
+        cache_index, filename, accessed = self._cache_hit(datas_folder)
+
+        yf_utils._flush_all_cache_indexes()
+
+        assert cache_index not in yf_utils._flush_timers
+        assert CacheIndex(datas_folder).get_entry(filename).last_accessed == accessed
+
+    def test_flush_error_logged(self, datas_folder, downloads, monkeypatch, caplog):
+        """Test that a failed deferred write is logged instead of raised."""
+        cache_index, _, _ = self._cache_hit(datas_folder)
+
+        def failing_write():
+            raise OSError("disk full")
+
+        monkeypatch.setattr(cache_index, "_write", failing_write)
+        yf_utils._flush_cache_index(cache_index)
+
+        assert cache_index not in yf_utils._flush_timers
+        assert "disk full" in caplog.text
+
+    def test_management_functions_hold_lock(self, datas_folder, downloads, monkeypatch):
+        """Test that cache management functions use the index under the lock."""
+        yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        lock = RecordingLock()
+        monkeypatch.setattr(yf_utils, "_cache_index_lock", lock)
+
+        depths = []
+        for name in ("list_entries", "get_stats", "clear"):
+            method = getattr(CacheIndex, name)
+
+            def recording(self, *args, _method=method, **kwargs):
+                depths.append(lock.depth)
+                return _method(self, *args, **kwargs)
+
+            monkeypatch.setattr(CacheIndex, name, recording)
+
+        assert len(yf_utils.list_cached_data(datas_folder)) == 1
+        assert yf_utils.get_cache_stats(datas_folder)["entry_count"] == 1
+        assert yf_utils.clear_cache(datas_folder) == 1
+        assert len(depths) >= 3 and all(depths)
+
+
+class TestLegacyIndexing:
+    """Tests for indexing data files that exist without an index entry."""
+
+    CSV = "Date,Open,High,Low,Close,Adj Close,Volume\n2024-01-02,1.0,1.0,1.0,1.0,1.0,10\n"
+
+    def _legacy_file(self, datas_folder):
+        """Write a data file the index does not know about."""
+        data_filename = Path(datas_folder) / "AAPL-2024-01-01-to-2024-01-05.csv"
+        data_filename.parent.mkdir(parents=True, exist_ok=True)
+        data_filename.write_text(self.CSV)
+        return data_filename
+
+    def test_legacy_file_used_and_indexed(self, datas_folder, downloads):
+        """Test that an unindexed file is used as-is and indexed in the background."""
+        data_filename = self._legacy_file(datas_folder)
+        path = yf_utils.fetch_and_save_data("AAPL", "2024-01-01", "2024-01-05", datas_folder)
+        assert path == str(data_filename)
+        assert downloads == []
+
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and not thread.daemon:
+                thread.join()
+        entry = CacheIndex(datas_folder).get_entry(data_filename.name)
+        assert entry.row_count == 1
+        assert not yf_utils._legacy_indexing
+
+    def test_file_rewritten_during_scan_not_indexed(self, datas_folder, monkeypatch):
+        """Test that a scan of a file rewritten meanwhile does not add a stale entry."""
+        data_filename = self._legacy_file(datas_folder)
+        cache_index = yf_utils.get_cache_index(datas_folder)
+        scan_file = yf_utils.scan_file
+
+        def scan_then_rewrite(file_path):
+            result = scan_file(file_path)
+            data_filename.write_text(self.CSV + "2024-01-03,2.0,2.0,2.0,2.0,2.0,20\n")
+            return result
+
+        monkeypatch.setattr(yf_utils, "scan_file", scan_then_rewrite)
+        yf_utils._index_legacy_file("AAPL", "2024-01-01", "2024-01-05", data_filename)
+        assert cache_index.get_entry(data_filename.name) is None
+
+    def test_entry_added_during_scan_kept(self, datas_folder, monkeypatch):
+        """Test that an entry added by a download during the scan is not overwritten."""
+        data_filename = self._legacy_file(datas_folder)
+        cache_index = yf_utils.get_cache_index(datas_folder)
+        now = datetime.now().isoformat()
+        downloaded = CacheEntry(
+            ticker="AAPL",
+            start_date="2024-01-01",
+            end_date="2024-01-05",
+            file_path=str(data_filename),
+            download_time=now,
+            last_accessed=now,
+            file_size_bytes=len(self.CSV),
+            row_count=1,
+            checksum=calculate_checksum(str(data_filename)),
+            source="yfinance",
+        )
+        scan_file = yf_utils.scan_file
+
+        def scan_while_downloading(file_path):
+            result = scan_file(file_path)
+            cache_index.add_entry(downloaded)
+            return result
+
+        monkeypatch.setattr(yf_utils, "scan_file", scan_while_downloading)
+        yf_utils._index_legacy_file("AAPL", "2024-01-01", "2024-01-05", data_filename)
+        assert cache_index.get_entry(data_filename.name) is downloaded
+
+    def test_index_dropped_during_scan(self, datas_folder, monkeypatch):
+        """Test that a scan finishing after its index was dropped uses the current one."""
+        data_filename = self._legacy_file(datas_folder)
+        dropped = yf_utils.get_cache_index(datas_folder)
+        scan_file = yf_utils.scan_file
+
+        def scan_while_clearing(file_path):
+            result = scan_file(file_path)
+            yf_utils.get_cache_index.cache_clear()
+            return result
+
+        monkeypatch.setattr(yf_utils, "scan_file", scan_while_clearing)
+        yf_utils._index_legacy_file("AAPL", "2024-01-01", "2024-01-05", data_filename)
+
+        assert dropped.get_entry(data_filename.name) is None
+        assert yf_utils.get_cache_index(datas_folder).get_entry(data_filename.name) is not None
+        assert CacheIndex(datas_folder).get_entry(data_filename.name) is not None
+
+
+def test_estimate_file_size(tmp_path):
+    """Test that new tickers are estimated from the whole cache."""
+    cache_index = CacheIndex(str(tmp_path))
+    assert yf_utils._estimate_file_size(cache_index, "AAPL") == 0
+
+    for ticker, size in (("AAPL", 100), ("AAPL", 300), ("MSFT", 1000)):
+        cache_index.add_entry(
+            CacheEntry(
+                ticker=ticker,
+                start_date="2024-01-01",
+                end_date="2024-01-05",
+                file_path=str(tmp_path / f"{ticker}-{size}.csv"),
+                download_time="2024-01-01T00:00:00",
+                last_accessed="2024-01-01T00:00:00",
+                file_size_bytes=size,
+                row_count=1,
+                checksum="test",
+            )
+        )
+
+    assert yf_utils._estimate_file_size(cache_index, "AAPL") == 200
+    assert yf_utils._estimate_file_size(cache_index, "GOOG") == 466
@@ -1,6 +1,107 @@
 """Analysis and formatting utilities for backtest results."""
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+# Shared read-only default for missing nested results, instead of a new {} per lookup
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Trade report fields: template placeholder -> key path into TradeAnalyzer results.
+# Missing keys read as 0.
+_TRADE_FIELDS = {
+    'total': ('total', 'total'),
+    'open': ('total', 'open'),
+    'closed': ('total', 'closed'),
+    'won': ('won', 'total'),
+    'lost': ('lost', 'total'),
+    'streak_won_current': ('streak', 'won', 'current'),
+    'streak_won_longest': ('streak', 'won', 'longest'),
+    'streak_lost_current': ('streak', 'lost', 'current'),
+    'streak_lost_longest': ('streak', 'lost', 'longest'),
+    'gross_total': ('pnl', 'gross', 'total'),
+    'gross_average': ('pnl', 'gross', 'average'),
+    'net_total': ('pnl', 'net', 'total'),
+    'net_average': ('pnl', 'net', 'average'),
+    'won_pnl_total': ('won', 'pnl', 'total'),
+    'won_pnl_average': ('won', 'pnl', 'average'),
+    'won_pnl_max': ('won', 'pnl', 'max'),
+    'lost_pnl_total': ('lost', 'pnl', 'total'),
+    'lost_pnl_average': ('lost', 'pnl', 'average'),
+    'lost_pnl_max': ('lost', 'pnl', 'max'),
+    'long_total': ('long', 'total'),
+    'long_won': ('long', 'won'),
+    'long_lost': ('long', 'lost'),
+    'short_total': ('short', 'total'),
+    'short_won': ('short', 'won'),
+    'short_lost': ('short', 'lost'),
+    'len_average': ('len', 'average'),
+    'len_max': ('len', 'max'),
+    'len_min': ('len', 'min'),
+    'len_won_average': ('len', 'won', 'average'),
+    'len_lost_average': ('len', 'lost', 'average'),
+}
+
+# Report layout, filled in with str.format_map
+_TRADE_TEMPLATE = "\n".join([
+    "\n===== TRADE ANALYSIS =====",
+    "Total Trades: {total} (Open: {open}, Closed: {closed})",
+    "\n----- Win/Loss Statistics -----",
+    "Won Trades: {won} ({win_rate:.2f}%)",
+    "Lost Trades: {lost} ({loss_rate:.2f}%)",
+    "\n----- Win/Loss Streaks -----",
+    "Current Winning Streak: {streak_won_current}",
+    "Longest Winning Streak: {streak_won_longest}",
+    "Current Losing Streak: {streak_lost_current}",
+    "Longest Losing Streak: {streak_lost_longest}",
+    "\n----- Profit/Loss Information -----",
+    "Gross Profit: ${gross_total:.2f}",
+    "Average Profit per Trade: ${gross_average:.2f}",
+    "Net Profit: ${net_total:.2f}",
+    "Average Net Profit per Trade: ${net_average:.2f}",
+    "\n----- Won Trades -----",
+    "Total PnL: ${won_pnl_total:.2f}",
+    "Average PnL: ${won_pnl_average:.2f}",
+    "Max PnL: ${won_pnl_max:.2f}",
+    "\n----- Lost Trades -----",
+    "Total PnL: ${lost_pnl_total:.2f}",
+    "Average PnL: ${lost_pnl_average:.2f}",
+    "Max Loss: ${lost_pnl_max_abs:.2f}",
+    "\n----- Long/Short Breakdown -----",
+    "Long Trades: {long_total} (Won: {long_won}, Lost: {long_lost})",
+    "Short Trades: {short_total} (Won: {short_won}, Lost: {short_lost})",
+    "\n----- Trade Duration -----",
+    "Average Trade Length: {len_average:.1f} bars",
+    "Longest Trade: {len_max} bars",
+    "Shortest Trade: {len_min} bars",
+    "Average Winning Trade Length: {len_won_average:.1f} bars",
+    "Average Losing Trade Length: {len_lost_average:.1f} bars",
+])
+
+
+def _group_trade_fields() -> Dict[Tuple[str, ...], List[Tuple[str, str]]]:
+    """Group report fields by parent path, keeping (name, leaf key) pairs."""
+    groups: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+    for name, path in _TRADE_FIELDS.items():
+        groups.setdefault(path[:-1], []).append((name, path[-1]))
+    return groups
+
+
+# Fields grouped by parent path, so each nested dict is looked up once per report
+_TRADE_FIELD_GROUPS = _group_trade_fields()
+
+
+def _extract_trade_fields(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Look up every report field in the analysis, defaulting missing keys to 0."""
+    values = {}
+    for parent, leaves in _TRADE_FIELD_GROUPS.items():
+        node = analysis
+        for key in parent:
+            node = node.get(key, _EMPTY)
+        get = node.get
+        for name, key in leaves:
+            values[name] = get(key, 0)
+    return values
 
 
 def format_trade_analysis(analysis: Dict[str, Any]) -> str:
@@ -13,84 +114,51 @@ def format_trade_analysis(analysis: Dict[str, Any]) -> str:
     Returns:
         Formatted string with trade statistics
     """
-    output = []
+    values = _extract_trade_fields(analysis)
     
-    # Overall statistics
-    output.append("\n===== TRADE ANALYSIS =====")
-    total = analysis.get('total', {})
-    output.append(
-        f"Total Trades: {total.get('total', 0)} "
-        f"(Open: {total.get('open', 0)}, Closed: {total.get('closed', 0)})"
-    )
-    
-    # Win/Loss stats
-    won = analysis.get('won', {})
-    lost = analysis.get('lost', {})
-    total_closed = won.get('total', 0) + lost.get('total', 0)
-    win_rate = (won.get('total', 0) / total_closed * 100) if total_closed > 0 else 0
-    
-    output.append("\n----- Win/Loss Statistics -----")
-    output.append(f"Won Trades: {won.get('total', 0)} ({win_rate:.2f}%)")
-    output.append(f"Lost Trades: {lost.get('total', 0)} ({100-win_rate:.2f}%)")
-    
-    # Winning streak information
-    streak = analysis.get('streak', {})
-    output.append("\n----- Win/Loss Streaks -----")
-    output.append(f"Current Winning Streak: {streak.get('won', {}).get('current', 0)}")
-    output.append(f"Longest Winning Streak: {streak.get('won', {}).get('longest', 0)}")
-    output.append(f"Current Losing Streak: {streak.get('lost', {}).get('current', 0)}")
-    output.append(f"Longest Losing Streak: {streak.get('lost', {}).get('longest', 0)}")
-    
-    # PnL information
-    pnl = analysis.get('pnl', {})
-    output.append("\n----- Profit/Loss Information -----")
-    gross = pnl.get('gross', {})
-    net = pnl.get('net', {})
-    output.append(f"Gross Profit: ${gross.get('total', 0):.2f}")
-    output.append(f"Average Profit per Trade: ${gross.get('average', 0):.2f}")
-    output.append(f"Net Profit: ${net.get('total', 0):.2f}")
-    output.append(f"Average Net Profit per Trade: ${net.get('average', 0):.2f}")
+    # Derived values
+    won_total = values['won']
+    total_closed = won_total + values['lost']
+    win_rate = (won_total / total_closed * 100) if total_closed > 0 else 0
+    values['win_rate'] = win_rate
+    values['loss_rate'] = 100 - win_rate
+    values['lost_pnl_max_abs'] = abs(values['lost_pnl_max'])
     
-    # Won trades details
-    output.append("\n----- Won Trades -----")
-    won_pnl = won.get('pnl', {})
-    output.append(f"Total PnL: ${won_pnl.get('total', 0):.2f}")
-    output.append(f"Average PnL: ${won_pnl.get('average', 0):.2f}")
-    output.append(f"Max PnL: ${won_pnl.get('max', 0):.2f}")
-    
-    # Lost trades details
-    output.append("\n----- Lost Trades -----")
-    lost_pnl = lost.get('pnl', {})
-    output.append(f"Total PnL: ${lost_pnl.get('total', 0):.2f}")
-    output.append(f"Average PnL: ${lost_pnl.get('average', 0):.2f}")
-    output.append(f"Max Loss: ${abs(lost_pnl.get('max', 0)):.2f}")
-    
-    # Long/Short breakdown
-    long = analysis.get('long', {})
-    short = analysis.get('short', {})
-    output.append("\n----- Long/Short Breakdown -----")
-    output.append(
-        f"Long Trades: {long.get('total', 0)} "
-        f"(Won: {long.get('won', 0)}, Lost: {long.get('lost', 0)})"
-    )
-    output.append(
-        f"Short Trades: {short.get('total', 0)} "
-        f"(Won: {short.get('won', 0)}, Lost: {short.get('lost', 0)})"
+    return _TRADE_TEMPLATE.format_map(values)
+
+
+def _format_sharpe(sharpe_analysis: Dict[str, Any]) -> str:
+    """Format the SharpeRatio analyzer result."""
+    sharpe = sharpe_analysis.get('sharperatio', 0)
+    return f"\nSharpe Ratio: {sharpe:.4f}" if sharpe else "\nSharpe Ratio: N/A"
+
+
+def _format_drawdown(drawdown_analysis: Dict[str, Any]) -> str:
+    """Format the DrawDown analyzer result."""
+    dd_max = drawdown_analysis.get('max', _EMPTY)
+    return (
+        f"Max Drawdown: {dd_max.get('drawdown', 0):.2f}%\n"
+        f"Drawdown Period: {dd_max.get('len', 0)} bars"
     )
-    
-    # Trade duration stats
-    length = analysis.get('len', {})
-    output.append("\n----- Trade Duration -----")
-    output.append(f"Average Trade Length: {length.get('average', 0):.1f} bars")
-    output.append(f"Longest Trade: {length.get('max', 0)} bars")
-    output.append(f"Shortest Trade: {length.get('min', 0)} bars")
-    
-    won_len = length.get('won', {})
-    lost_len = length.get('lost', {})
-    output.append(f"Average Winning Trade Length: {won_len.get('average', 0):.1f} bars")
-    output.append(f"Average Losing Trade Length: {lost_len.get('average', 0):.1f} bars")
-    
-    return "\n".join(output)
+
+
+def _format_sqn(sqn_analysis: Dict[str, Any]) -> str:
+    """Format the SQN (System Quality Number) analyzer result."""
+    sqn = sqn_analysis.get('sqn', 0)
+    return f"SQN: {sqn:.4f}" if sqn else "SQN: N/A"
+
+
+# Report sections in output order: analyzer name -> formatter for its results
+_ANALYZER_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    'sharpe': _format_sharpe,
+    'drawdown': _format_drawdown,
+    'sqn': _format_sqn,
+    'trades': format_trade_analysis,
+}
+
+# Fixed banner lines of the analyzer report
+_RESULTS_HEADER = "\n" + "=" * 50 + "\nBACKTEST ANALYSIS RESULTS\n" + "=" * 50
+_RESULTS_FOOTER = "\n" + "=" * 50 + "\n"
 
 
 def format_analyzer_results(analyzers: Dict[str, Any]) -> str:
@@ -103,31 +171,9 @@ def format_analyzer_results(analyzers: Dict[str, Any]) -> str:
     Returns:
         Formatted string with all analysis
     """
-    output = []
-    
-    output.append("\n" + "="*50)
-    output.append("BACKTEST ANALYSIS RESULTS")
-    output.append("="*50)
-    
-    # Sharpe Ratio
-    if 'sharpe' in analyzers:
-        sharpe = analyzers['sharpe'].get('sharperatio', 0)
-        output.append(f"\nSharpe Ratio: {sharpe:.4f}" if sharpe else "\nSharpe Ratio: N/A")
-    
-    # Max Drawdown
-    if 'drawdown' in analyzers:
-        dd = analyzers['drawdown']
-        output.append(f"Max Drawdown: {dd.get('max', {}).get('drawdown', 0):.2f}%")
-        output.append(f"Drawdown Period: {dd.get('max', {}).get('len', 0)} bars")
-    
-    # SQN (System Quality Number)
-    if 'sqn' in analyzers:
-        sqn = analyzers['sqn'].get('sqn', 0)
-        output.append(f"SQN: {sqn:.4f}" if sqn else "SQN: N/A")
-    
-    # Trade Analysis
-    if 'trades' in analyzers:
-        output.append(format_trade_analysis(analyzers['trades']))
-    
-    output.append("\n" + "="*50 + "\n")
+    output = [_RESULTS_HEADER]
+    for name, formatter in _ANALYZER_FORMATTERS.items():
+        if name in analyzers:
+            output.append(formatter(analyzers[name]))
+    output.append(_RESULTS_FOOTER)
     return "\n".join(output)
@@ -1,6 +1,9 @@
 """Backtrader utility functions."""
 
+import functools
+import importlib
 import logging
+from types import ModuleType
 from typing import Optional
 
 import backtrader as bt
@@ -8,8 +11,22 @@ import backtrader as bt
 
 logger = logging.getLogger(__name__)
 
-# Cache for strategy classes
-_strategy_class_cache = {}
+# Bound on memoized module imports and strategy class lookups
+_LOOKUP_CACHE_SIZE = 128
+
+# Modules holding strategy classes, imported once per name (failed imports are not cached)
+_import_module = functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)(importlib.import_module)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_strategy_v2() -> Optional[ModuleType]:
+    """Import the strategy_v2 module once, returning None if it is not installed."""
+    try:
+        import strategy_v2
+        return strategy_v2
+    except ImportError:
+        logger.debug("strategy_v2 module not found")
+        return None
 
 
 def find_strategy_class(strategy_name: str) -> Optional[type]:
@@ -18,6 +35,7 @@ def find_strategy_class(strategy_name: str) -> Optional[type]:
     
     Searches in the strategy_v2 module for pre-implemented strategies.
     Supports both simple names and fully qualified names (e.g., "module.ClassName").
+    Found classes are cached; misses and failed imports are not.
     
     Args:
         strategy_name: The name of the strategy class to find
@@ -28,40 +46,48 @@ def find_strategy_class(strategy_name: str) -> Optional[type]:
     Raises:
         ValueError: If strategy_name is a qualified name but import fails
     """
-    # Check cache first
-    if strategy_name in _strategy_class_cache:
-        return _strategy_class_cache[strategy_name]
-    
+    try:
+        return _find_strategy_class_cached(strategy_name)
+    except LookupError:
+        logger.debug(f"Strategy class '{strategy_name}' not found")
+        return None
+
+
+@functools.lru_cache(maxsize=_LOOKUP_CACHE_SIZE)
+def _find_strategy_class_cached(strategy_name: str) -> type:
+    """Look up a strategy class, raising LookupError (which is not cached) on a miss."""
     # Handle fully qualified names (e.g., "strategy_v2.ExampleStrategy")
     if '.' in strategy_name:
         module_name, class_name = strategy_name.rsplit('.', 1)
         try:
-            module = __import__(module_name, fromlist=[class_name])
+            module = _import_module(module_name)
             strategy_class = getattr(module, class_name)
             
             if not issubclass(strategy_class, bt.Strategy):
                 raise ValueError(f"{strategy_name} is not a valid Backtrader Strategy class")
             
-            _strategy_class_cache[strategy_name] = strategy_class
             logger.info(f"Found strategy class: {strategy_name}")
             return strategy_class
         except (ImportError, AttributeError) as e:
             raise ValueError(f"Failed to import strategy class '{strategy_name}': {e}") from e
     
     # Try to find in strategy_v2 module
-    try:
-        import strategy_v2
-        if hasattr(strategy_v2, strategy_name):
-            strategy_class = getattr(strategy_v2, strategy_name)
-            if issubclass(strategy_class, bt.Strategy):
-                _strategy_class_cache[strategy_name] = strategy_class
-                logger.info(f"Found strategy class in strategy_v2: {strategy_name}")
-                return strategy_class
-    except ImportError:
-        logger.debug("strategy_v2 module not found")
+    strategy_class = getattr(_get_strategy_v2(), strategy_name, None)
+    if isinstance(strategy_class, type) and issubclass(strategy_class, bt.Strategy):
+        logger.info(f"Found strategy class in strategy_v2: {strategy_name}")
+        return strategy_class
     
-    logger.debug(f"Strategy class '{strategy_name}' not found")
-    return None
+    raise LookupError(strategy_name)
+
+
+# Explanations of final order statuses, keyed by status code
+_STATUS_MESSAGES = {
+    bt.Order.Completed: "Order completed successfully",
+    bt.Order.Margin: "Order cancelled due to insufficient margin",
+    bt.Order.Rejected: "Order rejected by broker",
+    bt.Order.Canceled: "Order cancelled",  # Order.Cancelled is the same code
+    bt.Order.Expired: "Order expired",
+}
 
 
 def explain_order_status(order: bt.Order) -> str:
@@ -75,17 +101,10 @@ def explain_order_status(order: bt.Order) -> str:
         Human-readable order status description
     """
     status_name = order.getstatusname()
+    message = _STATUS_MESSAGES.get(order.status)
     
-    if order.status in [order.Completed]:
-        return f"Order Status: {status_name} - Order completed successfully"
-    elif order.status in [order.Margin]:
-        return f"Order Status: {status_name} - Order cancelled due to insufficient margin"
-    elif order.status in [order.Rejected]:
-        return f"Order Status: {status_name} - Order rejected by broker"
-    elif order.status in [order.Canceled, order.Cancelled]:
-        return f"Order Status: {status_name} - Order cancelled"
-    elif order.status in [order.Expired]:
-        return f"Order Status: {status_name} - Order expired"
+    if message:
+        return f"Order Status: {status_name} - {message}"
     elif status_name:
         return f"Order Status: {status_name}"
     else:
@@ -107,10 +126,16 @@ def describe_order(order: bt.Order) -> str:
         f"Type: {order.getordername()}, "
         f"Price: {order.price:.2f}, "
         f"Size: {order.size}, "
-        f"Created: {bt.num2date(order.created.dt).strftime('%Y-%m-%d')}"
+        f"Created: {_format_bt_day(int(order.created.dt))}"
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_bt_day(day: int) -> str:
+    """Format the whole-day part of a Backtrader date number as YYYY-MM-DD."""
+    return bt.num2date(day).strftime('%Y-%m-%d')
+
+
 def format_price(price: float) -> str:
     """Format price for display."""
     return f"${price:,.2f}"
@@ -1,12 +1,22 @@
 """Cache index management for market data files."""
 
 import hashlib
+import heapq
+import itertools
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional
+from typing import Generic, Iterable, Optional, TypeVar
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib json module
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +24,25 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_SIZE_MB = 100
 CACHE_INDEX_FILENAME = ".cache_index.json"
 
+# Default checksum algorithm for new cache entries (any hashlib algorithm name).
+# SHA-256 is hardware-accelerated (SHA-NI / ARMv8 crypto) on current CPUs and hashes
+# about twice as fast as MD5 there; bare MD5 digests in older indexes still validate.
+CHECKSUM_ALGORITHM = "sha256"
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
+
+def _date_ordinal(value: str) -> int:
+    """Convert a YYYY-MM-DD date string to a proleptic Gregorian ordinal."""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except ValueError:
+        # Accept the looser forms strptime allows, e.g. unpadded months
+        return datetime.strptime(value, "%Y-%m-%d").toordinal()
 
-@dataclass
+
+@dataclass(slots=True)
 class CacheEntry:
     """Metadata for a cached data file."""
 
@@ -29,10 +56,33 @@ class CacheEntry:
     row_count: int
     checksum: str
     source: str = "yfinance"
+    # Date ordinals used by range queries; derived in __post_init__, not serialized
+    _start_ord: int = field(init=False, repr=False, compare=False)
+    _end_ord: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute date ordinals used by range queries and intern repeated strings."""
+        # Entries for one ticker (or source) then share a single string object
+        self.ticker = sys.intern(self.ticker)
+        self.source = sys.intern(self.source)
+        self._start_ord = _date_ordinal(self.start_date)
+        self._end_ord = _date_ordinal(self.end_date)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Spelled out: a dict display is over twice as fast as iterating dataclass fields
+        return {
+            "ticker": self.ticker,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "file_path": self.file_path,
+            "download_time": self.download_time,
+            "last_accessed": self.last_accessed,
+            "file_size_bytes": self.file_size_bytes,
+            "row_count": self.row_count,
+            "checksum": self.checksum,
+            "source": self.source,
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "CacheEntry":
@@ -40,6 +90,131 @@ class CacheEntry:
         return cls(**data)
 
 
+class IntervalTree(Generic[T]):
+    """
+    Static augmented interval tree over closed integer intervals.
+
+    Intervals are kept sorted by start in an implicit balanced binary tree
+    (the middle of each slice is its root), and every node stores the largest
+    end in its subtree so whole subtrees ending before a query are skipped.
+    Overlap queries run in O(log n + m) and return values in insertion order.
+    """
+
+    __slots__ = ("_starts", "_ends", "_values", "_order", "_max_end")
+
+    def __init__(self, intervals: Iterable[tuple[int, int, T]]):
+        """
+        Build the tree.
+
+        Args:
+            intervals: (start, end, value) triples with inclusive bounds
+        """
+        items = sorted(
+            ((start, end, order, value) for order, (start, end, value) in enumerate(intervals)),
+            key=lambda item: item[0],
+        )
+        self._starts = [item[0] for item in items]
+        self._ends = [item[1] for item in items]
+        self._order = [item[2] for item in items]
+        self._values = [item[3] for item in items]
+        self._max_end = list(self._ends)
+        self._build(0, len(items))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _build(self, lo: int, hi: int) -> int:
+        """Fill the subtree max-end values for the slice [lo, hi) and return its maximum."""
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        max_end = max(self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: int, end: int) -> list[T]:
+        """
+        Return the values of all intervals overlapping [start, end].
+
+        Args:
+            start: Query start (inclusive)
+            end: Query end (inclusive)
+
+        Returns:
+            Matching values in insertion order
+        """
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_end[mid] < start:
+                continue  # Everything in this subtree ends before the query
+            stack.append((lo, mid))
+            if starts[mid] <= end:
+                if ends[mid] >= start:
+                    found.append(mid)
+                stack.append((mid + 1, hi))  # Right subtree starts no earlier
+        found.sort(key=self._order.__getitem__)
+        return [self._values[i] for i in found]
+
+    def enveloping(self, start: int, end: int) -> list[T]:
+        """
+        Return the values of all intervals fully containing [start, end].
+
+        Args:
+            start: Query start (inclusive)
+            end: Query end (inclusive)
+
+        Returns:
+            Matching values in insertion order
+        """
+        found = self._enveloping_indices(start, end)
+        found.sort(key=self._order.__getitem__)
+        return [self._values[i] for i in found]
+
+    def first_enveloping(self, start: int, end: int) -> Optional[T]:
+        """
+        Return the earliest-inserted value whose interval fully contains [start, end].
+
+        Equivalent to the first item of enveloping(), without building and sorting
+        the full match list.
+
+        Args:
+            start: Query start (inclusive)
+            end: Query end (inclusive)
+
+        Returns:
+            The matching value, or None if no interval contains the range
+        """
+        found = self._enveloping_indices(start, end)
+        if not found:
+            return None
+        return self._values[min(found, key=self._order.__getitem__)]
+
+    def _enveloping_indices(self, start: int, end: int) -> list[int]:
+        """Return the unordered positions of intervals fully containing [start, end]."""
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_end[mid] < end:
+                continue  # Nothing in this subtree reaches the query end
+            stack.append((lo, mid))
+            if starts[mid] <= start:
+                if ends[mid] >= end:
+                    found.append(mid)
+                stack.append((mid + 1, hi))
+        return found
+
+
 class CacheIndex:
     """Manages the cache index file for market data."""
 
@@ -56,18 +231,48 @@ class CacheIndex:
         self.index_path = self.datas_folder / CACHE_INDEX_FILENAME
         self.max_size_mb = max_size_mb
         self.enabled = enabled
-        self._entries: dict[str, CacheEntry] = {}
+        self._entry_map: dict[str, CacheEntry] = {}
+        # Entries per ticker, keyed by filename in insertion order
+        self._ticker_map: dict[str, dict[str, CacheEntry]] = {}
+        # Entry dicts read from disk, turned into CacheEntry objects on first use (None
+        # once built); until then _entry_map only holds entries looked up one by one
+        self._raw_entries: Optional[dict[str, dict]] = None
+        # Sum of file_size_bytes over all entries, kept current once they are built
+        self._total_size = 0
+        # Per-ticker interval trees over entry date ranges, built lazily on query
+        self._interval_trees: dict[str, IntervalTree[CacheEntry]] = {}
+        # Min-heap of (last_accessed, seq, filename, entry, last_accessed_str) for LRU
+        # eviction, built on first use; superseded items are skipped when popped
+        self._lru_heap: Optional[list[tuple]] = None
+        self._lru_seq = itertools.count()
+        # Nesting depth of batch() blocks; while positive, _save only marks the index dirty
+        self._batch_depth = 0
+        self._dirty = False
         self._load()
 
     def _load(self) -> None:
-        """Load the cache index from disk."""
+        """
+        Load the cache index from disk.
+
+        Settings are applied right away; entries are only built when first
+        needed (see _entries), so opening a large index for a single lookup
+        or a settings check stays cheap.
+        """
+        self._entry_map = {}
+        self._ticker_map = {}
+        self._raw_entries = None
+        self._total_size = 0
+        self._interval_trees.clear()
+        self._lru_heap = None
         if not self.index_path.exists():
             logger.debug(f"Cache index not found at {self.index_path}, starting fresh")
             return
 
         try:
-            with open(self.index_path, "r") as f:
-                data = json.load(f)
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # Load settings
             settings = data.get("settings", {})
@@ -76,36 +281,125 @@ class CacheIndex:
             if "enabled" in settings:
                 self.enabled = settings["enabled"]
 
-            # Load entries
-            entries_data = data.get("entries", {})
-            for filename, entry_data in entries_data.items():
-                try:
-                    self._entries[filename] = CacheEntry.from_dict(entry_data)
-                except (TypeError, KeyError) as e:
-                    logger.warning(f"Invalid cache entry {filename}: {e}")
-
-            logger.debug(f"Loaded {len(self._entries)} cache entries")
+            # Entries are built on first use
+            self._raw_entries = data.get("entries", {})
+            logger.debug(f"Loaded {len(self._raw_entries)} cache entries")
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load cache index: {e}")
-            self._entries = {}
+
+    def _build_entry(self, filename: str) -> Optional[CacheEntry]:
+        """Build one loaded entry, dropping it with a warning if it is invalid."""
+        try:
+            return CacheEntry.from_dict(self._raw_entries[filename])
+        except (TypeError, KeyError, ValueError) as e:
+            logger.warning(f"Invalid cache entry {filename}: {e}")
+            return None
+
+    def _build_entries(self) -> None:
+        """Build all loaded entries, keeping ones already built by _peek_entry."""
+        built = self._entry_map
+        self._entry_map = {}
+        self._total_size = 0
+        for filename in self._raw_entries:
+            entry = built.get(filename) or self._build_entry(filename)
+            if entry is not None:
+                self._entry_map[filename] = entry
+                self._ticker_map.setdefault(entry.ticker, {})[filename] = entry
+                self._total_size += entry.file_size_bytes
+        self._raw_entries = None
+
+    @property
+    def _entries(self) -> dict[str, CacheEntry]:
+        """All entries by filename, built from the loaded index on first use."""
+        if self._raw_entries is not None:
+            self._build_entries()
+        return self._entry_map
+
+    @property
+    def _by_ticker(self) -> dict[str, dict[str, CacheEntry]]:
+        """Entries per ticker, built from the loaded index on first use."""
+        if self._raw_entries is not None:
+            self._build_entries()
+        return self._ticker_map
+
+    def _peek_entry(self, filename: str) -> Optional[CacheEntry]:
+        """Look up one entry, building only that entry if the rest are not built yet."""
+        entry = self._entry_map.get(filename)
+        if entry is None and self._raw_entries is not None and filename in self._raw_entries:
+            entry = self._build_entry(filename)
+            if entry is None:
+                del self._raw_entries[filename]
+            else:
+                self._entry_map[filename] = entry
+        return entry
+
+    def batch(self) -> "CacheIndex":
+        """
+        Defer index writes until the end of a ``with`` block.
+
+        Changes made inside the block are written once on exit (also when the
+        block raises), instead of rewriting the index after every change.
+        Blocks may be nested; only the outermost one writes. ``with index:``
+        is equivalent to ``with index.batch():``.
+
+        Returns:
+            This cache index, for use as a context manager
+        """
+        return self
+
+    def __enter__(self) -> "CacheIndex":
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write changes deferred by batch() now, if there are any."""
+        if self._dirty:
+            self._write()
 
     def _save(self) -> None:
-        """Save the cache index to disk atomically."""
+        """Save the cache index to disk, deferring the write inside batch()."""
+        self._dirty = True
+        if not self._batch_depth:
+            self._write()
+
+    def _write(self) -> None:
+        """Write the cache index to disk atomically."""
         self.datas_folder.mkdir(parents=True, exist_ok=True)
 
+        if self._raw_entries is None:
+            entries = {filename: entry.to_dict() for filename, entry in self._entry_map.items()}
+        else:
+            # Entries never built are written back as loaded
+            built = self._entry_map
+            entries = {
+                filename: built[filename].to_dict() if filename in built else entry_data
+                for filename, entry_data in self._raw_entries.items()
+            }
         data = {
             "version": 1,
             "settings": {"max_size_mb": self.max_size_mb, "enabled": self.enabled},
-            "entries": {filename: entry.to_dict() for filename, entry in self._entries.items()},
+            "entries": entries,
         }
 
         # Write to temp file then rename for atomicity
         temp_path = self.index_path.with_suffix(".tmp")
         try:
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Compact output: the index is rewritten on every change and only the
+            # small settings block is meant for hand editing
+            if orjson is not None:
+                with open(temp_path, "wb") as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(temp_path, "w") as f:
+                    json.dump(data, f, separators=(",", ":"))
             temp_path.replace(self.index_path)
-            logger.debug(f"Saved cache index with {len(self._entries)} entries")
+            self._dirty = False
+            logger.debug(f"Saved cache index with {len(entries)} entries")
         except IOError as e:
             logger.error(f"Failed to save cache index: {e}")
             if temp_path.exists():
@@ -119,10 +413,31 @@ class CacheIndex:
         Args:
             entry: The cache entry to add
         """
-        filename = Path(entry.file_path).name
+        filename = os.path.basename(entry.file_path)
+        previous = self._entries.get(filename)
+        if previous is not None:
+            if previous.ticker != entry.ticker:
+                self._pop_entry(filename)
+            else:
+                self._total_size -= previous.file_size_bytes
         self._entries[filename] = entry
+        self._total_size += entry.file_size_bytes
+        self._by_ticker.setdefault(entry.ticker, {})[filename] = entry
+        self._interval_trees.pop(entry.ticker, None)
+        self._push_lru(filename, entry)
         self._save()
 
+    def _pop_entry(self, filename: str) -> CacheEntry:
+        """Remove an entry from the index structures (not from disk) and return it."""
+        entry = self._entries.pop(filename)
+        self._total_size -= entry.file_size_bytes
+        ticker_entries = self._by_ticker[entry.ticker]
+        del ticker_entries[filename]
+        if not ticker_entries:
+            del self._by_ticker[entry.ticker]
+        self._interval_trees.pop(entry.ticker, None)
+        return entry
+
     def get_entry(self, filename: str) -> Optional[CacheEntry]:
         """
         Get a cache entry by filename.
@@ -133,7 +448,7 @@ class CacheIndex:
         Returns:
             The cache entry or None if not found
         """
-        return self._entries.get(filename)
+        return self._peek_entry(filename)
 
     def get_entry_by_range(
         self, ticker: str, start_date: str, end_date: str
@@ -163,7 +478,7 @@ class CacheIndex:
             True if entry was removed, False if not found
         """
         if filename in self._entries:
-            del self._entries[filename]
+            self._pop_entry(filename)
             self._save()
             return True
         return False
@@ -187,7 +502,17 @@ class CacheIndex:
         Returns:
             List of cache entries for the ticker
         """
-        return [e for e in self._entries.values() if e.ticker == ticker]
+        ticker_entries = self._by_ticker.get(ticker)
+        return list(ticker_entries.values()) if ticker_entries else []
+
+    def _get_interval_tree(self, ticker: str) -> IntervalTree[CacheEntry]:
+        """Return the interval tree over a ticker's entries, building it if needed."""
+        tree = self._interval_trees.get(ticker)
+        if tree is None:
+            tree = self._interval_trees[ticker] = IntervalTree(
+                (e._start_ord, e._end_ord, e) for e in self.get_entries_for_ticker(ticker)
+            )
+        return tree
 
     def find_overlapping_entries(
         self, ticker: str, start_date: str, end_date: str
@@ -203,19 +528,9 @@ class CacheIndex:
         Returns:
             List of overlapping cache entries
         """
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
-
-        overlapping = []
-        for entry in self.get_entries_for_ticker(ticker):
-            entry_start = datetime.strptime(entry.start_date, "%Y-%m-%d").date()
-            entry_end = datetime.strptime(entry.end_date, "%Y-%m-%d").date()
-
-            # Check for any overlap
-            if entry_start <= end and entry_end >= start:
-                overlapping.append(entry)
-
-        return overlapping
+        start = _date_ordinal(start_date)
+        end = _date_ordinal(end_date)
+        return self._get_interval_tree(ticker).overlapping(start, end)
 
     def find_covering_entry(
         self, ticker: str, start_date: str, end_date: str
@@ -231,29 +546,71 @@ class CacheIndex:
         Returns:
             A cache entry that covers the range, or None
         """
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start = _date_ordinal(start_date)
+        end = _date_ordinal(end_date)
+        return self._get_interval_tree(ticker).first_enveloping(start, end)
 
-        for entry in self.get_entries_for_ticker(ticker):
-            entry_start = datetime.strptime(entry.start_date, "%Y-%m-%d").date()
-            entry_end = datetime.strptime(entry.end_date, "%Y-%m-%d").date()
+    def validate_all(self, max_workers: Optional[int] = None, strict: bool = True) -> list[str]:
+        """
+        Validate every entry's file and checksum, dropping invalid entries.
 
-            # Check if entry fully covers requested range
-            if entry_start <= start and entry_end >= end:
-                return entry
+        Files are hashed on a thread pool; hashlib releases the GIL while
+        hashing, so validation scales with the available cores and disks.
 
-        return None
+        Args:
+            max_workers: Number of worker threads (default: CPU count)
+            strict: Whether to verify checksums (False checks existence and size only)
 
-    def update_last_accessed(self, filename: str) -> None:
+        Returns:
+            List of removed filenames
+        """
+        items = list(self._entries.items())
+        if not items:
+            return []
+
+        if strict:
+            workers = min(max_workers or os.cpu_count() or 1, len(items))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(validate_cache_entry, [entry for _, entry in items]))
+        else:
+            results = [validate_cache_entry(entry, strict=False) for _, entry in items]
+        invalid = [filename for (filename, _), ok in zip(items, results) if not ok]
+
+        for filename in invalid:
+            self._pop_entry(filename)
+        if invalid:
+            self._save()
+            logger.info(f"Removed {len(invalid)} invalid cache entries")
+
+        return invalid
+
+    def update_last_accessed(self, filename: str, save: bool = True) -> None:
         """
         Update the last_accessed timestamp for an entry.
 
         Args:
             filename: The filename to update
+            save: Whether to write the index now; if False the change is only
+                marked for the next flush() or write
         """
-        if filename in self._entries:
-            self._entries[filename].last_accessed = datetime.now().isoformat()
-            self._save()
+        entry = self._peek_entry(filename)
+        if entry is not None:
+            now = datetime.now()
+            entry.last_accessed = now.isoformat()
+            self._push_lru(filename, entry, now)
+            if save:
+                self._save()
+            else:
+                self._dirty = True
+
+    def get_entry_count(self) -> int:
+        """
+        Get the number of cache entries.
+
+        Returns:
+            Number of entries
+        """
+        return len(self._entries)
 
     def get_total_size_bytes(self) -> int:
         """
@@ -262,46 +619,99 @@ class CacheIndex:
         Returns:
             Total size in bytes
         """
-        return sum(e.file_size_bytes for e in self._entries.values())
+        if self._raw_entries is not None:
+            self._build_entries()
+        return self._total_size
 
-    def enforce_storage_limit(self) -> list[str]:
+    def _push_lru(
+        self, filename: str, entry: CacheEntry, accessed: Optional[datetime] = None
+    ) -> None:
+        """
+        Record an entry's current last_accessed time in the LRU heap, if built.
+
+        Args:
+            filename: The entry's filename
+            entry: The entry to record
+            accessed: entry.last_accessed as a datetime, if the caller already has it
+        """
+        if self._lru_heap is not None and len(self._lru_heap) > 2 * len(self._entries) + 64:
+            self._lru_heap = None  # Mostly superseded items; rebuild on next use
+        if self._lru_heap is not None:
+            heapq.heappush(
+                self._lru_heap,
+                (
+                    accessed or datetime.fromisoformat(entry.last_accessed),
+                    next(self._lru_seq),
+                    filename,
+                    entry,
+                    entry.last_accessed,
+                ),
+            )
+
+    def _get_lru_heap(self) -> list[tuple]:
+        """Return the LRU heap, building it from the current entries on first use."""
+        if self._lru_heap is None:
+            self._lru_heap = [
+                (
+                    datetime.fromisoformat(entry.last_accessed),
+                    next(self._lru_seq),
+                    filename,
+                    entry,
+                    entry.last_accessed,
+                )
+                for filename, entry in self._entries.items()
+            ]
+            heapq.heapify(self._lru_heap)
+        return self._lru_heap
+
+    def enforce_storage_limit(self, reserve_bytes: int = 0, delete_files: bool = True) -> list[str]:
         """
         Evict LRU entries until cache is under the size limit.
 
+        Args:
+            reserve_bytes: Space to leave free under the limit, e.g. the expected
+                size of a file about to be added. Ignored if it is not smaller than
+                the limit, since emptying the cache would not make room for it.
+            delete_files: Whether to delete evicted files; if False only their
+                entries are removed and the caller deletes the returned files
+
         Returns:
             List of evicted file paths
         """
         if self.max_size_mb == 0:
             return []  # Unlimited
 
-        max_size_bytes = self.max_size_mb * 1024 * 1024
+        limit_bytes = self.max_size_mb * 1024 * 1024
+        if not 0 < reserve_bytes < limit_bytes:
+            reserve_bytes = 0
+        max_size_bytes = limit_bytes - reserve_bytes
         total_size = self.get_total_size_bytes()
 
         if total_size <= max_size_bytes:
             return []
 
-        # Sort by last_accessed ascending (oldest first)
-        sorted_entries = sorted(
-            self._entries.values(),
-            key=lambda e: datetime.fromisoformat(e.last_accessed),
-        )
-
+        heap = self._get_lru_heap()
         evicted = []
-        for entry in sorted_entries:
-            if total_size <= max_size_bytes:
-                break
+        while heap and total_size > max_size_bytes:
+            _, _, filename, entry, last_accessed = heapq.heappop(heap)
+            if self._entries.get(filename) is not entry:
+                continue  # Entry was replaced or removed
+            if entry.last_accessed != last_accessed:
+                self._push_lru(filename, entry)  # Re-queue at its current access time
+                continue
 
             total_size -= entry.file_size_bytes
-            filename = Path(entry.file_path).name
 
             # Remove the file
-            file_path = Path(entry.file_path)
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"Evicted cache file: {file_path}")
+            if delete_files:
+                try:
+                    os.unlink(entry.file_path)
+                    logger.info(f"Evicted cache file: {entry.file_path}")
+                except FileNotFoundError:
+                    pass
 
             # Remove from index
-            del self._entries[filename]
+            self._pop_entry(filename)
             evicted.append(entry.file_path)
 
         if evicted:
@@ -340,7 +750,7 @@ class CacheIndex:
             "max_size_mb": self.max_size_mb,
             "oldest_entry": sorted_by_download[0].download_time,
             "newest_entry": sorted_by_download[-1].download_time,
-            "tickers": list(set(e.ticker for e in entries)),
+            "tickers": list(self._by_ticker),
         }
 
     def clear(self, ticker: Optional[str] = None) -> int:
@@ -353,18 +763,17 @@ class CacheIndex:
         Returns:
             Number of entries removed
         """
-        to_remove = []
-
-        for filename, entry in self._entries.items():
-            if ticker is None or entry.ticker == ticker:
-                # Remove the file
-                file_path = Path(entry.file_path)
-                if file_path.exists():
-                    file_path.unlink()
-                to_remove.append(filename)
+        if ticker is None:
+            to_remove = list(self._entries)
+        else:
+            to_remove = list(self._by_ticker.get(ticker, ()))
 
         for filename in to_remove:
-            del self._entries[filename]
+            # Remove the file
+            try:
+                os.unlink(self._pop_entry(filename).file_path)
+            except FileNotFoundError:
+                pass
 
         if to_remove:
             self._save()
@@ -373,44 +782,97 @@ class CacheIndex:
         return len(to_remove)
 
 
-def calculate_checksum(file_path: str) -> str:
+def calculate_checksum(file_path: str, algorithm: str = CHECKSUM_ALGORITHM) -> str:
     """
-    Calculate MD5 checksum of a file.
+    Calculate the checksum of a file.
+
+    MD5 digests are returned bare for compatibility with existing indexes;
+    other algorithms are prefixed with their name, e.g. ``"blake2b:..."``.
 
     Args:
         file_path: Path to the file
+        algorithm: hashlib algorithm name (default: CHECKSUM_ALGORITHM)
 
     Returns:
-        MD5 hex digest
+        Hex digest, prefixed with the algorithm name unless MD5
     """
-    hasher = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashlib reads into a reusable buffer, releasing the GIL
+            digest = hashlib.file_digest(f, algorithm).hexdigest()
+        else:
+            hasher = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+    return digest if algorithm == "md5" else f"{algorithm}:{digest}"
+
+
+def scan_file(file_path: str, algorithm: str = CHECKSUM_ALGORITHM) -> tuple[str, int, int]:
+    """
+    Checksum a file and count its lines and bytes in a single read.
+
+    Args:
+        file_path: Path to the file
+        algorithm: hashlib algorithm name (default: CHECKSUM_ALGORITHM)
+
+    Returns:
+        Tuple of (checksum as from calculate_checksum, line count, size in bytes);
+        a final line without a trailing newline is counted
+    """
+    hasher = hashlib.new(algorithm)
+    lines = 0
+    size = 0
+    last = b""
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
             hasher.update(chunk)
-    return hasher.hexdigest()
+            lines += chunk.count(b"\n")
+            size += len(chunk)
+            last = chunk
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    digest = hasher.hexdigest()
+    return digest if algorithm == "md5" else f"{algorithm}:{digest}", lines, size
 
 
-def validate_cache_entry(entry: CacheEntry) -> bool:
+def validate_cache_entry(entry: CacheEntry, strict: bool = True) -> bool:
     """
     Validate a cache entry.
 
-    Checks that the file exists and checksum matches.
+    Checks that the file exists, its size matches and, in strict mode, that
+    the checksum matches. A size mismatch fails without hashing the file.
 
     Args:
         entry: The cache entry to validate
+        strict: Whether to verify the checksum (False checks existence and size only)
 
     Returns:
         True if valid, False otherwise
     """
-    file_path = Path(entry.file_path)
+    file_path = entry.file_path
 
-    # Check file exists
-    if not file_path.exists():
+    # Check file exists and has the recorded size
+    try:
+        size = os.stat(file_path).st_size
+    except OSError:
         logger.warning(f"Cache file missing: {file_path}")
         return False
-
-    # Validate checksum
-    actual_checksum = calculate_checksum(str(file_path))
+    if size != entry.file_size_bytes:
+        logger.warning(
+            f"Size mismatch for {file_path}: expected {entry.file_size_bytes}, got {size}"
+        )
+        return False
+    if not strict:
+        return True
+
+    # Validate checksum with the algorithm it was recorded with
+    algorithm, sep, _ = entry.checksum.partition(":")
+    try:
+        actual_checksum = calculate_checksum(file_path, algorithm if sep else "md5")
+    except ValueError:
+        logger.warning(f"Unsupported checksum algorithm for {file_path}: {algorithm}")
+        return False
     if actual_checksum != entry.checksum:
         logger.warning(
             f"Checksum mismatch for {file_path}: expected {entry.checksum}, got {actual_checksum}"
@@ -1,6 +1,8 @@
 """Configuration utilities for loading and saving strategy definitions."""
 
 import logging
+import os
+import pickle
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 
@@ -10,6 +12,70 @@ import backtrader as bt
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml C loader when PyYAML was built with it
+try:
+    YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    YAML_LOADER = yaml.SafeLoader
+    logger.debug("PyYAML was built without libyaml; using the pure-Python loader")
+
+# In-process cache of pickled YAML documents: path -> (mtime_ns, size, pickle)
+_YAML_CACHE: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def parse_yaml(content: Any) -> Any:
+    """
+    Parse YAML content with the safe loader, preferring libyaml.
+    
+    Args:
+        content: YAML text, bytes or an open file
+        
+    Returns:
+        The parsed document
+    """
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
+def _yaml_cache_get(path: Path) -> Tuple[Any, Optional[Tuple[int, int]]]:
+    """
+    Look up a file in the in-process YAML cache.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Tuple of (fresh copy of the cached document or None, file stamp)
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(str(path))
+    if cached is not None and cached[:2] == stamp:
+        return pickle.loads(cached[2]), stamp
+    return None, stamp
+
+
+def _yaml_cache_put(path: Path, stamp: Optional[Tuple[int, int]], document: Any) -> None:
+    """Store a parsed document for a file whose stamp was taken before reading it."""
+    if stamp is not None:
+        _YAML_CACHE[str(path)] = (*stamp, pickle.dumps(document, protocol=5))
+
+
+def load_strategy_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a strategy YAML file.
+    
+    Args:
+        path: Path to the strategy YAML file
+        
+    Returns:
+        Strategy definition dictionary (empty dict for an empty file)
+    """
+    with open(path, 'rb') as f:
+        return parse_yaml(f) or {}
+
 
 def load_strategy_def(strategy_name: str) -> Dict[str, Any]:
     """
@@ -27,15 +93,33 @@ def load_strategy_def(strategy_name: str) -> Dict[str, Any]:
     for ext in ['.yaml', '.yml']:
         strategy_file = strategies_dir / f"{strategy_name}{ext}"
         if strategy_file.exists():
-            with open(strategy_file, 'r') as f:
-                strategy_def = yaml.safe_load(f)
+            strategy_def = load_strategy_from_file(strategy_file)
             logger.info(f"Loaded strategy definition from {strategy_file}")
-            return strategy_def or {}
+            return strategy_def
     
     logger.debug(f"Strategy file for {strategy_name} not found in {strategies_dir}")
     return {}
 
 
+def load_strategy_from_file(path: Path) -> Dict[str, Any]:
+    """
+    Load a strategy definition file through the in-process YAML cache.
+    
+    A file whose modification time and size are unchanged is not parsed again.
+    
+    Args:
+        path: Path to the strategy YAML file
+        
+    Returns:
+        Strategy definition dictionary (empty dict for an empty file)
+    """
+    strategy_def, stamp = _yaml_cache_get(path)
+    if strategy_def is None:
+        strategy_def = load_strategy_yaml(path)
+        _yaml_cache_put(path, stamp, strategy_def)
+    return strategy_def
+
+
 def save_strategy_def(strategy_name: str, strategy_def: Dict[str, Any]) -> Path:
     """
     Save a strategy definition to a YAML file.
@@ -72,8 +156,11 @@ def load_runtime_config(config_path: str) -> Dict[str, Any]:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+    config, stamp = _yaml_cache_get(config_file)
+    if config is None:
+        with open(config_file, 'rb') as f:
+            config = parse_yaml(f)
+        _yaml_cache_put(config_file, stamp, config)
     
     logger.info(f"Loaded runtime configuration from {config_file}")
     return config or {}
@@ -1,7 +1,8 @@
 """Parameter mapping and configuration utilities."""
 
 import copy
-from typing import Dict, Any
+import functools
+from typing import Any, Dict, List, Tuple
 
 
 def set_nested_dict_value(d: Dict[str, Any], path: str, value: Any) -> None:
@@ -19,17 +20,33 @@ def set_nested_dict_value(d: Dict[str, Any], path: str, value: Any) -> None:
         >>> config["indicators"]["sma"]["period"]
         10
     """
-    keys = path.split('.')
-    current = d
+    parents, leaf = _split_path(path)
+    current = _get_nested_dict(d, parents)
     
-    # Navigate to the nested location
-    for key in keys[:-1]:
+    # Set the value with type inference
+    current[leaf] = _infer_type(value, current.get(leaf))
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[Tuple[str, ...], str]:
+    """Split a dot-notation path into its parent keys and final key."""
+    *parents, leaf = path.split('.')
+    return tuple(parents), leaf
+
+
+def _get_nested_dict(d: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Navigate to the dict at the given keys, creating missing levels."""
+    current = d
+    for key in keys:
         if key not in current:
             current[key] = {}
         current = current[key]
-    
-    # Set the value with type inference
-    current[keys[-1]] = _infer_type(value, current.get(keys[-1]))
+    return current
+
+
+# Strings recognized as booleans when inferring a type, and those among them read as True
+_BOOL_WORDS = frozenset(('true', 'false', 'yes', 'no', '1', '0', 'y', 'n', 'on', 'off'))
+_TRUE_WORDS = frozenset(('true', 'yes', '1', 't', 'y', 'on'))
 
 
 def _infer_type(value: Any, existing_value: Any = None) -> Any:
@@ -51,7 +68,7 @@ def _infer_type(value: Any, existing_value: Any = None) -> Any:
     if existing_value is not None:
         try:
             if isinstance(existing_value, bool):
-                return value.lower() in ('true', 'yes', '1', 't', 'y', 'on')
+                return value.lower() in _TRUE_WORDS
             elif isinstance(existing_value, int):
                 return int(value)
             elif isinstance(existing_value, float):
@@ -62,8 +79,9 @@ def _infer_type(value: Any, existing_value: Any = None) -> Any:
     # Infer type from the value itself
     try:
         # Try boolean
-        if value.lower() in ('true', 'false', 'yes', 'no', '1', '0', 'y', 'n', 'on', 'off'):
-            return value.lower() in ('true', 'yes', '1', 't', 'y', 'on')
+        lowered = value.lower()
+        if lowered in _BOOL_WORDS:
+            return lowered in _TRUE_WORDS
         
         # Try integer
         if value.lstrip('-').isdigit():
@@ -97,16 +115,22 @@ def map_cli_parameters_to_config(config: Dict[str, Any], dynamic_params: Dict[st
         >>> updated["indicators"]["sma"]["period"]
         10
     """
-    config = copy.deepcopy(config)
+    config = _clone_config(config)
     
     # Get parameter mappings from the strategy config
     parameter_mappings = config.get('parameters', {})
     
-    # Process each CLI parameter
+    # Group CLI parameters by parent path, so each parent dict is walked to once
+    by_parent: Dict[Tuple[str, ...], List[Tuple[str, Any]]] = {}
     for param_name, param_value in dynamic_params.items():
         # Use parameter mapping if available, otherwise use direct path
-        param_path = parameter_mappings.get(param_name, param_name)
-        set_nested_dict_value(config, param_path, param_value)
+        parents, leaf = _split_path(parameter_mappings.get(param_name, param_name))
+        by_parent.setdefault(parents, []).append((leaf, param_value))
+    
+    for parents, leaves in by_parent.items():
+        current = _get_nested_dict(config, parents)
+        for leaf, param_value in leaves:
+            current[leaf] = _infer_type(param_value, current.get(leaf))
     
     return config
 
@@ -122,12 +146,45 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     Returns:
         Merged configuration (deep copy)
     """
-    result = copy.deepcopy(base)
+    result = {}
     
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_configs(result[key], value)
+    # Base keys keep their position; each value is copied once, from whichever side wins
+    for key, value in base.items():
+        if key not in override:
+            result[key] = _clone_config(value)
+        elif isinstance(value, dict) and isinstance(override[key], dict):
+            result[key] = merge_configs(value, override[key])
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = _clone_config(override[key])
+    
+    for key, value in override.items():
+        if key not in result:
+            result[key] = _clone_config(value)
     
     return result
+
+
+# Scalar types that YAML/JSON configs hold and that need no copying
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _clone_config(obj: Any) -> Any:
+    """
+    Deep-copy a configuration tree of dicts, lists and scalars.
+    
+    Much cheaper than copy.deepcopy for plain config data; any other value
+    type is still handed to copy.deepcopy.
+    
+    Args:
+        obj: The configuration value to copy
+        
+    Returns:
+        An independent copy of obj
+    """
+    if isinstance(obj, dict):
+        return {key: _clone_config(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_clone_config(value) for value in obj]
+    if isinstance(obj, _IMMUTABLE_TYPES):
+        return obj
+    return copy.deepcopy(obj)
@@ -1,17 +1,24 @@
 """Yahoo Finance data fetching and caching utilities."""
 
+import atexit
 import logging
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
 from .cache_index import (
     CacheIndex,
     CacheEntry,
     calculate_checksum,
+    scan_file,
     validate_cache_entry,
     DEFAULT_MAX_SIZE_MB,
 )
@@ -19,13 +26,39 @@ from .cache_index import (
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache index instance (lazy loaded)
-_cache_index: Optional[CacheIndex] = None
+# Price columns written to cached CSV files, after the Date column
+_CSV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# Serializes cache index and empty-response access when tickers are fetched
+# concurrently and against deferred-write timers; reentrant so get_cache_index
+# can be called while it is held
+_cache_index_lock = threading.RLock()
+
+# Longest time a cache hit's access-time update waits before being written, in seconds
+ACCESS_FLUSH_DELAY = 2.0
+# Pending deferred-write timers, per cache index
+_flush_timers: dict[CacheIndex, threading.Timer] = {}
+# Paths of legacy data files being indexed in the background
+_legacy_indexing: set[str] = set()
+
+# How long an empty download (e.g. a delisted ticker) is remembered, in seconds
+EMPTY_RESPONSE_TTL = 3600.0
+# Monotonic time of the last empty download, per (ticker, start, end)
+_empty_responses: dict[tuple[str, str, str], float] = {}
+
+# Number of data folders whose cache index is kept loaded
+MAX_CACHE_INDEXES = 8
+# Loaded cache indexes by normalized folder path, least recently used first
+_cache_indexes: dict[str, CacheIndex] = {}
 
 
 def get_cache_index(datas_folder: str = "datas") -> CacheIndex:
     """
-    Get or create the cache index singleton.
+    Get or create the cache index for a data folder.
+
+    Indexes for the most recently used folders are kept, so alternating
+    between folders does not reload their index files. An index dropped to
+    make room has its deferred changes written first.
 
     Args:
         datas_folder: Path to the data folder
@@ -33,10 +66,188 @@ def get_cache_index(datas_folder: str = "datas") -> CacheIndex:
     Returns:
         The CacheIndex instance
     """
-    global _cache_index
-    if _cache_index is None or str(_cache_index.datas_folder) != datas_folder:
-        _cache_index = CacheIndex(datas_folder)
-    return _cache_index
+    key = str(Path(datas_folder))
+    with _cache_index_lock:
+        cache_index = _cache_indexes.pop(key, None)
+        if cache_index is None:
+            cache_index = CacheIndex(key)
+            while len(_cache_indexes) >= MAX_CACHE_INDEXES:
+                _flush_cache_index(_cache_indexes.pop(next(iter(_cache_indexes))))
+        _cache_indexes[key] = cache_index
+        return cache_index
+
+
+def _clear_cache_indexes() -> None:
+    """Write deferred changes and drop all loaded cache indexes."""
+    with _cache_index_lock:
+        _flush_all_cache_indexes()
+        _cache_indexes.clear()
+
+
+# Lets callers (e.g. tests) drop the loaded indexes
+get_cache_index.cache_clear = _clear_cache_indexes
+
+
+def _flush_cache_index(cache_index: CacheIndex) -> None:
+    """Cancel any pending timer and write deferred changes to a cache index."""
+    with _cache_index_lock:
+        timer = _flush_timers.pop(cache_index, None)
+        if timer is not None:
+            timer.cancel()
+        try:
+            cache_index.flush()
+        except OSError as e:
+            # Runs on timer threads and at exit, where nothing could handle it; the
+            # changes stay pending and are written with the next index change
+            logger.warning(f"Could not write cache index in {cache_index.datas_folder}: {e}")
+
+
+@atexit.register
+def _flush_all_cache_indexes() -> None:
+    """Write deferred changes to every loaded cache index."""
+    with _cache_index_lock:
+        for cache_index in _cache_indexes.values():
+            _flush_cache_index(cache_index)
+
+
+def _touch_cache_entry(cache_index: CacheIndex, filename: str) -> None:
+    """
+    Record a cache hit without rewriting the index right away.
+
+    The access time is written within ACCESS_FLUSH_DELAY seconds, by the next
+    index change, or at exit, whichever comes first. Call with _cache_index_lock held.
+
+    Args:
+        cache_index: The cache index holding the entry
+        filename: The entry's filename
+    """
+    cache_index.update_last_accessed(filename, save=False)
+    if cache_index not in _flush_timers:
+        timer = threading.Timer(ACCESS_FLUSH_DELAY, _flush_cache_index, args=(cache_index,))
+        timer.daemon = True  # The atexit hook flushes whatever is still pending
+        _flush_timers[cache_index] = timer
+        timer.start()
+
+
+def _download_history(ticker: str, start: str, end: str) -> pd.DataFrame:
+    """
+    Download daily price history for one ticker.
+
+    Uses Ticker.history, the per-ticker call yf.download makes on its own worker
+    threads. yf.download itself collects results in module-level state (in the
+    pinned 0.2.x releases), so concurrent calls from fetch_multiple_tickers could
+    lose each other's data.
+
+    Errors are raised rather than logged by yfinance, so a failed request is
+    never mistaken for a ticker without data.
+
+    Args:
+        ticker: Stock ticker symbol
+        start: Start date in 'YYYY-MM-DD' format
+        end: End date in 'YYYY-MM-DD' format
+
+    Returns:
+        DataFrame of prices; empty if Yahoo Finance has no data for the
+        ticker and range (e.g. a delisted ticker)
+
+    Raises:
+        ValueError: If the request fails
+    """
+    # Imported here: yfinance is slow to import and the cache management
+    # functions in this module never need it
+    import yfinance as yf
+
+    # Raised when Yahoo Finance answers but has no prices ("possibly delisted")
+    no_data_error = getattr(getattr(yf, "exceptions", None), "YFTickerMissingError", ())
+
+    try:
+        return yf.Ticker(ticker).history(
+            start=start,
+            end=end,
+            auto_adjust=False,
+            actions=False,
+            rounding=False,
+            raise_errors=True,
+        )
+    except no_data_error:
+        return pd.DataFrame()
+    except Exception as e:
+        raise ValueError(f"Failed to fetch data for {ticker} from Yahoo Finance: {e}") from e
+
+
+def _download_to_csv(
+    ticker: str, start: str, end: str, data_filename: Path, force_download: bool = False
+) -> int:
+    """
+    Download data from Yahoo Finance and save it as a Backtrader CSV file.
+
+    A request that Yahoo Finance answered with no data is not repeated for
+    EMPTY_RESPONSE_TTL seconds, unless force_download is set. Failed requests
+    are not remembered.
+
+    Args:
+        ticker: Stock ticker symbol
+        start: Start date in 'YYYY-MM-DD' format
+        end: End date in 'YYYY-MM-DD' format
+        data_filename: Path to save the CSV file
+        force_download: If True, download even if the request recently returned no data
+
+    Returns:
+        Number of data rows written
+
+    Raises:
+        ValueError: If data fetch fails or returns empty data
+    """
+    key = (ticker, start, end)
+    if not force_download:
+        with _cache_index_lock:
+            empty_since = _empty_responses.get(key)
+            if empty_since is not None and time.monotonic() - empty_since < EMPTY_RESPONSE_TTL:
+                raise ValueError(
+                    f"Failed to fetch data for {ticker} from Yahoo Finance (cached empty response)"
+                )
+
+    data = _download_history(ticker, start, end)
+
+    with _cache_index_lock:
+        if data.empty:
+            _remember_empty_response(key)
+            raise ValueError(f"Failed to fetch data for {ticker} from Yahoo Finance")
+        _empty_responses.pop(key, None)
+
+    # Extract relevant columns, dropping rows with missing data in one NumPy pass
+    data = data[_CSV_COLUMNS]
+    data = data[~np.isnan(data.to_numpy(dtype="float64")).any(axis=1)]
+
+    # Volume comes back as float when the download had gaps; write whole counts as integers
+    volume = data["Volume"]
+    if volume.dtype.kind == "f" and (volume % 1 == 0).all():
+        data = data.astype({"Volume": "int64"})
+
+    # Format for Backtrader; dates are formatted by to_csv, using local trading dates
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index.name = "Date"
+    data = data.reset_index()
+
+    # Save to CSV in Backtrader format
+    data_filename.parent.mkdir(parents=True, exist_ok=True)
+    data.to_csv(data_filename, index=False, date_format="%Y-%m-%d")
+
+    return len(data)
+
+
+def _remember_empty_response(key: tuple[str, str, str]) -> None:
+    """
+    Record an empty download, dropping remembered ones that have expired.
+
+    Call with _cache_index_lock held.
+    """
+    now = time.monotonic()
+    expired = [k for k, since in _empty_responses.items() if now - since >= EMPTY_RESPONSE_TTL]
+    for k in expired:
+        del _empty_responses[k]
+    _empty_responses[key] = now
 
 
 def _fetch_and_save_raw(ticker: str, start: str, end: str, data_filename: Path) -> str:
@@ -55,31 +266,201 @@ def _fetch_and_save_raw(ticker: str, start: str, end: str, data_filename: Path)
     Raises:
         ValueError: If data fetch fails or returns empty data
     """
-    data = yf.download(ticker, start=start, end=end, auto_adjust=False, progress=False)
+    row_count = _download_to_csv(ticker, start, end, data_filename, force_download=True)
 
-    if data.empty:
-        raise ValueError(f"Failed to fetch data for {ticker} from Yahoo Finance")
+    logger.info(f"Saved data to {data_filename} ({row_count} rows)")
+    return str(data_filename)
 
-    # Handle multi-level columns (when multiple tickers downloaded)
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = data.columns.droplevel(1)
 
-    # Extract relevant columns
-    data = data[["Open", "High", "Low", "Close", "Adj Close", "Volume"]]
+def _index_legacy_file(ticker: str, start: str, end: str, data_filename: Path) -> None:
+    """
+    Add an existing, unindexed data file to its folder's cache index.
 
-    # Format for Backtrader
-    data.index = data.index.strftime("%Y-%m-%d")
-    data.index.name = "Date"
-    data.reset_index(inplace=True)
+    Runs on a background thread started by _find_cached_data. The file is
+    scanned outside the lock, so the entry is only added if nothing indexed
+    or rewrote the file meanwhile (e.g. a forced download of the same data).
+    The index is looked up when the entry is added, since the one loaded at
+    the start may have been dropped and its file rewritten since.
 
-    # Remove rows with missing data
-    data.dropna(inplace=True)
+    Args:
+        ticker: Stock ticker symbol
+        start: Start date in 'YYYY-MM-DD' format
+        end: End date in 'YYYY-MM-DD' format
+        data_filename: Path of the existing CSV file
+    """
+    filename = data_filename.name
+    try:
+        before = os.stat(data_filename)
+        checksum, line_count, file_size = scan_file(str(data_filename))
+        now = datetime.now().isoformat()
 
-    # Save to CSV in Backtrader format
-    data.to_csv(data_filename, index=False)
+        entry = CacheEntry(
+            ticker=ticker,
+            start_date=start,
+            end_date=end,
+            file_path=str(data_filename),
+            download_time=now,
+            last_accessed=now,
+            file_size_bytes=file_size,
+            row_count=line_count - 1,
+            checksum=checksum,
+            source="yfinance",
+        )
+        with _cache_index_lock:
+            cache_index = get_cache_index(str(data_filename.parent))
+            after = os.stat(data_filename)
+            if cache_index.get_entry(filename) is not None or (
+                (after.st_mtime_ns, after.st_size) != (before.st_mtime_ns, before.st_size)
+            ):
+                logger.debug(f"Not indexing {data_filename}: it changed while being scanned")
+                return
+            cache_index.add_entry(entry)
+    except OSError as e:
+        logger.warning(f"Failed to index legacy cached data {data_filename}: {e}")
+    finally:
+        with _cache_index_lock:
+            _legacy_indexing.discard(str(data_filename))
+
+
+def _estimate_file_size(cache_index: CacheIndex, ticker: str) -> int:
+    """
+    Estimate the size of a new data file.
 
-    logger.info(f"Saved data to {data_filename} ({len(data)} rows)")
-    return str(data_filename)
+    Uses the median size of the ticker's cached files, or the average size of
+    all cached files (from the index's running total) for a ticker not cached
+    yet. Returns 0 for an empty cache. Call with _cache_index_lock held.
+    """
+    sizes = [entry.file_size_bytes for entry in cache_index.get_entries_for_ticker(ticker)]
+    if sizes:
+        return int(statistics.median(sizes))
+    entry_count = cache_index.get_entry_count()
+    return cache_index.get_total_size_bytes() // entry_count if entry_count else 0
+
+
+def _use_cached_entry(datas_folder: str, entry: CacheEntry) -> bool:
+    """
+    Validate a cache entry and record the hit, or drop the entry if it is invalid.
+
+    The file is checked without holding the lock; the index is only changed if
+    the entry was not replaced or removed meanwhile.
+
+    Args:
+        datas_folder: Path to the data folder holding the entry
+        entry: The cache entry to use
+
+    Returns:
+        True if the entry's file can be used
+    """
+    valid = validate_cache_entry(entry)
+    filename = os.path.basename(entry.file_path)
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        current = cache_index.get_entry(filename)
+        if current is None or current.checksum != entry.checksum:
+            return False
+        if valid:
+            _touch_cache_entry(cache_index, filename)
+        else:
+            cache_index.remove_entry(filename)
+        return valid
+
+
+def _evict_for_download(datas_folder: str, ticker: str) -> None:
+    """
+    Make room in the cache for a new data file.
+
+    Evicted files are renamed under the lock, so no request can pick one up as
+    a legacy file, and deleted once it is released.
+
+    Args:
+        datas_folder: Path to the data folder
+        ticker: Stock ticker symbol about to be downloaded
+    """
+    discarded = []
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        evicted = cache_index.enforce_storage_limit(
+            _estimate_file_size(cache_index, ticker), delete_files=False
+        )
+        for file_path in evicted:
+            discarded_path = f"{file_path}.evicted-{threading.get_ident()}"
+            try:
+                os.replace(file_path, discarded_path)
+                discarded.append(discarded_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove evicted cache file {file_path}: {e}")
+    if evicted:
+        logger.info(f"Evicted {len(evicted)} cache entries to free space")
+
+    for discarded_path in discarded:
+        try:
+            os.unlink(discarded_path)
+        except OSError as e:
+            logger.warning(f"Failed to remove evicted cache file {discarded_path}: {e}")
+
+
+def _find_cached_data(
+    datas_folder: str,
+    ticker: str,
+    start: str,
+    end: str,
+    data_filename: Path,
+    force_download: bool,
+) -> Optional[str]:
+    """
+    Look up cached data for a request, making room in the cache on a miss.
+
+    The lock is held only while the index is read or changed; cached files
+    are validated (and their checksums computed) without it.
+
+    Args:
+        datas_folder: Path to the data folder
+        ticker: Stock ticker symbol
+        start: Start date in 'YYYY-MM-DD' format
+        end: End date in 'YYYY-MM-DD' format
+        data_filename: Path the requested data is saved under
+        force_download: If True, ignore cached data
+
+    Returns:
+        Path to usable cached data, or None if the data must be downloaded
+    """
+    if not force_download:
+        filename_key = data_filename.name
+
+        # Check cache index for exact match
+        with _cache_index_lock:
+            cached_entry = get_cache_index(datas_folder).get_entry(filename_key)
+
+            # Check if file exists but not in index (legacy cache)
+            if cached_entry is None and data_filename.exists():
+                logger.info(f"Found legacy cached data: {data_filename}, adding to index")
+                # Index it in the background; the file can be used as-is meanwhile. Not a
+                # daemon thread, so a scan in progress at exit still gets recorded
+                if str(data_filename) not in _legacy_indexing:
+                    _legacy_indexing.add(str(data_filename))
+                    threading.Thread(
+                        target=_index_legacy_file, args=(ticker, start, end, data_filename)
+                    ).start()
+                return str(data_filename)
+
+        if cached_entry is not None:
+            if _use_cached_entry(datas_folder, cached_entry):
+                logger.info(f"Using cached data: {data_filename}")
+                return str(data_filename)
+            logger.warning(f"Cache validation failed for {filename_key}, re-fetching")
+
+        # Check for a covering entry (larger date range that includes this request)
+        with _cache_index_lock:
+            covering_entry = get_cache_index(datas_folder).find_covering_entry(ticker, start, end)
+        if covering_entry is not None and _use_cached_entry(datas_folder, covering_entry):
+            logger.info(f"Using covering cache: {covering_entry.file_path} for {ticker} {start} to {end}")
+            return covering_entry.file_path
+
+    # Enforce storage limit before downloading new data, leaving room for it
+    _evict_for_download(datas_folder, ticker)
+    return None
 
 
 def fetch_and_save_data(
@@ -109,12 +490,8 @@ def fetch_and_save_data(
     Raises:
         ValueError: If data fetch fails or returns empty data
     """
-    # Ensure data folder exists
-    data_path = Path(datas_folder)
-    data_path.mkdir(parents=True, exist_ok=True)
-
-    # Generate filename
-    data_filename = data_path / f"{ticker}-{start}-to-{end}.csv"
+    # Generate filename (the folder is created when data is first written)
+    data_filename = Path(datas_folder) / f"{ticker}-{start}-to-{end}.csv"
 
     # If cache is disabled via parameter, always download fresh
     if not use_cache:
@@ -122,93 +499,24 @@ def fetch_and_save_data(
         return _fetch_and_save_raw(ticker, start, end, data_filename)
 
     # Get or create cache index
-    cache_index = get_cache_index(datas_folder)
-    cache_index.max_size_mb = max_cache_size_mb
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        cache_index.max_size_mb = max_cache_size_mb
 
     # If cache is disabled via .cache_index.json settings, always download fresh
     if not cache_index.enabled:
         logger.info(f"Cache disabled via settings, fetching fresh data for {ticker} from {start} to {end}")
         return _fetch_and_save_raw(ticker, start, end, data_filename)
 
-    filename_key = data_filename.name
-
-    # Check cache index for exact match
-    cached_entry = cache_index.get_entry(filename_key)
-
-    if cached_entry and not force_download:
-        # Validate cached entry
-        if validate_cache_entry(cached_entry):
-            logger.info(f"Using cached data: {data_filename}")
-            cache_index.update_last_accessed(filename_key)
-            return str(data_filename)
-        else:
-            # Invalid cache entry, remove it
-            logger.warning(f"Cache validation failed for {filename_key}, re-fetching")
-            cache_index.remove_entry(filename_key)
-
-    # Check if file exists but not in index (legacy cache)
-    if data_filename.exists() and not force_download and not cached_entry:
-        logger.info(f"Found legacy cached data: {data_filename}, adding to index")
-        # Add to index
-        row_count = sum(1 for _ in open(data_filename)) - 1
-        checksum = calculate_checksum(str(data_filename))
-        file_size = data_filename.stat().st_size
-        now = datetime.now().isoformat()
-
-        entry = CacheEntry(
-            ticker=ticker,
-            start_date=start,
-            end_date=end,
-            file_path=str(data_filename),
-            download_time=now,
-            last_accessed=now,
-            file_size_bytes=file_size,
-            row_count=row_count,
-            checksum=checksum,
-            source="yfinance",
-        )
-        cache_index.add_entry(entry)
-        return str(data_filename)
-
-    # Check for a covering entry (larger date range that includes this request)
-    covering_entry = cache_index.find_covering_entry(ticker, start, end)
-    if covering_entry and not force_download:
-        if validate_cache_entry(covering_entry):
-            logger.info(f"Using covering cache: {covering_entry.file_path} for {ticker} {start} to {end}")
-            cache_index.update_last_accessed(Path(covering_entry.file_path).name)
-            return covering_entry.file_path
-        else:
-            cache_index.remove_entry(Path(covering_entry.file_path).name)
-
-    # Enforce storage limit before downloading new data
-    evicted = cache_index.enforce_storage_limit()
-    if evicted:
-        logger.info(f"Evicted {len(evicted)} cache entries to free space")
+    cached_path = _find_cached_data(
+        datas_folder, ticker, start, end, data_filename, force_download
+    )
+    if cached_path is not None:
+        return cached_path
 
     # Fetch the data
     logger.info(f"Fetching data for {ticker} from {start} to {end}")
-    data = yf.download(ticker, start=start, end=end, auto_adjust=False, progress=False)
-    
-    if data.empty:
-        raise ValueError(f"Failed to fetch data for {ticker} from Yahoo Finance")
-    
-    # Handle multi-level columns (when multiple tickers downloaded)
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = data.columns.droplevel(1)
-    
-    # Extract relevant columns
-    data = data[['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']]
-    
-    # Format for Backtrader
-    data.index = data.index.strftime('%Y-%m-%d')
-    data.index.name = 'Date'
-    data.reset_index(inplace=True)
-    
-    # Remove rows with missing data
-    data.dropna(inplace=True)
-    
-    # Save to CSV in Backtrader format
-    data.to_csv(data_filename, index=False)
+    row_count = _download_to_csv(ticker, start, end, data_filename, force_download)
 
     # Calculate checksum and add to cache index
     checksum = calculate_checksum(str(data_filename))
@@ -223,13 +531,15 @@ def fetch_and_save_data(
         download_time=now,
         last_accessed=now,
         file_size_bytes=file_size,
-        row_count=len(data),
+        row_count=row_count,
         checksum=checksum,
         source="yfinance",
     )
-    cache_index.add_entry(entry)
+    # Look the index up again: it may have been dropped to make room during the download
+    with _cache_index_lock:
+        get_cache_index(datas_folder).add_entry(entry)
 
-    logger.info(f"Saved data to {data_filename} ({len(data)} rows)")
+    logger.info(f"Saved data to {data_filename} ({row_count} rows)")
     return str(data_filename)
 
 
@@ -241,9 +551,10 @@ def fetch_multiple_tickers(
     force_download: bool = False,
     max_cache_size_mb: int = DEFAULT_MAX_SIZE_MB,
     use_cache: bool = True,
+    threads: Optional[int] = None,
 ) -> dict[str, str]:
     """
-    Fetch data for multiple tickers.
+    Fetch data for multiple tickers concurrently.
 
     Args:
         tickers: List of ticker symbols
@@ -253,20 +564,32 @@ def fetch_multiple_tickers(
         force_download: If True, re-download even if files exist
         max_cache_size_mb: Maximum cache size in MB (0 for unlimited)
         use_cache: If False, always download fresh data and skip cache indexing
+        threads: Maximum concurrent downloads (default: one per ticker, up to 32)
 
     Returns:
-        Dictionary mapping ticker to CSV file path
+        Dictionary mapping ticker to CSV file path, in the order of tickers
     """
-    results = {}
-    for ticker in tickers:
-        try:
-            results[ticker] = fetch_and_save_data(
-                ticker, start, end, datas_folder, force_download, max_cache_size_mb, use_cache
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch data for {ticker}: {e}")
-
-    return results
+    unique_tickers = list(dict.fromkeys(tickers))  # Never fetch one file twice at once
+    if not unique_tickers:
+        return {}
+
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=threads or min(32, len(unique_tickers))) as executor:
+        futures = {
+            executor.submit(
+                fetch_and_save_data,
+                ticker, start, end, datas_folder, force_download, max_cache_size_mb, use_cache,
+            ): ticker
+            for ticker in unique_tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                fetched[ticker] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to fetch data for {ticker}: {e}")
+
+    return {ticker: fetched[ticker] for ticker in unique_tickers if ticker in fetched}
 
 
 # Cache management functions
@@ -282,8 +605,15 @@ def list_cached_data(datas_folder: str = "datas") -> list[dict]:
     Returns:
         List of cache entry dictionaries
     """
-    cache_index = get_cache_index(datas_folder)
-    return [entry.to_dict() for entry in cache_index.list_entries()]
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        return [entry.to_dict() for entry in cache_index.list_entries()]
+
+
+def clear_negative_cache() -> None:
+    """Forget tickers remembered as returning no data, so they are downloaded again."""
+    with _cache_index_lock:
+        _empty_responses.clear()
 
 
 def clear_cache(datas_folder: str = "datas", ticker: Optional[str] = None) -> int:
@@ -297,8 +627,9 @@ def clear_cache(datas_folder: str = "datas", ticker: Optional[str] = None) -> in
     Returns:
         Number of entries removed
     """
-    cache_index = get_cache_index(datas_folder)
-    return cache_index.clear(ticker)
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        return cache_index.clear(ticker)
 
 
 def get_cache_stats(datas_folder: str = "datas") -> dict:
@@ -311,5 +642,6 @@ def get_cache_stats(datas_folder: str = "datas") -> dict:
     Returns:
         Dictionary with cache stats
     """
-    cache_index = get_cache_index(datas_folder)
-    return cache_index.get_stats()
+    with _cache_index_lock:
+        cache_index = get_cache_index(datas_folder)
+        return cache_index.get_stats()